@@ -7,33 +7,45 @@ Command-line interface for context compression operations
 import sys
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from .core import ContextProcessor, CompressionLevel
+
+# Message prefixes for the print_* helpers
+_OK = "✅ "
+_ERR = "❌ "
+_INFO = "ℹ️  "
+_WARN = "⚠️  "
+
+# %-templates for the per-platform loop in `compress all`
+_PLATFORM_OK_FMT = "%s: %s (Compressed %.1f%%)"
+_PLATFORM_ERR_FMT = "%s: %s"
 
 
 def print_success(message: str):
     """Print success message (แสดงข้อความสำเร็จ)"""
-    print(f"✅ {message}")
+    sys.stdout.write(_OK + message + "\n")
 
 
 def print_error(message: str):
     """Print error message (แสดงข้อความ error)"""
-    print(f"❌ {message}", file=sys.stderr)
+    sys.stderr.write(_ERR + message + "\n")
 
 
 def print_info(message: str):
     """Print info message (แสดงข้อความ info)"""
-    print(f"ℹ️  {message}")
+    sys.stdout.write(_INFO + message + "\n")
 
 
 def print_warning(message: str):
     """Print warning message (แสดงข้อความเตือน)"""
-    print(f"⚠️  {message}")
+    sys.stdout.write(_WARN + message + "\n")
 
 
 def compress_command(args):
     """Handle compress command (จัดการคำสั่ง compress)"""
+    # Deferred so --help and argument errors skip loading the core pipeline
+    from .core import ContextProcessor
+
     try:
         processor = ContextProcessor(
             config_dir=args.config_dir,
@@ -53,13 +65,13 @@ def compress_command(args):
 
             for result in results:
                 if result.success:
-                    ratio = result.compression_result.compression_ratio
-                    print_success(
-                        f"{result.platform_id}: {result.output_file} "
-                        f"(Compressed {ratio:.1f}%)"
-                    )
+                    print_success(_PLATFORM_OK_FMT % (
+                        result.platform_id,
+                        result.output_file,
+                        result.compression_result.compression_ratio
+                    ))
                 else:
-                    print_error(f"{result.platform_id}: {result.error_message}")
+                    print_error(_PLATFORM_ERR_FMT % (result.platform_id, result.error_message))
 
         else:
             print_info(f"Processing platform: {args.platform}")
@@ -91,30 +103,32 @@ def compress_command(args):
 
 def list_command(args):
     """Handle list command (จัดการคำสั่ง list)"""
+    from .core import ContextProcessor
+
     try:
         processor = ContextProcessor(
             config_dir=args.config_dir,
             template_file=args.template
         )
 
-        platforms = processor.get_platform_list()
+        platforms = processor.get_platform_list_sorted()
 
         if not platforms:
             print_warning("No platforms configured")
             return 0
 
-        print("\n" + "="*60)
-        print("Available Platforms")
-        print("="*60 + "\n")
+        lines = ["", "="*60, "Available Platforms", "="*60 + "\n"]
 
-        for platform_id in sorted(platforms):
+        for platform_id in platforms:
             config = processor.get_platform_config(platform_id)
-            print(f"🔹 {platform_id}")
-            print(f"   Name: {config.name}")
-            print(f"   Target: {config.target_file}")
-            print(f"   Compression: {config.compression_default}")
-            print(f"   Description: {config.description}")
-            print()
+            lines.append(f"🔹 {platform_id}")
+            lines.append(f"   Name: {config.name}")
+            lines.append(f"   Target: {config.target_file}")
+            lines.append(f"   Compression: {config.compression_default}")
+            lines.append(f"   Description: {config.description}")
+            lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print_error(f"Error: {str(e)}")
@@ -125,6 +139,8 @@ def list_command(args):
 
 def stats_command(args):
     """Handle stats command (จัดการคำสั่ง stats)"""
+    from .core import ContextProcessor
+
     try:
         processor = ContextProcessor(
             config_dir=args.config_dir,
@@ -133,19 +149,20 @@ def stats_command(args):
 
         stats = processor.get_stats()
 
-        print("\n" + "="*60)
-        print("System Statistics")
-        print("="*60 + "\n")
-
-        print(f"📁 Template file: {stats['template_file']}")
-        print(f"📏 Template size: {stats['template_size']:,} bytes")
-        print(f"📦 Total platforms: {stats['loader_stats']['total_platforms']}")
-        print(f"📂 Config directory: {stats['loader_stats']['config_directory']}")
-        print()
-
-        print("🔧 Compression levels by platform:")
-        for platform_id, level in sorted(stats['loader_stats']['compression_levels'].items()):
-            print(f"   {platform_id}: {level}")
+        lines = [
+            "", "="*60, "System Statistics", "="*60 + "\n",
+            f"📁 Template file: {stats['template_file']}",
+            f"📏 Template size: {stats['template_size']:,} bytes",
+            f"📦 Total platforms: {stats['loader_stats']['total_platforms']}",
+            f"📂 Config directory: {stats['loader_stats']['config_directory']}",
+            "",
+            "🔧 Compression levels by platform:",
+        ]
+        compression_levels = stats['loader_stats']['compression_levels']
+        for platform_id in processor.get_platform_list_sorted():
+            lines.append(f"   {platform_id}: {compression_levels[platform_id]}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     except Exception as e:
         print_error(f"Error: {str(e)}")
@@ -154,6 +171,80 @@ def stats_command(args):
     return 0
 
 
+def _build_compress(subparsers, platform_choices: Optional[List[str]] = None):
+    """Register compress subcommand"""
+    compress_parser = subparsers.add_parser('compress', help='Compress context for platform(s)')
+    compress_parser.add_argument(
+        'platform',
+        choices=platform_choices,
+        metavar='platform',
+        help='Platform ID or "all" for all platforms'
+    )
+    compress_parser.add_argument(
+        '-l', '--level',
+        choices=['basic', 'aggressive', 'selective'],
+        help='Override compression level'
+    )
+    compress_parser.set_defaults(func=compress_command)
+
+
+def _build_list(subparsers):
+    """Register list subcommand"""
+    list_parser = subparsers.add_parser('list', help='List available platforms')
+    list_parser.set_defaults(func=list_command)
+
+
+def _build_stats(subparsers):
+    """Register stats subcommand"""
+    stats_parser = subparsers.add_parser('stats', help='Show system statistics')
+    stats_parser.set_defaults(func=stats_command)
+
+
+_SUBPARSER_BUILDERS = {
+    'compress': _build_compress,
+    'list': _build_list,
+    'stats': _build_stats,
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_VALUE_OPTIONS = ('--config-dir', '--template')
+_DEFAULT_CONFIG_DIR = './platform_configs'
+
+
+def _peek_command(argv) -> Optional[str]:
+    """Return the subcommand token from argv without full parsing"""
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg in _GLOBAL_VALUE_OPTIONS:
+            skip_next = True
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+def _peek_option(argv, option: str, default: str) -> str:
+    """Return a global option's value from argv without full parsing"""
+    prefix = option + '='
+    for i, arg in enumerate(argv):
+        if arg == option and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+
+def _platform_choices(argv) -> Optional[List[str]]:
+    """Platform IDs + "all" from config filenames, or None to skip argparse validation"""
+    from .config.platform_loader import PlatformConfigLoader
+
+    platform_ids = PlatformConfigLoader.scan_platform_ids(
+        _peek_option(argv, '--config-dir', _DEFAULT_CONFIG_DIR)
+    )
+    return platform_ids + ['all'] if platform_ids else None
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -172,8 +263,8 @@ Examples:
     # Global arguments
     parser.add_argument(
         '--config-dir',
-        default='./platform_configs',
-        help='Platform configuration directory (default: ./platform_configs)'
+        default=_DEFAULT_CONFIG_DIR,
+        help=f'Platform configuration directory (default: {_DEFAULT_CONFIG_DIR})'
     )
     parser.add_argument(
         '--template',
@@ -183,23 +274,18 @@ Examples:
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
-    # Compress command
-    compress_parser = subparsers.add_parser('compress', help='Compress context for platform(s)')
-    compress_parser.add_argument(
-        'platform',
-        help='Platform ID or "all" for all platforms'
-    )
-    compress_parser.add_argument(
-        '-l', '--level',
-        choices=['basic', 'aggressive', 'selective'],
-        help='Override compression level'
-    )
-
-    # List command
-    list_parser = subparsers.add_parser('list', help='List available platforms')
-
-    # Stats command
-    stats_parser = subparsers.add_parser('stats', help='Show system statistics')
+    # Only build the subparser that will actually run; help/unknown needs all
+    argv = sys.argv[1:]
+    command = _peek_command(argv)
+    builder = _SUBPARSER_BUILDERS.get(command)
+    if command == 'compress':
+        # Invalid platforms fail in argparse before the core pipeline loads
+        builder(subparsers, _platform_choices(argv))
+    elif builder is not None:
+        builder(subparsers)
+    else:
+        for builder in _SUBPARSER_BUILDERS.values():
+            builder(subparsers)
 
     args = parser.parse_args()
 
@@ -207,15 +293,8 @@ Examples:
         parser.print_help()
         return 1
 
-    # Execute command
-    if args.command == 'compress':
-        return compress_command(args)
-    elif args.command == 'list':
-        return list_command(args)
-    elif args.command == 'stats':
-        return stats_command(args)
-
-    return 0
+    # Execute command (handler bound by the subparser's set_defaults)
+    return args.func(args)
 
 
 if __name__ == '__main__':
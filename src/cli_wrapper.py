@@ -4,16 +4,86 @@ Context Compression System - CLI Wrapper Class
 Manual Installation CLI Tool for generating DEPLOYABLE files
 """
 
+import codecs
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+
+from .core.config_loader import ConfigLoader
+from .compress_full_pipeline import compress_full_pipeline, validate_source_file
+
+# Source file extensions accepted by compress/validate
+_SUPPORTED_EXTS = frozenset({'.md', '.txt'})
+
+# Files with fewer characters than this get a "very short" validation warning
+_SHORT_FILE_CHARS = 100
+
+# validate() decodes at most this many leading bytes of the source
+_PREVIEW_BYTES = 4096
+
+# Static interactive-mode text, built once at import instead of per menu round
+_RULE = "=" * 60
+
+_MAIN_MENU = f"""
+{_RULE}
+🚀 Context Compression System - Interactive Mode
+{_RULE}
+
+Please select an action:
+
+1. 📋 List available platforms
+2. ✅ Validate source file
+3. 🗜️  Compress context
+4. 🚀 Deploy to all platforms
+5. 📊 System information
+6. ⚙️  Settings
+7. ❌ Exit"""
+
+_LIST_PLATFORMS_BANNER = f"""
+{_RULE}
+📋 Available Platforms
+{_RULE}"""
+
+_SETTINGS_MENU = f"""
+{_RULE}
+⚙️  Settings
+{_RULE}
+📁 Current config directory: {{config_dir}}
+🔧 Available settings:
+  1. Change config directory
+  2. Show advanced help
+  3. Back to main menu"""
+
+_HELP_TEXT = """
+🤖 Context Compression System CLI - Manual Installation Tool
+
+📋 Available Commands:
+  compress <platform> --source <file>     Compress for specific platform
+  compress all --source <file>            Deploy to all platforms
+  list                                   List available platforms
+  validate <platform> --source <file>   Validate file and platform
+  help                                   Show this help message
+
+🌐 Supported Platforms:
+  claude, qwen, gemini, openai, cursor, codebuff
+
+📁 Output Location:
+  Files are saved to: ./outputs/[platform]/DEPLOYABLE_[platform].md
+  Manual installation required - see output for instructions
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+💡 Usage Examples:
+  python -m src.cli_wrapper compress claude --source ./myfile.md
+  python -m src.cli_wrapper compress all --source ./myfile.md
+  python -m src.cli_wrapper list
+  python -m src.cli_wrapper validate claude --source ./myfile.md
 
-from src.core.config_loader import ConfigLoader
-from src.compress_full_pipeline import compress_full_pipeline, validate_source_file
+🔧 Key Features:
+  ✅ Manual Installation Only (no automatic AI config changes)
+  ✅ User Control (you decide where to install)
+  ✅ Clear Instructions (step-by-step guidance)
+  ✅ Comprehensive Validation (file format, size, platform support)
+        """
 
 
 class ContextCLI:
@@ -26,17 +96,33 @@ class ContextCLI:
     - User control 100%
     """
 
-    def __init__(self, config_dir: str = "./platform_configs"):
-        """Initialize CLI with configuration directory"""
+    def __init__(self, config_dir: str = "./platform_configs", debug: bool = False):
+        """Initialize CLI with configuration directory (debug: keep layerN_*.txt intermediates)"""
         self.config_dir = config_dir
+        self.debug = debug
         self.config_loader = ConfigLoader(config_dir)
+        self._platform_list_cache: Optional[List[str]] = None
+        self._platform_set: Optional[frozenset] = None
+        self._platforms_sorted: Tuple[str, ...] = ()
+        self._platform_cfg_cache: Dict[str, Dict] = {}
+        # Interactive menu dispatch table; '7' (exit) is handled in interactive_mode
+        self._menu_actions: Dict[str, Callable[[], None]] = {
+            '1': self._menu_list_platforms,
+            '2': self._menu_validate_file,
+            '3': self._menu_compress_context,
+            '4': self._menu_deploy_all,
+            '5': self._menu_system_info,
+            '6': self._menu_settings,
+        }
 
     def _setup_logger(self):
         """Setup logging for CLI operations"""
         # Simple logging - just return for now
         return None
 
-    def compress(self, platform: str, source: str, output_dir: str = None) -> bool:
+    def compress(self, platform: str, source: str, output_dir: str = None,
+                 source_path: Optional[Path] = None,
+                 source_path_abs: Optional[Path] = None) -> bool:
         """
         Compress file for specific platform - Manual Installation
 
@@ -51,85 +137,36 @@ class ContextCLI:
             platform: "claude", "qwen", "gemini", "openai", "cursor", "codebuff"
             source: path ไฟล์ต้นทาง (.md, .txt)
             output_dir: directory สำหรับ output (default: outputs)
+            source_path: Optional pre-built Path for source (skips rebuilding it)
+            source_path_abs: Optional already-validated absolute source path
 
         Returns:
             bool: True=success, False=failure
         """
         try:
-            # 1. Validation
-            if not os.path.exists(source):
-                raise FileNotFoundError(f"Source file not found: {source}")
-
+            # 1. Validation (existence is checked by validate_source_file below)
             # Validate platform exists
-            available_platforms = self.get_platform_list()
-            if platform not in available_platforms:
-                raise ValueError(f"Platform not supported: {platform}. Available: {', '.join(available_platforms)}")
+            if platform not in self._get_platform_set():
+                raise ValueError(f"Platform not supported: {platform}. Available: {', '.join(self.get_platform_list())}")
 
             # 2. Validate source file format
-            source_path = Path(source)
-            if source_path.suffix.lower() not in ['.md', '.txt']:
+            if source_path is None:
+                source_path = Path(source)
+            if source_path.suffix.lower() not in _SUPPORTED_EXTS:
                 raise ValueError(f"Unsupported file format: {source_path.suffix}. Supported: .md, .txt")
 
             # 3. Set output directory
-            if output_dir is None:
-                output_dir = Path("outputs")
-            else:
-                output_dir = Path(output_dir)
+            output_dir = Path(output_dir) if output_dir else Path("outputs")
 
             # 4. Process using existing pipeline
             print(f"🔄 Compressing {source} for {platform}...")
 
-            # Run compression pipeline
-            source_path_abs = validate_source_file(source_path)
-            pipeline_stats = compress_full_pipeline(
-                source_path=source_path_abs,
-                output_dir=output_dir
-            )
+            if source_path_abs is None:
+                source_path_abs = validate_source_file(source_path)
+            pipeline_stats = self._run_pipeline_once(source_path_abs, output_dir)
 
-            # 5. Check if compression was successful
-            if not pipeline_stats.get('target_met', False):
-                print(f"⚠️  Warning: Compression target not met, but continuing...")
-
-            # 6. Find the generated DEPLOYABLE file
-            platform_deployer = pipeline_stats.get('deployment', {}).get('platform_files', [])
-            target_file = None
-
-            for platform_info in platform_deployer:
-                if platform_info['platform'].lower() == platform.lower():
-                    target_file = platform_info.get('output_file')
-                    break
-
-            if target_file:
-                output_file_path = output_dir / target_file
-                print(f"✅ Compression completed!")
-                print(f"📁 Output file: {output_file_path}")
-                print(f"📊 Final size: {pipeline_stats['final_size']:,} chars")
-                print(f"📈 Total compression: {pipeline_stats['total_ratio']:.1f}%")
-
-                # Manual installation instructions
-                print(f"\n📋 Manual Installation Instructions:")
-                print(f"1. Copy: {output_file_path}")
-                print(f"2. Paste to: Your AI platform's config directory")
-
-                # Platform-specific instructions
-                platform_config = self.config_loader.get_platform(platform)
-                target_filename = platform_config.get('target_file', 'CLAUDE.md')
-
-                if platform.lower() == 'claude':
-                    print(f"3. For Claude Code: ~/.claude/{target_filename}")
-                elif platform.lower() == 'cursor':
-                    print(f"3. For Cursor: ~/.cursor/{target_filename}")
-                elif platform.lower() == 'openai':
-                    print(f"3. For ChatGPT: ~/chatgpt/{target_filename}")
-                else:
-                    print(f"3. For {platform_config.get('name', platform)}: [platform config directory]/{target_filename}")
-
-                print(f"4. Restart your AI platform to load new context")
-
-                return True
-            else:
-                print(f"❌ Error: DEPLOYABLE file for {platform} not found")
-                return False
+            # 5. Report the platform's DEPLOYABLE file
+            return self._report_platform_result(platform, pipeline_stats, output_dir)
 
         except FileNotFoundError as e:
             print(f"❌ Error: {str(e)}")
@@ -141,6 +178,86 @@ class ContextCLI:
             print(f"❌ Unexpected error: {str(e)}")
             return False
 
+    def _run_pipeline_once(self, source_path_abs: Path, output_dir: Path) -> Dict:
+        """
+        Run the full compression pipeline a single time
+
+        The pipeline already emits DEPLOYABLE files for every configured
+        platform, so callers fan out over the returned stats instead of
+        re-running it per platform.
+        """
+        pipeline_stats = compress_full_pipeline(
+            source_path=source_path_abs,
+            output_dir=output_dir,
+            write_intermediates=self.debug
+        )
+
+        if not pipeline_stats.get('target_met', False):
+            print(f"⚠️  Warning: Compression target not met, but continuing...")
+
+        return pipeline_stats
+
+    def _report_platform_result(self, platform: str, pipeline_stats: Dict, output_dir: Path,
+                                lines: Optional[List[str]] = None) -> bool:
+        """
+        Locate a platform's DEPLOYABLE file in pipeline stats and print install steps
+
+        Args:
+            lines: Optional buffer to append report (or error) lines to instead of printing
+
+        Returns:
+            bool: True if the platform's file was generated
+        """
+        platform_files = pipeline_stats.get('deployment', {}).get('platform_files', [])
+        target_file = None
+
+        for platform_info in platform_files:
+            if platform_info['platform'].lower() == platform.lower():
+                target_file = platform_info.get('output_file')
+                break
+
+        if not target_file:
+            error = f"❌ Error: DEPLOYABLE file for {platform} not found"
+            if lines is None:
+                print(error)
+            else:
+                lines.append(error)
+            return False
+
+        output_file_path = output_dir / target_file
+        report = [
+            f"✅ Compression completed!",
+            f"📁 Output file: {output_file_path}",
+            f"📊 Final size: {pipeline_stats['final_size']:,} chars",
+            f"📈 Total compression: {pipeline_stats['total_ratio']:.1f}%",
+            # Manual installation instructions
+            f"\n📋 Manual Installation Instructions:",
+            f"1. Copy: {output_file_path}",
+            f"2. Paste to: Your AI platform's config directory",
+        ]
+
+        # Platform-specific instructions
+        platform_config = self.get_platform_config(platform)
+        target_filename = platform_config.get('target_file', 'CLAUDE.md')
+
+        if platform.lower() == 'claude':
+            report.append(f"3. For Claude Code: ~/.claude/{target_filename}")
+        elif platform.lower() == 'cursor':
+            report.append(f"3. For Cursor: ~/.cursor/{target_filename}")
+        elif platform.lower() == 'openai':
+            report.append(f"3. For ChatGPT: ~/chatgpt/{target_filename}")
+        else:
+            report.append(f"3. For {platform_config.get('name', platform)}: [platform config directory]/{target_filename}")
+
+        report.append(f"4. Restart your AI platform to load new context")
+
+        if lines is None:
+            sys.stdout.write("\n".join(report) + "\n")
+        else:
+            lines.extend(report)
+
+        return True
+
     def list_platforms(self) -> List[str]:
         """
         List all available platforms with detailed information
@@ -148,33 +265,60 @@ class ContextCLI:
         Returns:
             List[str]: List of platform IDs
         """
-        platforms = self.config_loader.get_platform_keys()
+        platforms = self.get_platform_list()
 
-        print("\n" + "="*60)
-        print("🌐 Available Platforms (6 supported)")
-        print("="*60 + "\n")
+        blocks = ["\n" + "="*60 + "\n🌐 Available Platforms (6 supported)\n" + "="*60 + "\n"]
 
-        for platform_id in sorted(platforms):
+        for platform_id in self.get_platform_list_sorted():
             try:
-                config = self.config_loader.get_platform(platform_id)
-                print(f"🔹 {platform_id}")
-                print(f"   Name: {config.get('name', 'Unknown')}")
-                print(f"   Target: {config.get('target_file', 'Unknown')}")
-                print(f"   Compression: {config.get('compression_default', 'Unknown')}")
-                print(f"   Description: {config.get('description', 'No description')}")
-                print()
+                config = self.get_platform_config(platform_id)
+                blocks.append("\n".join((
+                    f"🔹 {platform_id}",
+                    f"   Name: {config.get('name', 'Unknown')}",
+                    f"   Target: {config.get('target_file', 'Unknown')}",
+                    f"   Compression: {config.get('compression_default', 'Unknown')}",
+                    f"   Description: {config.get('description', 'No description')}",
+                    "",
+                )))
             except Exception as e:
-                print(f"❌ Error loading {platform_id}: {str(e)}")
+                blocks.append(f"❌ Error loading {platform_id}: {str(e)}")
 
+        sys.stdout.write("\n".join(blocks) + "\n")
         return platforms
 
     def get_platform_list(self) -> List[str]:
-        """Get list of available platform IDs"""
-        return self.config_loader.get_platform_keys()
+        """Get list of available platform IDs (cached until config dir changes)"""
+        if self._platform_list_cache is None:
+            self._platform_list_cache = self.config_loader.get_platform_keys()
+            self._platforms_sorted = tuple(sorted(self._platform_list_cache))
+        return self._platform_list_cache
+
+    def _get_platform_set(self) -> frozenset:
+        """Platform IDs as a set for membership checks (built once per cache fill)"""
+        if self._platform_set is None:
+            self._platform_set = frozenset(self.get_platform_list())
+        return self._platform_set
+
+    def get_platform_list_sorted(self) -> Tuple[str, ...]:
+        """Get platform IDs sorted for display (sorted once per cache fill)"""
+        self.get_platform_list()
+        return self._platforms_sorted
 
     def get_platform_config(self, platform_id: str) -> Dict:
-        """Get platform configuration by ID"""
-        return self.config_loader.get_platform(platform_id)
+        """Get platform configuration by ID (cached until config dir changes)"""
+        config = self._platform_cfg_cache.get(platform_id)
+        if config is None:
+            config = self.config_loader.get_platform(platform_id)
+            if config is not None:
+                self._platform_cfg_cache[platform_id] = config
+        return config
+
+    def _invalidate_platform_cache(self):
+        """Drop cached platform data after the config loader is replaced"""
+        self._platform_list_cache = None
+        self._platform_set = None
+        self._platforms_sorted = ()
+        self._platform_cfg_cache = {}
 
     def validate(self, platform: str, source: str) -> Dict:
         """
@@ -195,27 +339,27 @@ class ContextCLI:
             "file_info": {}
         }
 
-        # File existence check
-        if not os.path.exists(source):
+        # File existence check (single stat, size reused below)
+        try:
+            file_size = os.stat(source).st_size
+        except OSError:
             results["errors"].append(f"File not found: {source}")
             results["valid"] = False
             return results
 
         # File format validation
         source_path = Path(source)
-        if source_path.suffix.lower() not in ['.md', '.txt']:
+        if source_path.suffix.lower() not in _SUPPORTED_EXTS:
             results["errors"].append(f"File must be .md or .txt format (found: {source_path.suffix})")
             results["valid"] = False
 
         # Platform validation
-        available_platforms = self.get_platform_list()
-        if platform not in available_platforms:
-            results["errors"].append(f"Platform not supported: {platform}. Available: {', '.join(available_platforms)}")
+        if platform not in self._get_platform_set():
+            results["errors"].append(f"Platform not supported: {platform}. Available: {', '.join(self.get_platform_list())}")
             results["valid"] = False
 
         # File size analysis
         try:
-            file_size = source_path.stat().st_size
             results["file_info"]["size"] = file_size
             results["file_info"]["size_readable"] = f"{file_size:,} bytes"
 
@@ -224,11 +368,16 @@ class ContextCLI:
             elif file_size < 1000:
                 results["warnings"].append("Very small file detected (<1KB) - minimal compression expected")
 
-            # Content preview
-            with open(source_path, 'r', encoding='utf-8') as f:
-                preview = f.read(500)
-                if len(preview) < 100:
-                    results["warnings"].append("File seems very short - may not have enough content for compression")
+            # Content preview: a bounded prefix, strictly decoded so invalid UTF-8
+            # is reported whatever the file size. Only a multibyte char cut off by
+            # the prefix limit (not by EOF) is left undecoded instead of raising.
+            with open(source_path, 'rb') as f:
+                head = f.read(_PREVIEW_BYTES)
+            preview = codecs.getincrementaldecoder('utf-8')().decode(
+                head, final=len(head) < _PREVIEW_BYTES
+            )
+            if len(preview) < _SHORT_FILE_CHARS:
+                results["warnings"].append("File seems very short - may not have enough content for compression")
 
         except Exception as e:
             results["errors"].append(f"Cannot read file: {str(e)}")
@@ -265,9 +414,33 @@ class ContextCLI:
         print(f"🚀 Deploying to all {len(platforms)} platforms...")
         print("="*60)
 
+        # Run the pipeline once; it generates every platform's file in one pass
+        pipeline_stats = None
+        output_path = Path(output_dir) if output_dir else Path("outputs")
+        try:
+            source_path = Path(source)
+            if source_path.suffix.lower() not in _SUPPORTED_EXTS:
+                raise ValueError(f"Unsupported file format: {source_path.suffix}. Supported: .md, .txt")
+
+            print(f"🔄 Compressing {source} for all platforms...")
+            source_path_abs = validate_source_file(source_path)
+            pipeline_stats = self._run_pipeline_once(source_path_abs, output_path)
+
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ Error: {str(e)}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {str(e)}")
+
+        # Each platform's progress + result is one buffered write, flushed as soon
+        # as it is done so long runs still show live per-platform progress
         for platform in platforms:
-            print(f"\n🔄 Processing {platform}...")
-            success = self.compress(platform, source, output_dir)
+            lines = [f"\n🔄 Processing {platform}..."]
+            success = (
+                pipeline_stats is not None
+                and self._report_platform_result(platform, pipeline_stats, output_path, lines)
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
 
             results["details"][platform] = success
             if success:
@@ -276,47 +449,22 @@ class ContextCLI:
                 results["failed"] += 1
 
         # Summary
-        print("\n" + "="*60)
-        print("📊 Deployment Summary")
-        print("="*60)
-        print(f"✅ Successful: {results['successful']}")
-        print(f"❌ Failed: {results['failed']}")
-        print(f"📈 Success Rate: {results['successful']/results['total']*100:.1f}%")
+        summary = [
+            "\n" + "="*60,
+            "📊 Deployment Summary",
+            "="*60,
+            f"✅ Successful: {results['successful']}",
+            f"❌ Failed: {results['failed']}",
+            f"📈 Success Rate: {results['successful']/results['total']*100:.1f}%",
+        ]
+        sys.stdout.write("\n".join(summary) + "\n")
+        sys.stdout.flush()
 
         return results
 
     def show_help(self):
         """Display help information"""
-        help_text = """
-🤖 Context Compression System CLI - Manual Installation Tool
-
-📋 Available Commands:
-  compress <platform> --source <file>     Compress for specific platform
-  compress all --source <file>            Deploy to all platforms
-  list                                   List available platforms
-  validate <platform> --source <file>   Validate file and platform
-  help                                   Show this help message
-
-🌐 Supported Platforms:
-  claude, qwen, gemini, openai, cursor, codebuff
-
-📁 Output Location:
-  Files are saved to: ./outputs/[platform]/DEPLOYABLE_[platform].md
-  Manual installation required - see output for instructions
-
-💡 Usage Examples:
-  python -m src.cli_wrapper compress claude --source ./myfile.md
-  python -m src.cli_wrapper compress all --source ./myfile.md
-  python -m src.cli_wrapper list
-  python -m src.cli_wrapper validate claude --source ./myfile.md
-
-🔧 Key Features:
-  ✅ Manual Installation Only (no automatic AI config changes)
-  ✅ User Control (you decide where to install)
-  ✅ Clear Instructions (step-by-step guidance)
-  ✅ Comprehensive Validation (file format, size, platform support)
-        """
-        print(help_text)
+        print(_HELP_TEXT)
 
     def interactive_mode(self):
         """
@@ -328,18 +476,9 @@ class ContextCLI:
             self._show_main_menu()
             choice = input("\nEnter your choice (1-7): ").strip()
 
-            if choice == '1':
-                self._menu_list_platforms()
-            elif choice == '2':
-                self._menu_validate_file()
-            elif choice == '3':
-                self._menu_compress_context()
-            elif choice == '4':
-                self._menu_deploy_all()
-            elif choice == '5':
-                self._menu_system_info()
-            elif choice == '6':
-                self._menu_settings()
+            action = self._menu_actions.get(choice)
+            if action:
+                action()
             elif choice == '7':
                 print("\n👋 Goodbye! Thank you for using Context Compression System")
                 break
@@ -349,23 +488,11 @@ class ContextCLI:
 
     def _show_main_menu(self):
         """แสดงเมนูหลัก"""
-        print("\n" + "="*60)
-        print("🚀 Context Compression System - Interactive Mode")
-        print("="*60)
-        print("\nPlease select an action:\n")
-        print("1. 📋 List available platforms")
-        print("2. ✅ Validate source file")
-        print("3. 🗜️  Compress context")
-        print("4. 🚀 Deploy to all platforms")
-        print("5. 📊 System information")
-        print("6. ⚙️  Settings")
-        print("7. ❌ Exit")
+        print(_MAIN_MENU)
 
     def _menu_list_platforms(self):
         """เมนูแสดงรายการ platforms"""
-        print("\n" + "="*60)
-        print("📋 Available Platforms")
-        print("="*60)
+        print(_LIST_PLATFORMS_BANNER)
 
         platforms = self.list_platforms()
 
@@ -440,10 +567,9 @@ class ContextCLI:
             return
 
         # Platform selection
-        platforms = self.get_platform_list()
-        platforms.append('all')  # Add 'all' option
+        platforms_display = ", ".join(self.get_platform_list_sorted()) + ", all"
 
-        print(f"\n🌐 Available platforms: {', '.join(platforms)}")
+        print(f"\n🌐 Available platforms: {platforms_display}")
         platform = input("🎯 Enter platform (or 'all'): ").strip().lower()
 
         if not platform:
@@ -531,41 +657,38 @@ class ContextCLI:
 
         platforms = self.get_platform_list()
 
-        print(f"🌐 Supported platforms: {len(platforms)}")
-        print(f"📁 Config directory: {self.config_dir}")
-        print(f"🔧 Manual installation: Yes")
-        print(f"📄 Supported formats: .md, .txt")
+        lines = [
+            f"🌐 Supported platforms: {len(platforms)}",
+            f"📁 Config directory: {self.config_dir}",
+            f"🔧 Manual installation: Yes",
+            f"📄 Supported formats: .md, .txt",
+            f"\n📋 Platform Summary:",
+        ]
 
         # Show platform summary
-        print(f"\n📋 Platform Summary:")
-        for platform in sorted(platforms):
+        for platform in self.get_platform_list_sorted():
             try:
                 config = self.get_platform_config(platform)
-                print(f"  🔹 {platform}: {config.get('name', 'Unknown')} → {config.get('target_file', 'Unknown')}")
+                lines.append(f"  🔹 {platform}: {config.get('name', 'Unknown')} → {config.get('target_file', 'Unknown')}")
             except Exception:
-                print(f"  ❌ {platform}: Configuration error")
+                lines.append(f"  ❌ {platform}: Configuration error")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         input("\nPress Enter to return to main menu...")
 
     def _menu_settings(self):
         """เมนูตั้งค่า"""
-        print("\n" + "="*60)
-        print("⚙️  Settings")
-        print("="*60)
-
-        print(f"📁 Current config directory: {self.config_dir}")
-        print("🔧 Available settings:")
-        print("  1. Change config directory")
-        print("  2. Show advanced help")
-        print("  3. Back to main menu")
+        print(_SETTINGS_MENU.format(config_dir=self.config_dir))
 
         choice = input("\nEnter setting to modify (1-3): ").strip()
 
         if choice == '1':
             new_dir = input("Enter new config directory path: ").strip()
-            if new_dir and os.path.exists(new_dir):
+            if new_dir and Path(new_dir).is_dir():
                 self.config_dir = new_dir
                 self.config_loader = ConfigLoader(new_dir)
+                self._invalidate_platform_cache()
                 print(f"✅ Config directory changed to: {new_dir}")
             else:
                 print("❌ Invalid directory path!")
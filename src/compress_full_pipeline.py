@@ -8,7 +8,7 @@ Layer 0: Usage Instructions Extraction - Separate template instructions
 Layer 1: Thai Removal - Translation overhead removal
 Layer 2: Diagram Removal - Visual aids removal
 Layer 3: Template + Phrase + Word Compression - Dictionary compression (€, $, ฿ codes)
-Layer 5.5: Token Join Optimization - Remove spaces between adjacent codes (Layer 5 enhancement)
+Layer 5.5: Token Join Optimization - Remove spaces between adjacent codes (fused into Layer 3)
 Layer 4: Markdown Compression - Syntax optimization
 Layer 5: Whitespace + Emoji Optimization (FINAL) - Final optimization
 Deployment: Platform-Specific File Generation - 6 AI platforms
@@ -29,10 +29,23 @@ Task 8.8 Enhancement: Dynamic Source File Parameter
 """
 
 import argparse
+import contextlib
+import io
 import json
+import mmap
+import os
+import stat
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson  # Optional: Rust JSON encoder, same indented output
+except ImportError:
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -44,192 +57,116 @@ from src.core.dictionary_generator import DictionaryGenerator
 from src.core.template_compressor import TemplateCompressor
 from src.core.phrase_compressor import PhraseCompressor
 from src.core.word_compressor import WordCompressor
-from src.core.token_join import apply_token_join, validate_token_join
 from src.core.markdown_compressor import MarkdownCompressor
 from src.core.whitespace_optimizer import WhitespaceOptimizer
 from src.core.selective_emoji_remover import SelectiveEmojiRemover
 from src.core.platform_deployer import PlatformDeployer
 
 
-def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode: bool = False) -> Dict:
-    """
-    Run full compression pipeline: Thai → Templates → Smart Dict
-
-    Args:
-        source_path: Path to source file
-        output_dir: Directory for output files
-
-    Returns:
-        Dictionary with compression statistics
-    """
-    print("=" * 80)
-    print("🚀 FULL COMPRESSION PIPELINE (Layers 0-7 + Deployment)")
-    print("=" * 80)
-    print()
+class _NullWriter(io.TextIOBase):
+    """stdout sink for quiet runs: accepts writes without buffering or syscalls"""
 
-    # Create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    def write(self, s: str) -> int:
+        return len(s)
 
-    # Read source file
-    print(f"📖 Reading source: {source_path}")
-    with open(source_path, 'r', encoding='utf-8') as f:
-        original_text = f.read()
 
-    original_size = len(original_text)
-    print(f"📊 Original size: {original_size:,} chars")
-    print()
+# Memoized dictionaries (DictionaryGenerator cache), relative to output_dir: one
+# JSON file per input text + generator settings, at most 16 (oldest evicted, and
+# all of them when the generator's source changes); delete the directory to
+# clear it, or run with --no-dict-cache to bypass it
+_DICT_CACHE_DIR = ".dict_cache"
 
-    # Initialize pipeline statistics
-    pipeline_stats = {
-        'original_size': original_size,
-        'layers': [],
-        'cumulative_savings': 0
-    }
+# 1 MiB write buffer: each output file goes out in a single write syscall
+_WRITE_BUFFER = 1 << 20
 
-    # =========================================================================
-    # LAYER 0: USAGE INSTRUCTIONS EXTRACTION
-    # =========================================================================
-    print("=" * 80)
-    print("📖 LAYER 0: USAGE INSTRUCTIONS EXTRACTION")
-    print("=" * 80)
-    print()
+# Final size target (chars) checked after Layer 5 and per deployed platform
+DEFAULT_TARGET_SIZE = 40_000
 
-    usage_extractor = UsageInstructionsExtractor()
-    usage_instructions, pure_context, layer0_stats = usage_extractor.extract(original_text)
 
-    layer0_size = len(pure_context)
-    layer0_savings = original_size - layer0_size
-    layer0_ratio = (layer0_savings / original_size * 100) if original_size > 0 else 0
+@dataclass
+class LayerStat:
+    """Per-layer statistics (slotted; converted to a plain dict for pipeline_stats.json)"""
+    __slots__ = ('name', 'input_size', 'output_size', 'savings', 'ratio', 'details', 'verification')
 
-    print(f"✅ Usage instructions extracted:")
-    print(f"   Input:  {original_size:,} chars (template with instructions)")
-    print(f"   Output: {layer0_size:,} chars (pure context)")
-    print(f"   Saved:  {layer0_savings:,} chars ({layer0_ratio:.2f}%)")
-    print(f"   Usage instructions: {layer0_stats['usage_lines']} lines ({layer0_stats['usage_chars']:,} chars)")
-    print(f"   Pure context: {layer0_stats['context_lines']} lines ({layer0_stats['context_chars']:,} chars)")
-    print()
+    name: str
+    input_size: int
+    output_size: int
+    savings: int
+    ratio: float
+    details: Dict
+    verification: Optional[Dict]
 
-    # Verify extraction quality
-    verification = usage_extractor.verify_extraction(usage_instructions, pure_context)
-    print(f"🔍 Extraction verification: {verification['status']} (Quality: {verification['quality_score']}/100)")
-    print()
-
-    # Save usage instructions separately (for reference)
-    usage_output = output_dir / "layer0_usage_instructions.txt"
-    with open(usage_output, 'w', encoding='utf-8') as f:
-        f.write(usage_instructions)
-    print(f"💾 Usage instructions saved to: {usage_output}")
-    
-    # Save pure context (Layer 0 output)
-    layer0_output = output_dir / "layer0_pure_context.txt"
-    with open(layer0_output, 'w', encoding='utf-8') as f:
-        f.write(pure_context)
-    print(f"💾 Layer 0 saved to: {layer0_output}")
-    print()
+    def as_dict(self) -> Dict:
+        """JSON form (same keys as before; 'verification' only when present)"""
+        data = {
+            'name': self.name,
+            'input_size': self.input_size,
+            'output_size': self.output_size,
+            'savings': self.savings,
+            'ratio': self.ratio,
+            'details': self.details
+        }
+        if self.verification is not None:
+            data['verification'] = self.verification
+        return data
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 0: Usage Instructions Extraction',
-        'input_size': original_size,
-        'output_size': layer0_size,
-        'savings': layer0_savings,
-        'ratio': layer0_ratio,
-        'details': layer0_stats,
-        'verification': verification
-    })
-    pipeline_stats['cumulative_savings'] = layer0_savings
 
-    # Update original_text to pure_context for next layers
-    original_text = pure_context
-    original_size = layer0_size
+def _read_source(path: Path) -> str:
+    """Read source as UTF-8 text, decoding straight from an mmap of the file (no bytes copy)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    # Same newline handling as text-mode open()
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-    # =========================================================================
-    # LAYER 1: THAI CONTENT REMOVAL (Highest Priority)
-    # =========================================================================
-    print("=" * 80)
-    print("🗑️  LAYER 1: THAI CONTENT REMOVAL")
-    print("=" * 80)
-    print()
 
-    thai_remover = ThaiContentRemover()
-    layer1_text, thai_stats = thai_remover.remove(original_text)
+def _write_text(path: Path, text: str) -> None:
+    """Write text to path through a large buffer"""
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+        f.write(text)
 
-    layer1_size = len(layer1_text)
-    layer1_savings = original_size - layer1_size
-    layer1_ratio = (layer1_savings / original_size * 100) if original_size > 0 else 0
 
-    print(f"✅ Thai removal complete:")
-    print(f"   Input:  {original_size:,} chars")
-    print(f"   Output: {layer1_size:,} chars")
-    print(f"   Saved:  {layer1_savings:,} chars ({layer1_ratio:.2f}%)")
-    print(f"   Remaining Thai: {thai_stats['remaining_thai_chars']:,} (should be 0)")
-    print()
+def _write_json(path: Path, data: Dict) -> None:
+    """Write indented JSON to path (orjson when installed, else stdlib json)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
 
-    # Save Layer 1 output
-    layer1_output = output_dir / "layer1_thai_removed.txt"
-    with open(layer1_output, 'w', encoding='utf-8') as f:
-        f.write(layer1_text)
-    print(f"💾 Layer 1 saved to: {layer1_output}")
-    print()
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 1: Thai Removal',
-        'input_size': original_size,
-        'output_size': layer1_size,
-        'savings': layer1_savings,
-        'ratio': layer1_ratio,
-        'details': thai_stats
-    })
-    pipeline_stats['cumulative_savings'] = layer1_savings
+# =============================================================================
+# PIPELINE STAGES (Layers 1-5)
+# Each stage: (text, state) -> (output_text, details, report_lines)
+# =============================================================================
 
-    # =========================================================================
-    # LAYER 2: DIAGRAM/CODE BLOCK REMOVAL
-    # =========================================================================
-    print("=" * 80)
-    print("🎨 LAYER 2: DIAGRAM/CODE BLOCK REMOVAL")
-    print("=" * 80)
-    print()
+def _stage_thai(text: str, state: Dict) -> Tuple[str, Dict, List[str]]:
+    """Layer 1: Thai content removal"""
+    layer1_text, thai_stats = ThaiContentRemover().remove(text)
+    return layer1_text, thai_stats, [
+        f"   Remaining Thai: {thai_stats['remaining_thai_chars']:,} (should be 0)",
+    ]
 
-    diagram_remover = DiagramRemover()
-    layer2_text, diagram_stats = diagram_remover.remove(layer1_text)
 
-    layer2_size = len(layer2_text)
-    layer2_savings = layer1_size - layer2_size
-    layer2_ratio = (layer2_savings / layer1_size * 100) if layer1_size > 0 else 0
+def _stage_diagrams(text: str, state: Dict) -> Tuple[str, Dict, List[str]]:
+    """Layer 2: Diagram/code block removal"""
+    layer2_text, diagram_stats = DiagramRemover().remove(text)
+    return layer2_text, diagram_stats, [
+        f"   Code blocks removed: {diagram_stats['code_blocks_removed']}",
+    ]
 
-    print(f"✅ Diagram removal complete:")
-    print(f"   Input:  {layer1_size:,} chars (after Thai removal)")
-    print(f"   Output: {layer2_size:,} chars")
-    print(f"   Saved:  {layer2_savings:,} chars ({layer2_ratio:.2f}%)")
-    print(f"   Code blocks removed: {diagram_stats['code_blocks_removed']}")
-    print()
 
-    # Save Layer 2 output
-    layer2_output = output_dir / "layer2_diagrams_removed.txt"
-    with open(layer2_output, 'w', encoding='utf-8') as f:
-        f.write(layer2_text)
-    print(f"💾 Layer 2 saved to: {layer2_output}")
-    print()
-
-    pipeline_stats['layers'].append({
-        'name': 'Layer 2: Diagram Removal',
-        'input_size': layer1_size,
-        'output_size': layer2_size,
-        'savings': layer2_savings,
-        'ratio': layer2_ratio,
-        'details': diagram_stats
-    })
-    pipeline_stats['cumulative_savings'] += layer2_savings
-
-    # =========================================================================
-    # DICTIONARY GENERATION (INLINE - from clean content)
-    # =========================================================================
-    print("=" * 80)
-    print("📚 DICTIONARY GENERATION (from clean content)")
-    print("=" * 80)
-    print()
+def _stage_combined(text: str, state: Dict) -> Tuple[str, Dict, List[str]]:
+    """Layer 3: Dictionary generation (from clean content) + template/phrase/word compression + token join"""
+    aggressive_mode = state['aggressive_mode']
 
     print("🔧 Generating dictionaries from layer2 (clean content)...")
-    print(f"   Input: layer2_diagrams_removed.txt ({layer2_size:,} chars)")
+    print(f"   Input: Layer 2 output, diagrams removed ({len(text):,} chars)")
     print(f"   Status: No Thai text, no diagrams - CLEAN ✅")
     print()
 
@@ -237,195 +174,263 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
         enable_aggressive_compression=aggressive_mode,
         min_word_frequency=2 if aggressive_mode else 5
     )
-    template_dict, phrase_dict, word_dict, dict_stats = dict_generator.generate_all_dictionaries(layer2_text)
+    template_dict, phrase_dict, word_dict, dict_stats = dict_generator.generate_all_dictionaries(
+        text, cache_dir=state['dict_cache_dir']
+    )
 
     print(f"✅ Dictionaries generated successfully!")
     print(f"   Total entries: {dict_stats['total_entries']}")
     print()
 
-    # =========================================================================
-    # LAYER 3: TEMPLATE + PHRASE + WORD COMPRESSION (Combined)
-    # =========================================================================
-    print("=" * 80)
-    print("🔧 LAYER 3: COMBINED COMPRESSION (Templates + Phrases + Words)")
-    print("=" * 80)
-    print()
-
     # Create template compressor with inline dictionaries (does all 3 compression types)
     template_compressor = TemplateCompressor(
         template_dict=template_dict,
         phrase_dict=phrase_dict,
         word_dict=word_dict
     )
-    layer3_text, layer3_stats = template_compressor.compress(layer2_text)
-
-    layer3_size = len(layer3_text)
-    layer3_savings = layer2_size - layer3_size
-    layer3_ratio = (layer3_savings / layer2_size * 100) if layer2_size > 0 else 0
-
-    print(f"✅ Combined compression complete:")
-    print(f"   Input:  {layer2_size:,} chars (after diagram removal)")
-    print(f"   Output: {layer3_size:,} chars")
-    print(f"   Saved:  {layer3_savings:,} chars ({layer3_ratio:.2f}%)")
-    print(f"   Templates: {layer3_stats.get('template_count', 0):,} replacements")
-    print(f"   Phrases:   {layer3_stats.get('phrase_count', 0):,} replacements")
-    print(f"   Words:     {layer3_stats.get('word_count', 0):,} replacements")
-    print()
+    # Layer 5.5 token join runs inside the same call (no separate Layer 3 buffer)
+    layer3_text, layer3_stats = template_compressor.compress(text, join_tokens=True)
+    state['layer3_stats'] = layer3_stats
 
-    # Save Layer 3 output (FINAL compressed content)
-    layer3_output = output_dir / "layer3_combined_compression.txt"
-    with open(layer3_output, 'w', encoding='utf-8') as f:
-        f.write(layer3_text)
-    print(f"💾 Layer 3 saved to: {layer3_output}")
-    print()
+    token_join_stats = layer3_stats['token_join']['token_join_stats']
+    validation = layer3_stats['token_join']['validation']
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 3: Combined Compression (Templates + Phrases + Words)',
-        'input_size': layer2_size,
-        'output_size': layer3_size,
-        'savings': layer3_savings,
-        'ratio': layer3_ratio,
-        'details': layer3_stats
-    })
-    pipeline_stats['cumulative_savings'] += layer3_savings
+    return layer3_text, layer3_stats, [
+        f"   Templates: {layer3_stats.get('template_count', 0):,} replacements",
+        f"   Phrases:   {layer3_stats.get('phrase_count', 0):,} replacements",
+        f"   Words:     {layer3_stats.get('word_count', 0):,} replacements",
+        f"   Token pairs joined: {token_join_stats['pairs_joined']:,} "
+        f"({token_join_stats['chars_saved']:,} chars)",
+        "",
+        f"🔍 Token Join validation: {validation['status']} "
+        f"(Tokens: {validation['original_tokens']} → {validation['joined_tokens']})",
+    ]
 
-    # =========================================================================
-    # LAYER 5.5: TOKEN JOIN OPTIMIZATION (Layer 5 Enhancement)
-    # =========================================================================
-    print("=" * 80)
-    print("🔗 LAYER 5.5: TOKEN JOIN OPTIMIZATION (Remove spaces between adjacent codes)")
-    print("=" * 80)
-    print()
 
-    # Apply token join optimization
-    layer35_text, token_join_stats = apply_token_join(layer3_text)
+def _stage_markdown(text: str, state: Dict) -> Tuple[str, Dict, List[str]]:
+    """Layer 4: Markdown compression"""
+    layer4_text, layer4_stats = MarkdownCompressor().compress(text)
+    return layer4_text, layer4_stats, []
 
-    layer35_size = len(layer35_text)
-    layer35_savings = layer3_size - layer35_size
-    layer35_ratio = (layer35_savings / layer3_size * 100) if layer3_size > 0 else 0
 
-    print(f"✅ Token Join optimization complete:")
-    print(f"   Input:  {layer3_size:,} chars (after combined compression)")
-    print(f"   Output: {layer35_size:,} chars")
-    print(f"   Saved:  {layer35_savings:,} chars ({layer35_ratio:.2f}%)")
-    print(f"   Pairs joined: {token_join_stats['pairs_joined']:,}")
-    print()
+def _stage_final(text: str, state: Dict) -> Tuple[str, Dict, List[str]]:
+    """Layer 5: Whitespace + selective emoji removal (FINAL)"""
+    # Step 1: Whitespace optimization
+    layer5_intermediate, whitespace_stats = WhitespaceOptimizer().optimize(text)
 
-    # Validate token join (lossless verification)
-    validation = validate_token_join(layer3_text, layer35_text)
-    print(f"🔍 Token Join validation: {validation['status']} (Tokens: {validation['original_tokens']} → {validation['joined_tokens']})")
-    print()
+    # Step 2: Selective emoji removal. Its decorative/repeat passes run whatever
+    # the target (only the status-emoji cap depends on it), so the remover is
+    # skipped only when the text holds none of the emojis it handles
+    need_to_remove = max(0, len(layer5_intermediate) - state['target_size'])
+    emoji_remover = SelectiveEmojiRemover(target_reduction=need_to_remove + 10)
+    if emoji_remover.has_candidates(layer5_intermediate):
+        layer5_text, emoji_stats = emoji_remover.remove(layer5_intermediate)
+    else:
+        layer5_text = layer5_intermediate
+        emoji_stats = {
+            'original_size': len(layer5_intermediate),
+            'target_reduction': emoji_remover.target_reduction,
+            'emojis_removed': {},
+            'total_removed': 0,
+            'final_size': len(layer5_intermediate),
+            'actual_removed': 0,
+            'bytes_overhead_removed': 0,
+            'skipped': True
+        }
 
-    # Save Layer 5.5 output
-    layer35_output = output_dir / "layer5_5_token_join.txt"
-    with open(layer35_output, 'w', encoding='utf-8') as f:
-        f.write(layer35_text)
-    print(f"💾 Layer 5.5 saved to: {layer35_output}")
-    print()
+    return layer5_text, {
+        'whitespace_stats': whitespace_stats,
+        'emoji_stats': emoji_stats
+    }, [
+        f"   Whitespace saved: {whitespace_stats.get('savings', 0):,} chars",
+        f"   Emoji saved: {emoji_stats.get('emojis_removed', 0)} emojis",
+    ]
+
+
+# (layer name, banner, completion label, input note, debug file, stage function)
+_STAGES = (
+    ('Layer 1: Thai Removal',
+     "🗑️  LAYER 1: THAI CONTENT REMOVAL",
+     "Thai removal", "", "layer1_thai_removed.txt", _stage_thai),
+    ('Layer 2: Diagram Removal',
+     "🎨 LAYER 2: DIAGRAM/CODE BLOCK REMOVAL",
+     "Diagram removal", " (after Thai removal)", "layer2_diagrams_removed.txt", _stage_diagrams),
+    ('Layer 3: Combined Compression (Templates + Phrases + Words)',
+     "🔧 LAYER 3: COMBINED COMPRESSION (Templates + Phrases + Words + Layer 5.5 Token Join)",
+     "Combined compression", " (after diagram removal)", "layer3_combined_compression.txt", _stage_combined),
+    ('Layer 4: Markdown Compression',
+     "🗜️  LAYER 4: MARKDOWN COMPRESSION",
+     "Markdown compression", " (after combined compression)", "layer4_markdown.txt", _stage_markdown),
+    ('Layer 5: Whitespace + Emoji (FINAL)',
+     "⚡ LAYER 5: WHITESPACE + EMOJI OPTIMIZATION (FINAL)",
+     "Whitespace + Emoji optimization", "", None, _stage_final),
+)
+
+# Short labels for the final statistics table
+_SUMMARY_LABELS = {
+    'Layer 1: Thai Removal': "Layer 1 (Thai)",
+    'Layer 2: Diagram Removal': "Layer 2 (Diagrams)",
+    'Layer 3: Combined Compression (Templates + Phrases + Words)': "Layer 3 (Combined)",
+    'Layer 4: Markdown Compression': "Layer 4 (Markdown)",
+    'Layer 5: Whitespace + Emoji (FINAL)': "Layer 5 (FINAL)",
+}
+
+
+
+def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode: bool = False,
+                           write_intermediates: bool = False, quiet: bool = False,
+                           target_size: int = DEFAULT_TARGET_SIZE, dict_cache: bool = True) -> Dict:
+    """
+    Run full compression pipeline: Thai → Templates → Smart Dict
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 5.5: Token Join Optimization',
-        'input_size': layer3_size,
-        'output_size': layer35_size,
-        'savings': layer35_savings,
-        'ratio': layer35_ratio,
-        'details': {
-            'token_join_stats': token_join_stats,
-            'validation': validation
-        }
-    })
-    pipeline_stats['cumulative_savings'] += layer35_savings
+    Args:
+        source_path: Path to source file
+        output_dir: Directory for output files
+        aggressive_mode: Lower word frequency threshold for dictionaries
+        write_intermediates: Also write layer0-4 debug files (layerN_*.txt)
+        quiet: Discard progress output (this module and every layer it calls)
+        target_size: Final size target (chars); sets how far Layer 5 emoji removal goes
+        dict_cache: Reuse/store generated dictionaries in output_dir/.dict_cache
+
+    Returns:
+        Dictionary with compression statistics
+    """
+    if quiet:
+        with contextlib.redirect_stdout(_NullWriter()):
+            return compress_full_pipeline(source_path, output_dir, aggressive_mode,
+                                          write_intermediates, target_size=target_size,
+                                          dict_cache=dict_cache)
 
-    # =========================================================================
-    # LAYER 4: MARKDOWN COMPRESSION
-    # =========================================================================
     print("=" * 80)
-    print("🗜️  LAYER 4: MARKDOWN COMPRESSION")
+    print("🚀 FULL COMPRESSION PIPELINE (Layers 0-7 + Deployment)")
     print("=" * 80)
     print()
 
-    markdown_compressor = MarkdownCompressor()
-    layer4_text, layer4_stats = markdown_compressor.compress(layer35_text)
-
-    layer4_size = len(layer4_text)
-    layer4_savings = layer35_size - layer4_size
-    layer4_ratio = (layer4_savings / layer35_size * 100) if layer35_size > 0 else 0
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"✅ Markdown compression complete:")
-    print(f"   Input:  {layer35_size:,} chars (after token join)")
-    print(f"   Output: {layer4_size:,} chars")
-    print(f"   Saved:  {layer4_savings:,} chars ({layer4_ratio:.2f}%)")
-    print()
+    # Read source file
+    print(f"📖 Reading source: {source_path}")
+    original_text = _read_source(source_path)
 
-    # Save Layer 4 output
-    layer4_output = output_dir / "layer4_markdown.txt"
-    with open(layer4_output, 'w', encoding='utf-8') as f:
-        f.write(layer4_text)
-    print(f"💾 Layer 4 saved to: {layer4_output}")
+    original_size = len(original_text)
+    print(f"📊 Original size: {original_size:,} chars")
     print()
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 4: Markdown Compression',
-        'input_size': layer35_size,
-        'output_size': layer4_size,
-        'savings': layer4_savings,
-        'ratio': layer4_ratio,
-        'details': layer4_stats
-    })
-    pipeline_stats['cumulative_savings'] += layer4_savings
+    # Initialize pipeline statistics
+    pipeline_stats = {
+        'original_size': original_size,
+        'layers': [],
+        'cumulative_savings': 0
+    }
 
     # =========================================================================
-    # LAYER 5: WHITESPACE + EMOJI OPTIMIZATION (FINAL)
+    # LAYER 0: USAGE INSTRUCTIONS EXTRACTION
     # =========================================================================
     print("=" * 80)
-    print("⚡ LAYER 5: WHITESPACE + EMOJI OPTIMIZATION (FINAL)")
+    print("📖 LAYER 0: USAGE INSTRUCTIONS EXTRACTION")
     print("=" * 80)
     print()
 
-    # Step 1: Whitespace optimization
-    whitespace_optimizer = WhitespaceOptimizer()
-    layer5_intermediate, whitespace_stats = whitespace_optimizer.optimize(layer4_text)
+    usage_extractor = UsageInstructionsExtractor()
+    usage_instructions, pure_context, layer0_stats = usage_extractor.extract(original_text)
 
-    # Step 2: Selective emoji removal
-    target_size = 40_000
-    need_to_remove = max(0, len(layer5_intermediate) - target_size)
-    emoji_remover = SelectiveEmojiRemover(target_reduction=need_to_remove + 10)
-    layer5_text, emoji_stats = emoji_remover.remove(layer5_intermediate)
-
-    layer5_size = len(layer5_text)
-    layer5_savings = layer4_size - layer5_size
-    layer5_ratio = (layer5_savings / layer4_size * 100) if layer4_size > 0 else 0
-
-    print(f"✅ Whitespace + Emoji optimization complete:")
-    print(f"   Input:  {layer4_size:,} chars")
-    print(f"   Output: {layer5_size:,} chars")
-    print(f"   Saved:  {layer5_savings:,} chars ({layer5_ratio:.2f}%)")
-    print(f"   Whitespace saved: {whitespace_stats.get('savings', 0):,} chars")
-    print(f"   Emoji saved: {emoji_stats.get('emojis_removed', 0)} emojis")
+    layer0_size = len(pure_context)
+    layer0_savings = original_size - layer0_size
+    layer0_ratio = (layer0_savings / original_size * 100) if original_size > 0 else 0
+
+    print(f"✅ Usage instructions extracted:")
+    print(f"   Input:  {original_size:,} chars (template with instructions)")
+    print(f"   Output: {layer0_size:,} chars (pure context)")
+    print(f"   Saved:  {layer0_savings:,} chars ({layer0_ratio:.2f}%)")
+    print(f"   Usage instructions: {layer0_stats['usage_lines']} lines ({layer0_stats['usage_chars']:,} chars)")
+    print(f"   Pure context: {layer0_stats['context_lines']} lines ({layer0_stats['context_chars']:,} chars)")
+    print()
+
+    # Verify extraction quality
+    verification = usage_extractor.verify_extraction(usage_instructions, pure_context)
+    print(f"🔍 Extraction verification: {verification['status']} (Quality: {verification['quality_score']}/100)")
     print()
 
-    # Save Layer 5 output (FINAL)
+    layer_stats = [LayerStat('Layer 0: Usage Instructions Extraction', original_size, layer0_size,
+                             layer0_savings, layer0_ratio, layer0_stats, verification)]
+    pipeline_stats['cumulative_savings'] = layer0_savings
+
+    # Update original_text to pure_context for next layers
+    # (cumulative savings restart from the pure context baseline)
+    current_text = pure_context
+    original_size = layer0_size
+    pipeline_stats['cumulative_savings'] = 0
+
+    # =========================================================================
+    # LAYERS 1-5: SEQUENTIAL STAGES (only the current buffer is kept alive)
+    # =========================================================================
+    state = {
+        'aggressive_mode': aggressive_mode,
+        'target_size': target_size,
+        'dict_cache_dir': output_dir / _DICT_CACHE_DIR if dict_cache else None,
+    }
+
+    # Debug dumps are written on worker threads so disk I/O overlaps the next layer
+    # (threads only start on the first submit; the with block waits for every dump)
+    pending_dumps = []
+    with ThreadPoolExecutor(max_workers=4) as dump_pool:
+        if write_intermediates:
+            # Save usage instructions separately (for reference)
+            usage_output = output_dir / "layer0_usage_instructions.txt"
+            pending_dumps.append(dump_pool.submit(_write_text, usage_output, usage_instructions))
+            print(f"💾 Usage instructions saved to: {usage_output}")
+
+            # Save pure context (Layer 0 output)
+            layer0_output = output_dir / "layer0_pure_context.txt"
+            pending_dumps.append(dump_pool.submit(_write_text, layer0_output, pure_context))
+            print(f"💾 Layer 0 saved to: {layer0_output}")
+            print()
+
+        for layer_name, banner, done_label, input_note, debug_file, stage_fn in _STAGES:
+            print("=" * 80)
+            print(banner)
+            print("=" * 80)
+            print()
+
+            input_size = len(current_text)
+            current_text, details, report_lines = stage_fn(current_text, state)
+
+            output_size = len(current_text)
+            savings = input_size - output_size
+            ratio = (savings / input_size * 100) if input_size > 0 else 0
+
+            print(f"✅ {done_label} complete:")
+            print(f"   Input:  {input_size:,} chars{input_note}")
+            print(f"   Output: {output_size:,} chars")
+            print(f"   Saved:  {savings:,} chars ({ratio:.2f}%)")
+            for line in report_lines:
+                print(line)
+            print()
+
+            if write_intermediates and debug_file:
+                layer_output = output_dir / debug_file
+                pending_dumps.append(dump_pool.submit(_write_text, layer_output, current_text))
+                print(f"💾 {layer_name.split(':')[0]} saved to: {layer_output}")
+                print()
+
+            layer_stats.append(LayerStat(layer_name, input_size, output_size, savings, ratio, details, None))
+            pipeline_stats['cumulative_savings'] += savings
+
+    for future in pending_dumps:
+        future.result()  # Surface any write error
+
+    layer5_text = current_text
+    layer3_stats = state['layer3_stats']
+
+    # Save Layer 5 output (FINAL) - always written
     layer5_output = output_dir / "layer5_FINAL.txt"
-    with open(layer5_output, 'w', encoding='utf-8') as f:
-        f.write(layer5_text)
+    _write_text(layer5_output, layer5_text)
     print(f"💾 Layer 5 (FINAL) saved to: {layer5_output}")
     print()
 
-    pipeline_stats['layers'].append({
-        'name': 'Layer 5: Whitespace + Emoji (FINAL)',
-        'input_size': layer4_size,
-        'output_size': layer5_size,
-        'savings': layer5_savings,
-        'ratio': layer5_ratio,
-        'details': {
-            'whitespace_stats': whitespace_stats,
-            'emoji_stats': emoji_stats
-        }
-    })
-    pipeline_stats['cumulative_savings'] += layer5_savings
-
     # Update final size to Layer 5
-    final_size = layer5_size
+    final_size = len(layer5_text)
 
     # =========================================================================
     # FINAL STATISTICS
@@ -440,12 +445,9 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
     total_ratio = (total_savings / original_size * 100) if original_size > 0 else 0
 
     print(f"Original size:               {original_size:,} chars")
-    print(f"After Layer 1 (Thai):        {layer1_size:,} chars ({layer1_ratio:.2f}% savings)")
-    print(f"After Layer 2 (Diagrams):    {layer2_size:,} chars ({layer2_ratio:.2f}% more)")
-    print(f"After Layer 3 (Combined):    {layer3_size:,} chars ({layer3_ratio:.2f}% more)")
-    print(f"After Layer 5.5 (Token Join):{layer35_size:,} chars ({layer35_ratio:.2f}% more)")
-    print(f"After Layer 4 (Markdown):    {layer4_size:,} chars ({layer4_ratio:.2f}% more)")
-    print(f"After Layer 5 (FINAL):       {layer5_size:,} chars ({layer5_ratio:.2f}% more)")
+    for i, layer in enumerate(layer_stats[1:]):
+        label = f"After {_SUMMARY_LABELS[layer.name]}:"
+        print(f"{label:<29}{layer.output_size:,} chars ({layer.ratio:.2f}% {'savings' if i == 0 else 'more'})")
     print(f"─" * 80)
     print(f"Final size:                  {final_size:,} chars")
     print(f"Total savings:               {total_savings:,} chars")
@@ -453,7 +455,6 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
     print()
 
     # Target validation
-    target_size = 40_000
     target_ratio = 52.79
 
     print("=" * 80)
@@ -492,9 +493,9 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
     pipeline_stats['total_ratio'] = total_ratio
     pipeline_stats['target_size'] = target_size
     pipeline_stats['target_ratio'] = target_ratio
+    pipeline_stats['layers'] = [layer.as_dict() for layer in layer_stats]
 
-    with open(stats_output, 'w', encoding='utf-8') as f:
-        json.dump(pipeline_stats, f, indent=2, ensure_ascii=False)
+    _write_json(stats_output, pipeline_stats)
 
     print(f"💾 Pipeline stats saved to: {stats_output}")
     print()
@@ -507,8 +508,7 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
         'word_dict': layer3_stats.get('word_dict', {})
     }
 
-    with open(dicts_output, 'w', encoding='utf-8') as f:
-        json.dump(all_dicts, f, indent=2, ensure_ascii=False)
+    _write_json(dicts_output, all_dicts)
 
     print(f"💾 Compression dictionaries saved to: {dicts_output}")
     print()
@@ -583,6 +583,38 @@ def compress_full_pipeline(source_path: Path, output_dir: Path, aggressive_mode:
     return pipeline_stats
 
 
+def compress_full_pipeline_batch(source_paths: List[Path], output_dir: Path,
+                                 **options) -> Dict[Path, Dict]:
+    """
+    Run the full pipeline over several sources in one process.
+
+    Module imports, compiled patterns and the dictionary cache are paid for once
+    instead of once per invocation. A single source writes straight into
+    output_dir (same layout as compress_full_pipeline); several sources each get
+    output_dir/<stem> (suffixed _2, _3, ... when stems repeat).
+
+    Args:
+        source_paths: Validated source files
+        output_dir: Base directory for output files
+        **options: Passed through to compress_full_pipeline (aggressive_mode, quiet, ...)
+
+    Returns:
+        Dictionary mapping each source path to its pipeline statistics
+    """
+    if len(source_paths) == 1:
+        return {source_paths[0]: compress_full_pipeline(source_paths[0], output_dir, **options)}
+
+    results = {}
+    used_names = Counter()
+    for source_path in source_paths:
+        used_names[source_path.stem] += 1
+        name = source_path.stem
+        if used_names[name] > 1:
+            name = f"{name}_{used_names[name]}"
+        results[source_path] = compress_full_pipeline(source_path, output_dir / name, **options)
+    return results
+
+
 def validate_source_file(source_path: Path) -> Path:
     """
     Validate source file path and existence.
@@ -601,12 +633,14 @@ def validate_source_file(source_path: Path) -> Path:
     if not source_path.is_absolute():
         source_path = Path.cwd() / source_path
 
-    # Check if file exists
-    if not source_path.exists():
+    # Check existence and file type with a single stat call
+    try:
+        source_stat = source_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"❌ ERROR: Source file not found: {source_path}")
 
     # Check if it's a file (not directory)
-    if not source_path.is_file():
+    if not stat.S_ISREG(source_stat.st_mode):
         raise ValueError(f"❌ ERROR: Source path is not a file: {source_path}")
 
     # Check supported formats
@@ -638,6 +672,9 @@ Examples:
 
   # With compression mode
   python compress_full_pipeline.py --source template.md --output-dir outputs --aggressive
+
+  # Batch: several templates in one run (outputs/<stem>/ per source)
+  python compress_full_pipeline.py --source a.md b.md c.md --output-dir outputs
         """
     )
 
@@ -645,8 +682,10 @@ Examples:
     parser.add_argument(
         '--source',
         type=Path,
+        nargs='+',
         required=True,
-        help='Source template file path (.md or .txt) - REQUIRED PARAMETER'
+        help='Source template file path(s) (.md or .txt) - REQUIRED PARAMETER; '
+             'several sources are written to <output-dir>/<stem>/'
     )
 
     parser.add_argument(
@@ -669,10 +708,41 @@ Examples:
         help='Use conservative compression mode (word frequency: 5+, standard coverage)'
     )
 
+    parser.add_argument(
+        '--debug', '--debug-intermediates',
+        dest='debug_intermediates',
+        action='store_true',
+        help='Also write layer0-4 intermediate files (layerN_*.txt) for debugging'
+    )
+
+    parser.add_argument(
+        '--target-size',
+        type=int,
+        default=DEFAULT_TARGET_SIZE,
+        help=f'Final size target in chars (default: {DEFAULT_TARGET_SIZE:,}); '
+             'status emojis are only capped when over it'
+    )
+
+    parser.add_argument(
+        '--no-dict-cache',
+        dest='dict_cache',
+        action='store_false',
+        help=f'Always regenerate dictionaries: skip reading/writing <output-dir>/{_DICT_CACHE_DIR}/ '
+             '(memoized per input text + settings)'
+    )
+
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Suppress progress output (exit code still reports target met/missed)'
+    )
+
     args = parser.parse_args()
 
     # Display mode information
-    if args.aggressive:
+    if args.quiet:
+        pass
+    elif args.aggressive:
         print("🚀 AGGRESSIVE COMPRESSION MODE ENABLED")
         print("   - Word frequency threshold: 2+ occurrences")
         print("   - Maximum dictionary coverage")
@@ -688,12 +758,14 @@ Examples:
         print("   Use --conservative for standard compression")
         print()
 
-    # Validate source file (Task 8.8 enhancement)
+    # Validate source files (Task 8.8 enhancement)
     try:
-        source_path = validate_source_file(args.source)
-        print(f"📖 Source file validated: {source_path}")
-        print(f"📊 File size: {source_path.stat().st_size:,} bytes")
-        print()
+        source_paths = [validate_source_file(source) for source in args.source]
+        if not args.quiet:
+            for source_path in source_paths:
+                print(f"📖 Source file validated: {source_path}")
+                print(f"📊 File size: {source_path.stat().st_size:,} bytes")
+            print()
     except (FileNotFoundError, ValueError) as e:
         print(e)
         print()
@@ -705,14 +777,22 @@ Examples:
     # Create output directory
     output_dir = args.output_dir
     output_dir.mkdir(parents=True, exist_ok=True)
-    print(f"📁 Output directory: {output_dir}")
-    print()
+    if not args.quiet:
+        print(f"📁 Output directory: {output_dir}")
+        print()
 
     # Run full pipeline with selected mode
-    stats = compress_full_pipeline(source_path, output_dir, aggressive_mode=args.aggressive)
+    results = compress_full_pipeline_batch(
+        source_paths, output_dir,
+        aggressive_mode=args.aggressive,
+        write_intermediates=args.debug_intermediates,
+        quiet=args.quiet,
+        target_size=args.target_size,
+        dict_cache=args.dict_cache
+    )
 
-    # Return success/failure based on target
-    return 0 if stats['target_met'] else 1
+    # Return success/failure based on target (every source must meet it)
+    return 0 if all(stats['target_met'] for stats in results.values()) else 1
 
 
 if __name__ == '__main__':
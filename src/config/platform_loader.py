@@ -4,14 +4,48 @@ Loads and validates platform-specific configurations from JSON files
 """
 
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from dataclasses import dataclass
 
-
-@dataclass
+# JSON parser shim: orjson, then ujson, then stdlib (configs are read as bytes;
+# all three accept UTF-8 bytes directly)
+try:
+    import orjson as _json_impl
+except ImportError:
+    try:
+        import ujson as _json_impl
+    except ImportError:
+        _json_impl = json
+_loads = _json_impl.loads
+
+# Parsed configs shared by every PlatformConfigLoader in the process, keyed by
+# (resolved dir, dir mtime_ns, newest *.json mtime_ns); safe to share since
+# PlatformConfig is frozen and each loader copies the dict into its own _configs
+# (cache config ที่ parse แล้ว ใช้ร่วมกันทั้ง process)
+_PARSE_CACHE: Dict[tuple, Dict[str, "PlatformConfig"]] = {}
+
+# Fields drawn from a small closed set across configs: interned so every
+# PlatformConfig shares one string object per value
+_INTERNED_FIELDS = ("name", "target_file", "header_style", "compression_default")
+_COMPRESSION_LEVELS = ("basic", "aggressive", "selective")
+
+# Configs are read on a thread pool (overlapping file I/O) from this many files up
+_PARALLEL_LOAD_MIN = 4
+
+
+@dataclass(frozen=True)
 class PlatformConfig:
     """Platform configuration data structure (โครงสร้างข้อมูล config แพลตฟอร์ม)"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    # Frozen: instances are shared through _PARSE_CACHE by every loader
+    __slots__ = ('name', 'target_file', 'output_dir', 'header_style',
+                 'compression_default', 'description')
+
     name: str
     target_file: str
     output_dir: str
@@ -21,7 +55,7 @@ class PlatformConfig:
 
     def __post_init__(self):
         """Validate configuration after initialization"""
-        if self.compression_default not in ["basic", "aggressive", "selective"]:
+        if self.compression_default not in _COMPRESSION_LEVELS:
             raise ValueError(
                 f"Invalid compression_default: {self.compression_default}. "
                 "Must be: basic, aggressive, or selective"
@@ -43,20 +77,45 @@ class PlatformConfigLoader:
         """
         self.config_dir = Path(config_dir)
         self._configs: Dict[str, PlatformConfig] = {}
+        # Read-only live view of _configs (load_all refills it in place)
+        self._configs_view: Mapping[str, PlatformConfig] = MappingProxyType(self._configs)
+        self._stats: Optional[Mapping[str, Any]] = None  # Built by get_stats, reset by load_all
+        # Configs read one at a time by get() before any load_all()
+        self._single_cache: Dict[str, PlatformConfig] = {}
         self._loaded = False
 
-    def load_all(self) -> Dict[str, PlatformConfig]:
+    @staticmethod
+    def scan_platform_ids(config_dir: str) -> List[str]:
+        """
+        List platform IDs from config filenames without parsing them
+        (แสดง platform ID จากชื่อไฟล์โดยไม่ต้อง parse JSON)
+
+        Returns:
+            Sorted platform IDs; empty if directory is missing
+        """
+        try:
+            with os.scandir(config_dir) as entries:
+                return sorted(
+                    entry.name[:-5] for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                )
+        except OSError:
+            return []
+
+    def load_all(self) -> Mapping[str, PlatformConfig]:
         """
         Load all platform configurations from directory
         (โหลด config ทุกแพลตฟอร์มจากไดเรกทอรี)
 
         Returns:
-            Dictionary mapping platform names to configurations
+            Read-only view mapping platform names to configurations
         """
         if not self.config_dir.exists():
             raise FileNotFoundError(f"Config directory not found: {self.config_dir}")
 
         self._configs.clear()
+        self._single_cache.clear()
+        self._stats = None
 
         # Load all JSON files in config directory
         json_files = list(self.config_dir.glob("*.json"))
@@ -64,24 +123,54 @@ class PlatformConfigLoader:
         if not json_files:
             raise ValueError(f"No JSON config files found in: {self.config_dir}")
 
-        for json_file in json_files:
+        cache_key = (
+            self.config_dir.resolve(),
+            self.config_dir.stat().st_mtime_ns,
+            max(json_file.stat().st_mtime_ns for json_file in json_files)
+        )
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            self._configs.update(cached)
+            self._loaded = True
+            return self._configs_view
+
+        if len(json_files) >= _PARALLEL_LOAD_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as pool:
+                pending = [pool.submit(self._load_single, json_file) for json_file in json_files]
+        else:
+            pending = None
+
+        # Collect in file order (first failing file is reported, as before)
+        for i, json_file in enumerate(json_files):
             try:
-                config = self._load_single(json_file)
+                config = pending[i].result() if pending else self._load_single(json_file)
                 platform_id = json_file.stem  # filename without extension
                 self._configs[platform_id] = config
             except Exception as e:
                 raise ValueError(f"Failed to load {json_file.name}: {str(e)}")
 
+        _PARSE_CACHE[cache_key] = self._configs.copy()
         self._loaded = True
-        return self._configs.copy()
+        return self._configs_view
 
     def _load_single(self, config_file: Path) -> PlatformConfig:
         """
         Load single platform configuration file
         (โหลดไฟล์ config แพลตฟอร์มเดียว)
         """
-        with open(config_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(config_file, 'rb') as f:
+            data = _loads(f.read())
+
+        for field in _INTERNED_FIELDS:
+            value = data.get(field)
+            if type(value) is str:
+                data[field] = sys.intern(value)
+
+        # Fast path: exact 6-field schema maps straight onto the dataclass
+        try:
+            return PlatformConfig(**data)
+        except TypeError:
+            pass  # Missing or extra keys: validate field by field below
 
         # Validate required fields
         required_fields = [
@@ -113,20 +202,33 @@ class PlatformConfigLoader:
         Returns:
             PlatformConfig or None if not found
         """
-        if not self._loaded:
-            self.load_all()
-
-        return self._configs.get(platform_id)
+        if self._loaded:
+            return self._configs.get(platform_id)
+
+        # Not fully loaded: read only this platform's file (cached per loader)
+        config = self._single_cache.get(platform_id)
+        if config is None:
+            if Path(platform_id).name != platform_id:
+                return None  # Not a bare platform ID (path separators etc.)
+            config_file = self.config_dir / f"{platform_id}.json"
+            if not config_file.is_file():
+                return None
+            try:
+                config = self._load_single(config_file)
+            except Exception as e:
+                raise ValueError(f"Failed to load {config_file.name}: {str(e)}")
+            self._single_cache[platform_id] = config
+        return config
 
-    def get_all(self) -> Dict[str, PlatformConfig]:
+    def get_all(self) -> Mapping[str, PlatformConfig]:
         """
-        Get all loaded configurations
-        (ดึง config ทั้งหมดที่โหลดไว้)
+        Get all loaded configurations as a read-only view (no copy)
+        (ดึง config ทั้งหมดที่โหลดไว้ แบบอ่านอย่างเดียว)
         """
         if not self._loaded:
             self.load_all()
 
-        return self._configs.copy()
+        return self._configs_view
 
     def list_platforms(self) -> List[str]:
         """
@@ -153,8 +255,8 @@ class PlatformConfigLoader:
         if not config:
             return False
 
-        output_path = Path(config.output_dir)
-        return output_path.exists() and output_path.is_dir()
+        # is_dir() is False for missing paths: one stat() instead of two
+        return Path(config.output_dir).is_dir()
 
     def get_output_path(self, platform_id: str) -> Optional[Path]:
         """
@@ -179,22 +281,35 @@ class PlatformConfigLoader:
         (โหลด config ทั้งหมดจากดิสก์ใหม่)
         """
         self._loaded = False
+        self.invalidate()
         return self.load_all()
 
-    def get_stats(self) -> Dict[str, any]:
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop all cached parsed configs
+        (ล้าง cache config ที่ parse แล้วทั้งหมด)
+        """
+        _PARSE_CACHE.clear()
+
+    def get_stats(self) -> Mapping[str, Any]:
         """
-        Get loader statistics
-        (ดึงสถิติ loader)
+        Get loader statistics as a read-only view
+        (ดึงสถิติ loader แบบอ่านอย่างเดียว)
         """
         if not self._loaded:
             self.load_all()
 
-        return {
-            "total_platforms": len(self._configs),
-            "platforms": list(self._configs.keys()),
-            "config_directory": str(self.config_dir),
-            "compression_levels": {
-                pid: config.compression_default
-                for pid, config in self._configs.items()
-            }
-        }
+        # Built once per load and shared by every caller, so nested values are
+        # read-only too (tuple / MappingProxyType); reload() / load_all() reset it
+        if self._stats is None:
+            self._stats = MappingProxyType({
+                "total_platforms": len(self._configs),
+                "platforms": tuple(self._configs),
+                "config_directory": str(self.config_dir),
+                "compression_levels": MappingProxyType({
+                    pid: config.compression_default
+                    for pid, config in self._configs.items()
+                })
+            })
+        return self._stats
@@ -4,11 +4,101 @@ Handles context compression with multiple strategies (basic, aggressive, selecti
 """
 
 import re
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Compiled once per process (no re-cache lookup per compress call)
+# Basic compression
+_RE_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+_RE_BLANK_RUN = re.compile(r'\n\s*\n\s*\n+')
+
+# Aggressive compression
+_RE_EXAMPLE_SEC = re.compile(
+    r'(?:^|\n)#{2,4}\s+\*\*[📋💡🎯]\s*Example[^*]+\*\*[^\n]*\n+(?:(?!#{2,4}\s+\*\*).)*?(?=\n#{2,4}\s+\*\*|\Z)',
+    re.DOTALL | re.MULTILINE | re.IGNORECASE
+)
+_RE_CODE_BLOCK = re.compile(r'\n```[^\n]*\n.*?\n```\n', re.DOTALL)
+_RE_DIAGRAM = re.compile(r'\n```[^\n]*\n[^\n]*[┌┐└┘├┤│─━]+[^\n]*\n.*?\n```\n', re.DOTALL)
+_RE_BLOCKQUOTE = re.compile(r'\n>\s+.*$', re.MULTILINE)
+_RE_CONST_BASIS = re.compile(
+    r'#### \*\*📜 Constitutional Basis:\*\*\n\*\*รากฐานรัธรีมนูญ\*\*\n.*?(?=\n####)',
+    re.DOTALL
+)
+_RE_IMPL_STD = re.compile(
+    r'#### \*\*📊 Implementation Standards:\*\*\n\*\*มาตรฐานการนำไปใช้\*\*\n\n```\n.*?\n```',
+    re.DOTALL
+)
+_RE_QUAL_METRICS = re.compile(
+    r'#### \*\*🏗️ Quality Metrics:\*\*\n\*\*เมตริกคุณภาพ\*\*\n.*?(?=\n####)',
+    re.DOTALL
+)
+_RE_VIS_FRAMEWORK = re.compile(r'#### \*\*🧠 Visual Framework:\*\*\n.*?(?=\n####)', re.DOTALL)
+_RE_NEWLINE_RUN = re.compile(r'\n{3,}')
+
+# (label, literal anchors - at least one must be present for a match, pattern, replacement)
+_AGGRESSIVE_PASSES = (
+    # Remove example sections with emoji
+    ("Example sections", ('📋', '💡', '🎯'), _RE_EXAMPLE_SEC, ''),
+    # Remove code blocks
+    ("Code blocks", ('\n```',), _RE_CODE_BLOCK, '\n'),
+    # Remove visual diagrams (ASCII art boxes)
+    ("Visual diagrams", ('\n```',), _RE_DIAGRAM, '\n'),
+    # Remove blockquotes
+    ("Blockquotes", ('\n>',), _RE_BLOCKQUOTE, ''),
+    # Remove "Constitutional Basis" explanations (keep only the principles)
+    ("Constitutional Basis explanations",
+     ('#### **📜 Constitutional Basis:**\n**รากฐานรัธรีมนูญ**\n',), _RE_CONST_BASIS, ''),
+    # Remove verbose "Implementation Standards" sections (keep rules only)
+    ("Verbose Implementation Standards",
+     ('#### **📊 Implementation Standards:**\n**มาตรฐานการนำไปใช้**\n\n```\n',), _RE_IMPL_STD, ''),
+    # Remove "Quality Metrics" sections (too verbose for AI)
+    ("Quality Metrics", ('#### **🏗️ Quality Metrics:**\n**เมตริกคุณภาพ**\n',), _RE_QUAL_METRICS, ''),
+    # Remove "Visual Framework" sections (diagrams not needed for AI)
+    ("Visual Frameworks", ('#### **🧠 Visual Framework:**\n',), _RE_VIS_FRAMEWORK, ''),
+)
+
+# Recent compressions kept in stats["compression_history"] (older ones are
+# only reflected in the running totals)
+_HISTORY_LIMIT = 256
+
+# Section / pattern helpers
+_RE_HEADER = re.compile(r'^#{1,6}\s+')
+# One C-level scan; cheaper than frozenset.isdisjoint() for plain-text
+# patterns, which have no special char to stop at early
+_RE_REGEX_SPECIALS = re.compile(r'[.*+?^${}()|[\]\\]')
+
+
+@lru_cache(maxsize=512)
+def _is_regex_pattern(pattern: str) -> bool:
+    """Check if string contains regex special characters (memoized per pattern)"""
+    return bool(_RE_REGEX_SPECIALS.search(pattern))
+
+
+@lru_cache(maxsize=512)
+def _selective_section_re(pattern: str) -> Tuple[str, 're.Pattern']:
+    """
+    Section-removal regex for a custom pattern, compiled once per pattern
+    (คอมไพล์ regex ของ pattern ครั้งเดียว)
+
+    Returns:
+        (pattern as used - escaped if it was a plain string, compiled regex)
+    """
+    # Escape pattern for regex if it's a plain string
+    if not _is_regex_pattern(pattern):
+        pattern = re.escape(pattern)
+    # Non-capturing group keeps a top-level '|' in the custom pattern inside
+    # the header anchor instead of splitting the whole expression
+    section_re = re.compile(
+        rf'(?:^|\n)##?\s+.*(?:{pattern}).*?(?=\n##?\s+|\Z)',
+        re.DOTALL | re.MULTILINE | re.IGNORECASE
+    )
+    return pattern, section_re
+
+
 class CompressionLevel(Enum):
     """Compression levels available (การระดับการบีบอัด)"""
     BASIC = "basic"
@@ -19,6 +109,10 @@ class CompressionLevel(Enum):
 @dataclass
 class CompressionResult:
     """Result of compression operation (ผลลัพธ์การบีบอัด)"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = ('compressed_text', 'original_size', 'compressed_size',
+                 'compression_ratio', 'sections_removed', 'metadata')
+
     compressed_text: str
     original_size: int
     compressed_size: int
@@ -41,10 +135,28 @@ class CompressionEngine:
             level: Compression level to use
         """
         self.level = level
-        self.stats = {
+        self.stats = self._new_stats()
+        # Level -> bound compressor, keyed by every level so reassigning
+        # self.level still dispatches correctly; SELECTIVE also needs the
+        # per-call custom_patterns and is handled in compress()
+        self._dispatch = {
+            CompressionLevel.BASIC: self._basic_compression,
+            CompressionLevel.AGGRESSIVE: self._aggressive_compression,
+        }
+
+    @staticmethod
+    def _new_stats() -> Dict[str, any]:
+        """Empty running statistics (สถิติเริ่มต้น)"""
+        return {
             "total_compressed": 0,
             "total_saved_bytes": 0,
-            "compression_history": []
+            "total_original_bytes": 0,
+            "total_compressed_bytes": 0,
+            "sum_ratio": 0.0,
+            "mean_ratio": 0,
+            "min_ratio": None,  # None until the first compression (JSON null)
+            "max_ratio": None,
+            "compression_history": deque(maxlen=_HISTORY_LIMIT)
         }
 
     def compress(self, text: str, custom_patterns: Optional[List[str]] = None) -> CompressionResult:
@@ -63,10 +175,9 @@ class CompressionEngine:
         sections_removed = []
 
         # Apply compression based on level
-        if self.level == CompressionLevel.BASIC:
-            compressed_text = self._basic_compression(text, sections_removed)
-        elif self.level == CompressionLevel.AGGRESSIVE:
-            compressed_text = self._aggressive_compression(text, sections_removed)
+        compress_fn = self._dispatch.get(self.level)
+        if compress_fn is not None:
+            compressed_text = compress_fn(text, sections_removed)
         else:  # SELECTIVE
             compressed_text = self._selective_compression(text, custom_patterns, sections_removed)
 
@@ -95,16 +206,19 @@ class CompressionEngine:
         """
         result = text
 
-        # Remove markdown comments
-        result = re.sub(r'<!--.*?-->', '', result, flags=re.DOTALL)
+        # Remove markdown comments (skip the scan when there are none)
+        if '<!--' in result:
+            result = _RE_HTML_COMMENT.sub('', result)
         sections_removed.append("HTML comments")
 
         # Remove multiple consecutive empty lines (keep max 1)
-        result = re.sub(r'\n\s*\n\s*\n+', '\n\n', result)
+        result = _RE_BLANK_RUN.sub('\n\n', result)
         sections_removed.append("Extra empty lines")
 
-        # Remove trailing whitespace from lines
-        result = re.sub(r'[ \t]+$', '', result, flags=re.MULTILINE)
+        # Remove trailing whitespace from lines: per-line rstrip instead of a
+        # MULTILINE [ \t]+$ regex, which retries at every space in the text
+        if ' \n' in result or '\t\n' in result or result.endswith((' ', '\t')):
+            result = '\n'.join([line.rstrip(' \t') for line in result.split('\n')])
         sections_removed.append("Trailing whitespace")
 
         return result
@@ -116,68 +230,20 @@ class CompressionEngine:
         """
         result = self._basic_compression(text, sections_removed)
 
-        # Remove example sections with emoji
-        result = re.sub(
-            r'(?:^|\n)#{2,4}\s+\*\*[📋💡🎯]\s*Example[^*]+\*\*[^\n]*\n+(?:(?!#{2,4}\s+\*\*).)*?(?=\n#{2,4}\s+\*\*|\Z)',
-            '',
-            result,
-            flags=re.DOTALL | re.MULTILINE | re.IGNORECASE
-        )
-        sections_removed.append("Example sections")
-
-        # Remove code blocks
-        result = re.sub(r'\n```[^\n]*\n.*?\n```\n', '\n', result, flags=re.DOTALL)
-        sections_removed.append("Code blocks")
-
-        # Remove visual diagrams (ASCII art boxes)
-        result = re.sub(r'\n```[^\n]*\n[^\n]*[┌┐└┘├┤│─━]+[^\n]*\n.*?\n```\n', '\n', result, flags=re.DOTALL)
-        sections_removed.append("Visual diagrams")
-
-        # Remove blockquotes
-        result = re.sub(r'\n>\s+.*$', '', result, flags=re.MULTILINE)
-        sections_removed.append("Blockquotes")
-
-        # Remove "Constitutional Basis" explanations (keep only the principles)
-        result = re.sub(
-            r'#### \*\*📜 Constitutional Basis:\*\*\n\*\*รากฐานรัธรีมนูญ\*\*\n.*?(?=\n####)',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        sections_removed.append("Constitutional Basis explanations")
-
-        # Remove verbose "Implementation Standards" sections (keep rules only)
-        result = re.sub(
-            r'#### \*\*📊 Implementation Standards:\*\*\n\*\*มาตรฐานการนำไปใช้\*\*\n\n```\n.*?\n```',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        sections_removed.append("Verbose Implementation Standards")
-
-        # Remove "Quality Metrics" sections (too verbose for AI)
-        result = re.sub(
-            r'#### \*\*🏗️ Quality Metrics:\*\*\n\*\*เมตริกคุณภาพ\*\*\n.*?(?=\n####)',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        sections_removed.append("Quality Metrics")
-
-        # Remove "Visual Framework" sections (diagrams not needed for AI)
-        result = re.sub(
-            r'#### \*\*🧠 Visual Framework:\*\*\n.*?(?=\n####)',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        sections_removed.append("Visual Frameworks")
+        # Works on str throughout: ASCII-only text is already stored 1 byte/char
+        # (PEP 393), so a bytes fast path only adds an encode/decode round trip
+        # Section removal passes; a pass is skipped when its literal anchor is absent
+        for label, anchors, pattern, replacement in _AGGRESSIVE_PASSES:
+            if any(anchor in result for anchor in anchors):
+                result = pattern.sub(replacement, result)
+            sections_removed.append(label)
 
         # Deduplicate repeated sections
         result = self._deduplicate_sections(result, sections_removed)
 
         # Compress multiple blank lines to single
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        if '\n\n\n' in result:
+            result = _RE_NEWLINE_RUN.sub('\n\n', result)
 
         return result
 
@@ -187,20 +253,22 @@ class CompressionEngine:
         (ลบ sections/headers ที่ซ้ำกันเพื่อป้องกันการทำซ้ำเนื้อหา)
         """
         lines = text.split('\n')
-        seen_sections = {}
+        # Keys hold the section's line tuple: hashed item by item, no joined copy
+        # (lines never contain '\n', so tuples compare exactly like joined text)
+        seen_sections = set()
         deduplicated_lines = []
         current_section = []
         current_header = None
 
         for line in lines:
             # Check if line is a header
-            if re.match(r'^#{1,6}\s+', line):
+            if _RE_HEADER.match(line):
                 # Save previous section if exists
                 if current_section:
-                    section_key = (current_header, '\n'.join(current_section))
+                    section_key = (current_header, tuple(current_section))
                     if section_key not in seen_sections:
                         deduplicated_lines.extend(current_section)
-                        seen_sections[section_key] = True
+                        seen_sections.add(section_key)
                     else:
                         sections_removed.append(f"Duplicate: {current_header[:50]}")
 
@@ -211,7 +279,7 @@ class CompressionEngine:
 
         # Add last section
         if current_section:
-            section_key = (current_header, '\n'.join(current_section))
+            section_key = (current_header, tuple(current_section))
             if section_key not in seen_sections:
                 deduplicated_lines.extend(current_section)
 
@@ -233,46 +301,53 @@ class CompressionEngine:
             return result
 
         for pattern in custom_patterns:
-            # Escape pattern for regex if it's a plain string
-            if not self._is_regex_pattern(pattern):
-                pattern = re.escape(pattern)
+            # Escaped (if plain string) + compiled once per distinct pattern
+            pattern, section_re = _selective_section_re(pattern)
 
             # Remove sections matching pattern
-            result = re.sub(
-                f'(?:^|\n)##?\s+.*{pattern}.*?(?=\n##?\s+|\Z)',
-                '',
-                result,
-                flags=re.DOTALL | re.MULTILINE | re.IGNORECASE
-            )
+            result = section_re.sub('', result)
             sections_removed.append(f"Pattern: {pattern}")
 
         return result
 
     def _is_regex_pattern(self, pattern: str) -> bool:
         """Check if string contains regex special characters"""
-        regex_chars = r'[.*+?^${}()|[\]\\]'
-        return bool(re.search(regex_chars, pattern))
+        return _is_regex_pattern(pattern)
 
     def _update_stats(self, original_size: int, compressed_size: int):
         """Update compression statistics (อัปเดตสถิติการบีบอัด)"""
         saved_bytes = original_size - compressed_size
-
-        self.stats["total_compressed"] += 1
-        self.stats["total_saved_bytes"] += saved_bytes
-        self.stats["compression_history"].append({
+        ratio = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
+        stats = self.stats
+
+        stats["total_compressed"] += 1
+        stats["total_saved_bytes"] += saved_bytes
+        stats["total_original_bytes"] += original_size
+        stats["total_compressed_bytes"] += compressed_size
+        stats["sum_ratio"] += ratio
+        stats["mean_ratio"] = stats["sum_ratio"] / stats["total_compressed"]
+        if stats["total_compressed"] == 1:
+            stats["min_ratio"] = stats["max_ratio"] = ratio
+        elif ratio < stats["min_ratio"]:
+            stats["min_ratio"] = ratio
+        elif ratio > stats["max_ratio"]:
+            stats["max_ratio"] = ratio
+        stats["compression_history"].append({
             "original_size": original_size,
             "compressed_size": compressed_size,
             "saved_bytes": saved_bytes
         })
 
     def get_stats(self) -> Dict[str, any]:
-        """Get compression statistics (ดึงสถิติการบีบอัด)"""
-        return self.stats.copy()
+        """
+        Get a snapshot of compression statistics; history entries are copied,
+        so neither side sees the other's later changes
+        (ดึงสถิติการบีบอัด แบบสำเนา)
+        """
+        stats = dict(self.stats)
+        stats["compression_history"] = [dict(entry) for entry in self.stats["compression_history"]]
+        return stats
 
     def reset_stats(self):
         """Reset compression statistics (รีเซ็ตสถิติ)"""
-        self.stats = {
-            "total_compressed": 0,
-            "total_saved_bytes": 0,
-            "compression_history": []
-        }
+        self.stats = self._new_stats()
@@ -7,10 +7,45 @@ Constitutional Basis: PROJECT.PROMPT.md - Config-Driven Architecture
 Purpose: Eliminate hardcoded platform mappings, use JSON configs as source of truth
 """
 
+import copy
 import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# JSON parser shim: orjson, then ujson, then stdlib (configs are read as bytes;
+# all three accept UTF-8 bytes directly)
+try:
+    import orjson as _json_impl
+except ImportError:
+    try:
+        import ujson as _json_impl
+    except ImportError:
+        _json_impl = json
+_loads = _json_impl.loads
+_JSONDecodeError = _json_impl.JSONDecodeError
+
+# Load warnings (%-style args: nothing is formatted unless the record is emitted)
+_log = logging.getLogger(__name__)
+
+# Parsed configs shared by every ConfigLoader in the process, keyed by
+# (resolved dir, dir mtime_ns, newest *.json mtime_ns): adding, removing or
+# editing a config file changes the key. Callers get deep copies: the configs
+# are plain mutable dicts
+_PARSE_CACHE: Dict[tuple, Dict[str, Dict]] = {}
+
+# Configs are read on a thread pool (overlapping file I/O) from this many files up
+_PARALLEL_LOAD_MIN = 4
+
+
+def _read_config(config_file: Path) -> Dict:
+    """Read and parse one config file"""
+    with open(config_file, 'rb') as f:
+        return _loads(f.read())
+
 
 class ConfigLoader:
     """
@@ -43,6 +78,24 @@ class ConfigLoader:
 
         # Load all platform configs
         self.platforms = self._load_all_configs()
+        self._filenames: Optional[List[str]] = None  # Built by get_all_filenames
+
+    def reload(self) -> Dict[str, Dict]:
+        """
+        Re-read all platform configs from disk (drops cached results).
+
+        Returns:
+            Dictionary of all platform configs
+        """
+        self.invalidate()
+        self.platforms = self._load_all_configs()
+        self._filenames = None
+        return self.platforms
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop all cached parsed configs (next construction re-reads the files)"""
+        _PARSE_CACHE.clear()
 
     def _load_all_configs(self) -> Dict[str, Dict]:
         """
@@ -59,29 +112,45 @@ class ConfigLoader:
         if not config_files:
             raise ValueError(f"No config files found in: {self.config_dir}")
 
-        for config_file in config_files:
+        cache_key = (
+            self.config_dir.resolve(),
+            self.config_dir.stat().st_mtime_ns,
+            max(config_file.stat().st_mtime_ns for config_file in config_files)
+        )
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        if len(config_files) >= _PARALLEL_LOAD_MIN:
+            with ThreadPoolExecutor(max_workers=min(8, len(config_files))) as pool:
+                pending = [pool.submit(_read_config, config_file) for config_file in config_files]
+        else:
+            pending = None
+
+        # Validate and report in file order
+        for i, config_file in enumerate(config_files):
             platform_key = config_file.stem  # claude, openai, gemini, etc.
 
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = pending[i].result() if pending else _read_config(config_file)
 
                 # Validate required fields
                 required_fields = ['name', 'target_file']
                 missing_fields = [field for field in required_fields if field not in config]
 
                 if missing_fields:
-                    print(f"⚠️ Warning: {config_file.name} missing fields: {missing_fields}")
+                    _log.warning("Config %s missing fields: %s", config_file.name, missing_fields)
                     continue
 
                 platforms[platform_key] = config
 
-            except json.JSONDecodeError as e:
-                print(f"⚠️ Warning: Could not parse {config_file.name}: {e}")
+            except _JSONDecodeError as e:
+                _log.warning("Could not parse config %s: %s", config_file.name, e)
             except Exception as e:
-                print(f"⚠️ Warning: Error loading {config_file.name}: {e}")
+                _log.warning("Error loading config %s: %s", config_file.name, e, exc_info=True)
 
-        return platforms
+        _PARSE_CACHE[cache_key] = platforms
+        return copy.deepcopy(platforms)
 
     def get_platform(self, platform_key: str) -> Optional[Dict]:
         """
@@ -133,13 +202,13 @@ class ConfigLoader:
         Returns:
             List of unique filenames (CLAUDE.md, AGENTS.md, GEMINI.md, etc.)
         """
-        filenames = []
-        for platform in self.platforms.values():
-            if 'target_file' in platform:
-                filename = platform['target_file']
-                if filename not in filenames:
-                    filenames.append(filename)
-        return filenames
+        if self._filenames is None:
+            # dict.fromkeys: first-seen order, O(1) duplicate check
+            self._filenames = list(dict.fromkeys(
+                platform['target_file'] for platform in self.platforms.values()
+                if 'target_file' in platform
+            ))
+        return list(self._filenames)
 
     def get_platform_display_name(self, platform_key: str) -> Optional[str]:
         """
@@ -188,6 +257,33 @@ class ConfigLoader:
         return platforms_info
 
 
+def _prewarm(config_dir: str = "platform_configs") -> None:
+    """
+    Best-effort: pull every config file into the OS page cache so the first
+    ConfigLoader construction doesn't pay a cold disk read. Never raises.
+    """
+    try:
+        path = Path(config_dir)
+        if not path.exists():
+            path = Path(__file__).parent.parent.parent / config_dir
+        for config_file in path.glob("*.json"):
+            fd = os.open(str(config_file), os.O_RDONLY)
+            try:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    os.read(fd, config_file.stat().st_size)  # Read and discard
+            finally:
+                os.close(fd)
+    except Exception:
+        pass
+
+
+# Opt-in (DRCC_PREWARM=1): prewarm on a daemon thread at import
+if os.environ.get('DRCC_PREWARM') == '1':
+    threading.Thread(target=_prewarm, daemon=True).start()
+
+
 # Global singleton instance (lazy-loaded)
 _config_loader_instance = None
 
@@ -3,10 +3,73 @@ Decompression Engine for Context Compression System
 Provides lossless decompression of dictionary-compressed content
 """
 
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from pathlib import Path
 
+# Separates the dictionary header from the compressed body in DEPLOYABLE files
+CONTENT_MARKER = "# 📄 **COMPRESSED CONTENT BEGINS HERE**"
+_CONTENT_MARKER_BYTES = CONTENT_MARKER.encode('utf-8')
+
+# decompress_all_platforms fans files out to worker processes when they total
+# more than this; below it, process start-up costs more than it saves
+_PARALLEL_DECOMPRESS_BYTES = 256_000
+
+# Every "### **<Name> (<n> entries)**" fenced dictionary section, in one scan
+_SECTION_RE = re.compile(
+    r"### \*\*(?P<name>[^*\n]+) \(\d+ entries\)\*\*\n```\n(?P<body>.*?)\n```",
+    re.DOTALL
+)
+
+
+def _decode(view: memoryview) -> str:
+    """Decode a UTF-8 slice of a mapped file, with text-mode open() newline handling"""
+    text = str(view, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+@lru_cache(maxsize=32)
+def _build_code_pattern(codes: Tuple[str, ...]) -> 're.Pattern':
+    """
+    Compile dictionary codes into one regex shaped like a trie.
+
+    Shared prefixes ($, ฿, ฿฿, T1...) are matched once by the C regex engine
+    instead of trying every code in turn at each position, and at each branch
+    longer continuations are tried before stopping, so the longest code wins
+    (T18 over T1, ฿aa over ฿a) exactly as with a longest-first alternation.
+    Chains of single-child nodes come out as plain literal runs, i.e. the
+    regex is a radix trie walked in C rather than per character in Python.
+
+    Cached per code set for the whole process: every engine loading the same
+    dictionaries (one per DEPLOYABLE file) reuses the compiled pattern.
+    """
+    trie = {}
+    for code in codes:
+        node = trie
+        for char in code:
+            node = node.setdefault(char, {})
+        node[''] = {}  # A code ends here
+    return re.compile(_trie_regex(trie))
+
+
+def _trie_regex(node: Dict[str, Dict]) -> str:
+    """Regex source for one trie node (recursive, depth = longest code)"""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in node.items() if char]
+    if not branches:
+        return ''
+    if '' in node:
+        return '(?:' + '|'.join(branches) + ')?'
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
 
 class DecompressionEngine:
     """
@@ -19,6 +82,9 @@ class DecompressionEngine:
         self.template_dict: Dict[str, str] = {}
         self.phrase_dict: Dict[str, str] = {}
         self.word_dict: Dict[str, str] = {}
+        # tier -> (entries it was built from, compiled alternation or
+        # str.translate table for all-single-char tiers)
+        self._code_patterns: Dict[str, Tuple[tuple, object]] = {}
 
     def load_dictionaries_from_text(self, text: str) -> None:
         """
@@ -27,12 +93,14 @@ class DecompressionEngine:
         Args:
             text: Full text of DEPLOYABLE file containing dictionary sections
         """
-        # Extract dictionary sections
-        template_section = self._extract_section(text, "Template Dictionary")
-        phrase_section = self._extract_section(text, "Phrase Dictionary")
-        word_section = self._extract_section(text, "Word Dictionary")
-
-        # Parse each dictionary
+        # Extract dictionary sections (one scan of the file)
+        sections = self._extract_all_sections(text)
+        template_section = sections.get("Template Dictionary", "")
+        phrase_section = sections.get("Phrase Dictionary", "")
+        word_section = sections.get("Word Dictionary", "")
+
+        # Parse each dictionary (codes and values are interned: repeated loads
+        # and same-file engines share one string object per entry)
         if template_section:
             self.template_dict = self._parse_template_dictionary(template_section)
         if phrase_section:
@@ -40,11 +108,12 @@ class DecompressionEngine:
         if word_section:
             self.word_dict = self._parse_word_dictionary(word_section)
 
-    def _extract_section(self, text: str, section_name: str) -> str:
-        """Extract a specific dictionary section from text"""
-        pattern = rf"### \*\*{section_name} \(\d+ entries\)\*\*\n```\n(.*?)\n```"
-        match = re.search(pattern, text, re.DOTALL)
-        return match.group(1) if match else ""
+    def _extract_all_sections(self, text: str) -> Dict[str, str]:
+        """Extract all dictionary sections from text (first one wins per name)"""
+        sections = {}
+        for match in _SECTION_RE.finditer(text):
+            sections.setdefault(match.group('name'), match.group('body'))
+        return sections
 
     def _parse_template_dictionary(self, section: str) -> Dict[str, str]:
         """
@@ -58,7 +127,7 @@ class DecompressionEngine:
         for line in section.strip().split('\n'):
             if '=' in line:
                 code, value = line.split(' = ', 1)
-                template_dict[code.strip()] = value.strip()
+                template_dict[sys.intern(code.strip())] = sys.intern(value.strip())
         return template_dict
 
     def _parse_phrase_dictionary(self, section: str) -> Dict[str, str]:
@@ -75,7 +144,7 @@ class DecompressionEngine:
             for entry in entries:
                 if ' = ' in entry:
                     code, value = entry.split(' = ', 1)
-                    phrase_dict[code.strip()] = value.strip()
+                    phrase_dict[sys.intern(code.strip())] = sys.intern(value.strip())
         return phrase_dict
 
     def _parse_word_dictionary(self, section: str) -> Dict[str, str]:
@@ -93,7 +162,7 @@ class DecompressionEngine:
             for entry in entries:
                 if ' = ' in entry:
                     code, value = entry.split(' = ', 1)
-                    word_dict[code.strip()] = value.strip()
+                    word_dict[sys.intern(code.strip())] = sys.intern(value.strip())
         return word_dict
 
     def decompress(self, compressed_text: str) -> str:
@@ -114,6 +183,8 @@ class DecompressionEngine:
         if not self.template_dict or not self.phrase_dict or not self.word_dict:
             raise ValueError("Dictionaries not loaded. Call load_dictionaries_from_text() first.")
 
+        # Stays on str: three single-pass substitutions scan as fast on the
+        # wide (emoji/€/฿) str as on UTF-8 bytes, without the transcoding
         text = compressed_text
 
         # Step 1: Template decompression (T1-T19)
@@ -127,45 +198,48 @@ class DecompressionEngine:
 
         return text
 
-    def _decompress_templates(self, text: str) -> str:
-        """Replace template codes (T1-T19) with full templates"""
-        # Sort by length (longest first) to handle T1, T10, T11, T18, T19 correctly
-        # T18 must be replaced before T1, T19 before T1, T10 before T1, etc.
-        sorted_codes = sorted(self.template_dict.keys(), key=len, reverse=True)
+    def _replace_codes(self, tier: str, codes: Dict[str, str], text: str) -> str:
+        """
+        Replace every code of one dictionary tier in a single pass.
 
-        for code in sorted_codes:
-            value = self.template_dict[code]
-            # Simple replacement (order matters - longer codes first)
-            text = text.replace(code, value)
+        Longest-first alternation gives the same precedence as replacing longer
+        codes first, without rebuilding the whole text once per code.
+        """
+        if not codes:
+            return text
+
+        key = tuple(codes.items())
+        cached = self._code_patterns.get(tier)
+        if cached is None or cached[0] != key:
+            if all(len(code) == 1 for code in codes):
+                # Single-char codes only: str.translate, one C loop, no regex
+                cached = (key, str.maketrans(codes))
+            else:
+                cached = (key, _build_code_pattern(tuple(codes)))
+            self._code_patterns[tier] = cached
+
+        replacer = cached[1]
+        if isinstance(replacer, dict):
+            return text.translate(replacer)
+        return replacer.sub(lambda m: codes[m.group()], text)
 
-        return text
+    def _decompress_templates(self, text: str) -> str:
+        """Replace template codes (T1-T19) with full templates"""
+        # T18 must win over T1, T19 over T1, T10 over T1, etc.
+        return self._replace_codes('template', self.template_dict, text)
 
     def _decompress_phrases(self, text: str) -> str:
         """Replace phrase codes (€a-€€ai) with full phrases"""
-        # Sort by length (longest first) to handle €a, €aa, €€ai correctly
-        sorted_codes = sorted(self.phrase_dict.keys(), key=len, reverse=True)
-
-        for code in sorted_codes:
-            value = self.phrase_dict[code]
-            # Phrase codes can appear in various contexts
-            text = text.replace(code, value)
-
-        return text
+        # Handles €a, €aa, €€ai correctly (longest code wins)
+        return self._replace_codes('phrase', self.phrase_dict, text)
 
     def _decompress_words(self, text: str) -> str:
         """Replace word codes ($A-$V, ฿a-฿฿cp) with full words"""
-        # Sort by length (longest first) to handle $A, ฿a, ฿aa, ฿฿cp correctly
-        sorted_codes = sorted(self.word_dict.keys(), key=len, reverse=True)
-
-        for code in sorted_codes:
-            value = self.word_dict[code]
-            # Word codes can appear in various contexts:
-            # - Standalone: "$A " or " $A" or "$A\n"
-            # - In compounds: "$A-based" or "$A:" or "$A‡"
-            # Use simple string replacement (dictionaries are ordered by length, so longer codes replaced first)
-            text = text.replace(code, value)
-
-        return text
+        # Word codes can appear in various contexts:
+        # - Standalone: "$A " or " $A" or "$A\n"
+        # - In compounds: "$A-based" or "$A:" or "$A‡"
+        # so codes are matched anywhere, longest first ($A, ฿a, ฿aa, ฿฿cp)
+        return self._replace_codes('word', self.word_dict, text)
 
     def decompress_file(self, deployable_path: Path, output_path: Path) -> Dict:
         """
@@ -178,21 +252,22 @@ class DecompressionEngine:
         Returns:
             Statistics about decompression process
         """
-        # Read DEPLOYABLE file
-        with open(deployable_path, 'r', encoding='utf-8') as f:
-            full_text = f.read()
-
-        # Load dictionaries from file
-        self.load_dictionaries_from_text(full_text)
-
-        # Extract compressed content (after "# 📄 **COMPRESSED CONTENT BEGINS HERE**")
-        content_marker = "# 📄 **COMPRESSED CONTENT BEGINS HERE**"
-        if content_marker in full_text:
-            parts = full_text.split(content_marker, 1)
-            compressed_content = parts[1] if len(parts) > 1 else ""
-        else:
+        # Map the DEPLOYABLE file and decode only the header (dictionaries) and
+        # the compressed content after "# 📄 **COMPRESSED CONTENT BEGINS HERE**"
+        with open(deployable_path, 'rb') as f:
+            marker_at = -1
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    marker_at = mm.find(_CONTENT_MARKER_BYTES)
+                    if marker_at != -1:
+                        header_text = _decode(view[:marker_at])
+                        compressed_content = _decode(view[marker_at + len(_CONTENT_MARKER_BYTES):])
+        if marker_at == -1:
             raise ValueError(f"Content marker not found in {deployable_path}")
 
+        # Load dictionaries from file header
+        self.load_dictionaries_from_text(header_text)
+
         # Decompress content
         decompressed_content = self.decompress(compressed_content)
 
@@ -242,35 +317,51 @@ def decompress_all_platforms(deployable_dir: Path = Path("outputs"),
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
     deployable_files = sorted(deployable_dir.glob("DEPLOYABLE_*.md"))
 
-    for deployable_path in deployable_files:
-        # Generate output filename
+    # Files are independent (own engine each): spread large batches over
+    # worker processes; results come back in file order either way
+    workers = min(os.cpu_count() or 1, len(deployable_files))
+    total_bytes = sum(path.stat().st_size for path in deployable_files)
+    if workers >= 2 and total_bytes > _PARALLEL_DECOMPRESS_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_decompress_one, deployable_files,
+                                    [output_dir] * len(deployable_files)))
+    else:
+        results = [_decompress_one(path, output_dir) for path in deployable_files]
+
+    for deployable_path, stats in zip(deployable_files, results):
         platform_name = deployable_path.stem.replace("DEPLOYABLE_", "")
-        output_path = output_dir / f"DECOMPRESSED_{platform_name}.md"
-
-        # Decompress
-        engine = DecompressionEngine()
-        try:
-            stats = engine.decompress_file(deployable_path, output_path)
-            stats['status'] = 'SUCCESS'
+        if stats['status'] == 'SUCCESS':
             print(f"✅ {platform_name}: {stats['compressed_size']} → {stats['decompressed_size']} chars "
                   f"({stats['expansion_ratio']}x expansion)")
-        except Exception as e:
-            stats = {
-                'deployable_file': str(deployable_path),
-                'output_file': str(output_path),
-                'status': 'FAILED',
-                'error': str(e)
-            }
-            print(f"❌ {platform_name}: Decompression failed - {e}")
-
-        results.append(stats)
+        else:
+            print(f"❌ {platform_name}: Decompression failed - {stats['error']}")
 
     return results
 
 
+def _decompress_one(deployable_path: Path, output_dir: Path) -> Dict:
+    """Decompress one DEPLOYABLE file (module level so worker processes can run it)"""
+    # Generate output filename
+    platform_name = deployable_path.stem.replace("DEPLOYABLE_", "")
+    output_path = output_dir / f"DECOMPRESSED_{platform_name}.md"
+
+    # Decompress
+    engine = DecompressionEngine()
+    try:
+        stats = engine.decompress_file(deployable_path, output_path)
+        stats['status'] = 'SUCCESS'
+    except Exception as e:
+        stats = {
+            'deployable_file': str(deployable_path),
+            'output_file': str(output_path),
+            'status': 'FAILED',
+            'error': str(e)
+        }
+    return stats
+
+
 if __name__ == "__main__":
     """Test decompression engine with DEPLOYABLE files"""
     print("🔄 Context Decompression Engine - Test Mode\n")
@@ -4,9 +4,34 @@ Lossless compression using 3-tier dictionary system
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Tuple, Counter as CounterType
 from collections import Counter
 
+# Maximal word-character runs: exactly the spans \bword\b can match
+_WORD_RUN = re.compile(r'\w+')
+# Same runs, captured: split() alternates [gap, run, gap, run, ..., gap]
+_WORD_RUN_SPLIT = re.compile(r'(\w+)')
+
+
+def _replace_word_runs(text: str, mapping: Dict[str, str]) -> str:
+    """
+    Replace every word run found in mapping, in one pass.
+
+    The output is assembled once from the split parts (one join) instead of
+    re.sub building a Match object and calling back per run.
+    """
+    parts = _WORD_RUN_SPLIT.split(text)
+    get = mapping.get
+    parts[1::2] = [get(run, run) for run in parts[1::2]]
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def _word_pattern(min_length: int, letters: str) -> 're.Pattern':
+    """Whole words of min_length+ letters from the given class, compiled once"""
+    return re.compile(rf'\b[{letters}]{{{min_length},}}\b')
+
 
 class DictionaryCompressor:
     """
@@ -45,6 +70,7 @@ class DictionaryCompressor:
 
         self.dictionary = {}  # code -> word (for decompression)
         self.reverse_dict = {}  # word -> code (for compression)
+        self._pattern_cache: Dict[str, 're.Pattern'] = {}  # code -> \bcode\b
 
     def analyze_frequency(self, text: str, min_length: int = 4) -> CounterType[str]:
         """
@@ -57,11 +83,17 @@ class DictionaryCompressor:
         Returns:
             Counter object with word frequencies
         """
-        # Extract words (alphanumeric, min_length+ chars)
-        words = re.findall(rf'\b[A-Za-z]{{{min_length},}}\b', text)
-        # Convert to lowercase for case-insensitive counting
-        words_lower = [word.lower() for word in words]
-        return Counter(words_lower)
+        # Extract words (alphanumeric, min_length+ chars), lowercased for
+        # case-insensitive counting
+        if text.isascii():
+            # ASCII lower() maps char for char, so lowercase once up front and
+            # count straight from findall (no second list)
+            return Counter(_word_pattern(min_length, 'a-z').findall(text.lower()))
+
+        # Non-ASCII lower() can change lengths/boundaries (e.g. 'İ' -> 'i̇'):
+        # match on the original text, lowercase the matches lazily (map, no
+        # second list; findall still beats a finditer generator by ~30%)
+        return Counter(map(str.lower, _word_pattern(min_length, 'A-Za-z').findall(text)))
 
     def build_dictionary(self, text: str) -> Dict[str, str]:
         """
@@ -77,6 +109,8 @@ class DictionaryCompressor:
         freq = self.analyze_frequency(text)
         # FIXED: Tier 1 disabled, so total capacity = Tier 2 + Tier 3
         total_capacity = len(self.tier2_codes) + len(self.tier3_codes)
+        # most_common(k) is heapq.nlargest(k, ...) internally: O(n log k), ties
+        # kept in first-seen order
         top_words = freq.most_common(total_capacity)
 
         # Clear existing dictionaries
@@ -116,19 +150,12 @@ class DictionaryCompressor:
         if not self.reverse_dict:
             raise ValueError("Dictionary not built. Call build_dictionary() first.")
 
-        compressed = text
-
-        # Sort by word length (longest first) to avoid partial replacements
-        sorted_words = sorted(self.reverse_dict.items(),
-                             key=lambda x: len(x[0]),
-                             reverse=True)
-
-        # Replace each word with its code (CASE-SENSITIVE to preserve original case)
-        for word, code in sorted_words:
-            # Use word boundaries to avoid partial replacements
-            # CRITICAL: No re.IGNORECASE - we only compress lowercase words
-            pattern = r'\b' + re.escape(word) + r'\b'
-            compressed = re.sub(pattern, code, compressed)
+        # Single pass: a \bword\b match is always a whole word-character run,
+        # so look every run up once instead of rescanning per dictionary word
+        # (CASE-SENSITIVE to preserve original case - we only compress lowercase
+        # words). Codes are never dictionary words, so no replacement can feed
+        # another, same as the old longest-first loop.
+        compressed = _replace_word_runs(text, self.reverse_dict)
 
         # PHASE 11.10: Header generation moved to centralized HeaderSystem
         # Return compressed text only - let HeaderSystem handle header creation
@@ -149,17 +176,42 @@ class DictionaryCompressor:
 
         # CRITICAL FIX: Group codes by tier for proper processing order
         # Tier 3 (w###) -> Tier 2 (##) -> Tier 1 (#)
-        tier3_codes = [(k, v) for k, v in dictionary.items() if k.startswith('w')]
-        tier2_codes = [(k, v) for k, v in dictionary.items() if len(k) == 2 and not k.startswith('w')]
-        tier1_codes = [(k, v) for k, v in dictionary.items() if len(k) == 1]
+        # (bucketed in one scan of the dictionary; a 1-char 'w' code lands in
+        # both Tier 3 and Tier 1, as before)
+        tier3_codes, tier2_codes, tier1_codes = [], [], []
+        for entry in dictionary.items():
+            code = entry[0]
+            if code.startswith('w'):
+                tier3_codes.append(entry)
+            elif len(code) == 2:
+                tier2_codes.append(entry)
+            if len(code) == 1:
+                tier1_codes.append(entry)
+        tiers = [tier3_codes, tier2_codes, tier1_codes]
+
+        # Fast path: every code is a whole word-character run and no decoded
+        # word contains a code (or a re.sub escape), so tier order cannot
+        # matter - one pass covering all tiers (w### included). Always true
+        # for build_dictionary() output.
+        lookup = {}
+        for tier in reversed(tiers):
+            lookup.update(tier)
+        if all(_WORD_RUN.fullmatch(code) for code in lookup) and not any(
+            '\\' in word or any(run in lookup for run in _WORD_RUN.findall(word))
+            for word in lookup.values()
+        ):
+            return _replace_word_runs(decompressed, lookup)
 
         # Process in order: longest codes first to prevent partial matches
-        for tier in [tier3_codes, tier2_codes, tier1_codes]:
+        pattern_cache = self._pattern_cache
+        for tier in tiers:
             for code, word in tier:
                 # Use word boundaries - works because all codes are ≥4 chars (except tier1/2)
                 # And file extensions like .md, .py are not in our dictionary
-                pattern = r'\b' + re.escape(code) + r'\b'
-                decompressed = re.sub(pattern, word, decompressed)
+                pattern = pattern_cache.get(code)
+                if pattern is None:
+                    pattern = pattern_cache[code] = re.compile(r'\b' + re.escape(code) + r'\b')
+                decompressed = pattern.sub(word, decompressed)
 
         return decompressed
 
@@ -8,9 +8,234 @@ This module is designed to work INLINE in the compression pipeline,
 ensuring dictionaries are created from pre-cleaned content.
 """
 
+import hashlib
+import heapq
+import json
+import os
 import re
+import string
 from collections import Counter, defaultdict
-from typing import Dict, Tuple, List
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple, List, Optional
+
+try:
+    import orjson  # Optional: faster cache reads/writes, same JSON
+except ImportError:
+    orjson = None
+
+
+def _source_version() -> str:
+    """Hash of this module's source: any edit to the generator retires old cache entries"""
+    try:
+        return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=6).hexdigest()
+    except OSError:
+        return "unversioned"
+
+
+# Part of every cache file name; entries from other versions are deleted on the next store
+_CACHE_VERSION = _source_version()
+
+# Cache entries kept per directory (one per input text + settings); the least
+# recently written are deleted beyond this
+_CACHE_MAX_ENTRIES = 16
+
+# Phrase/word counting switches to per-chunk worker processes above this input
+# size; below it, process start-up costs more than the counting itself
+_PARALLEL_COUNT_THRESHOLD = 200_000
+
+# In-process memo of phrase/word frequency tables: (count fn, BLAKE2b of text)
+# -> Counter. Conservative and aggressive runs over the same text (main's
+# compare mode, tuning loops) count once. Oldest entry is dropped past the cap.
+_COUNT_CACHE: Dict[tuple, Counter] = {}
+_COUNT_CACHE_SIZE = 8
+
+# Safe chunk boundary: right after a char that is neither a word char nor
+# whitespace, at the end of a line. No phrase/word match can span it, and
+# \b evaluates the same on both sides of the cut.
+_CHUNK_BOUNDARY = re.compile(r'[^\w\s](?=\n)')
+
+# Counting walks the text in slices of about this many chars (cut at
+# _CHUNK_BOUNDARY): findall per slice keeps C-speed matching while only one
+# slice's matches are alive at a time
+_COUNT_SLICE_CHARS = 65_536
+
+# Template patterns
+# 1. Constitutional headers with Thai translations
+#    #### **📜 Constitutional Basis:**\n**รากฐานรัธรีมนูญ**
+_TEMPLATE_HEADER = re.compile(r'#### \*\*[📜📊🏗️💡🎯🧠][^*]+\*\*')
+# 2. Bold labels with structure
+#    **📜 Constitutional Basis:**
+_TEMPLATE_LABEL = re.compile(r'\*\*[📜📊🏗️💡🎯🧠][^*]{10,50}\*\*')
+# 3. List item prefixes
+#    - **Success Indicators**: 
+_TEMPLATE_LIST_PREFIX = re.compile(r'- \*\*[A-Z][a-z]+ [A-Z][a-z]+\*\*: ')
+
+# Potential phrases (2-5 words) and words (4+ letters), any case
+_PHRASE_PATTERN = re.compile(r'\b[A-Za-z]+(?:\s+[A-Za-z]+){1,4}\b')
+_WORD_PATTERN = re.compile(r'\b[A-Za-z]{4,}\b')
+_WORD_MIN_CHARS = 4
+
+# ASCII non-word chars (not [A-Za-z0-9_]) -> space, for the ASCII word fast path
+_ASCII_NONWORD_TO_SPACE = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
+
+_THAI_PATTERN = re.compile(r'[\u0E00-\u0E7F]')
+
+# Code tables, built once: €a..€z then €aa..€zz (phrases), $A..$Z and
+# ฿a..฿z then ฿aa..฿zz (conservative word tiers)
+_PHRASE_CODES = (
+    tuple(f"€{a}" for a in string.ascii_lowercase)
+    + tuple(f"€{a}{b}" for a in string.ascii_lowercase for b in string.ascii_lowercase)
+)
+_DOLLAR_CODES = tuple(f"${c}" for c in string.ascii_uppercase)
+_BAHT_CODES = (
+    tuple(f"฿{a}" for a in string.ascii_lowercase)
+    + tuple(f"฿{a}{b}" for a in string.ascii_lowercase for b in string.ascii_lowercase)
+)
+
+# Word dictionary size cap, and the aggressive-mode codes for every sequential
+# id below it, as (base, zero-pad width, codes): code = f"${base + id:0{width}d}"
+_MAX_WORD_CODES = 800
+_AGGRESSIVE_LONG = (100, 1, tuple(f"${100 + i}" for i in range(_MAX_WORD_CODES)))
+_AGGRESSIVE_MEDIUM = (1000, 3, tuple(f"${1000 + i:03d}" for i in range(_MAX_WORD_CODES)))
+_AGGRESSIVE_SHORT = (10000, 4, tuple(f"${10000 + i:04d}" for i in range(_MAX_WORD_CODES)))
+
+
+def _iter_slices(text: str, size: int = _COUNT_SLICE_CHARS) -> Iterator[str]:
+    """Consecutive pieces of text, each cut at the first safe boundary past size chars"""
+    start = 0
+    while len(text) - start > size:
+        match = _CHUNK_BOUNDARY.search(text, start + size)
+        if match is None:
+            break
+        yield text[start:match.end()]
+        start = match.end()
+    yield text[start:]
+
+
+def _count_lowercase(pattern: 're.Pattern', text: str) -> Counter:
+    """Case-insensitive frequency count of pattern matches in text"""
+    counts = Counter()
+    for piece in _iter_slices(text):
+        counts.update(map(str.lower, pattern.findall(piece)))
+    return counts
+
+
+# Module-level partial: picklable for worker processes, and a stable memo key
+_count_phrases = partial(_count_lowercase, _PHRASE_PATTERN)
+
+
+def _count_words(text: str) -> Counter:
+    """
+    Same counts as _count_lowercase(_WORD_PATTERN, text), tokenized in C.
+
+    On ASCII text, blanking non-word chars and splitting yields exactly the
+    word-char runs; a run is a _WORD_PATTERN match iff it is all letters
+    (digits or '_' inside a run leave no word boundary for the pattern).
+    ~2.5x faster than the regex; non-ASCII slices keep the regex (translate
+    has no fast path there).
+    """
+    counts = Counter()
+    for piece in _iter_slices(text):
+        if piece.isascii():
+            counts.update([
+                token for token in piece.lower().translate(_ASCII_NONWORD_TO_SPACE).split()
+                if len(token) >= _WORD_MIN_CHARS and token.isalpha()
+            ])
+        else:
+            counts.update(map(str.lower, _WORD_PATTERN.findall(piece)))
+    return counts
+
+
+def _ranked(freq: Counter, min_count: int, min_length: int = 0,
+            head: Optional[int] = None) -> Iterator[Tuple[str, int]]:
+    """
+    Entries with count >= min_count and len >= min_length, most common first.
+
+    Filtering before the sort means only survivors are sorted, not every
+    singleton; the sort is stable, so ties keep most_common()'s first-seen order.
+    With head, the first head entries come from heapq.nlargest (O(U log head));
+    the rest are only sorted if the caller keeps iterating past them.
+    """
+    candidates = [
+        (key, count) for key, count in freq.items()
+        if count >= min_count and len(key) >= min_length
+    ]
+    if head is not None and head < len(candidates):
+        # nlargest(n) is documented equal to sorted(..., reverse=True)[:n]
+        yield from heapq.nlargest(head, candidates, key=itemgetter(1))
+        candidates.sort(key=itemgetter(1), reverse=True)
+        yield from candidates[head:]
+        return
+
+    candidates.sort(key=itemgetter(1), reverse=True)
+    yield from candidates
+
+
+def _split_chunks(text: str, n_chunks: int) -> List[str]:
+    """Split text into ~n_chunks pieces at safe boundaries (see _CHUNK_BOUNDARY)"""
+    chunks = []
+    start = 0
+    for i in range(1, n_chunks):
+        match = _CHUNK_BOUNDARY.search(text, max(start, len(text) * i // n_chunks))
+        if match is None:
+            break
+        chunks.append(text[start:match.end()])
+        start = match.end()
+    chunks.append(text[start:])
+    return chunks
+
+
+def _count_matches(counts: Tuple[Callable[[str], Counter], ...], text: str) -> List[Counter]:
+    """
+    Lowercased match counts from each count(), memoized per text (see
+    _COUNT_CACHE); the ones not cached yet are counted in one shared pass.
+
+    The returned Counters are shared with the cache: treat them as read-only.
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    found = {count: _COUNT_CACHE.get((count, digest)) for count in counts}
+    missing = tuple(count for count, total in found.items() if total is None)
+    if missing:
+        for count, total in zip(missing, _count_chunked(missing, text)):
+            if len(_COUNT_CACHE) >= _COUNT_CACHE_SIZE:
+                del _COUNT_CACHE[next(iter(_COUNT_CACHE))]
+            _COUNT_CACHE[(count, digest)] = found[count] = total
+    return [found[count] for count in counts]
+
+
+def _count_each(counts: Tuple[Callable[[str], Counter], ...], text: str) -> List[Counter]:
+    """Run every counter over the same text (one chunk in a worker)"""
+    return [count(text) for count in counts]
+
+
+def _count_chunked(counts: Tuple[Callable[[str], Counter], ...], text: str) -> List[Counter]:
+    """
+    Lowercased match counts from each count(); large inputs are split once and
+    every chunk is counted by all counters in the same worker (counters must be
+    picklable: module-level or a partial).
+
+    Chunk counters are merged in text order, so keys keep first-occurrence
+    order and most_common() ties break exactly as in a serial count.
+    """
+    workers = os.cpu_count() or 1
+    if len(text) <= _PARALLEL_COUNT_THRESHOLD or workers < 2:
+        return _count_each(counts, text)
+
+    chunks = _split_chunks(text, workers)
+    if len(chunks) < 2:
+        return _count_each(counts, text)
+
+    totals = [Counter() for _ in counts]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        for chunk_counts in pool.map(_count_each, [counts] * len(chunks), chunks):
+            for total, chunk_total in zip(totals, chunk_counts):
+                total.update(chunk_total)
+    return totals
 
 
 class DictionaryGenerator:
@@ -39,12 +264,15 @@ class DictionaryGenerator:
         self.min_word_frequency = min_word_frequency
         self.enable_aggressive_compression = enable_aggressive_compression
     
-    def generate_all_dictionaries(self, clean_text: str) -> Tuple[Dict, Dict, Dict, Dict]:
+    def generate_all_dictionaries(self, clean_text: str,
+                                  cache_dir: Optional[Path] = None) -> Tuple[Dict, Dict, Dict, Dict]:
         """
         Generate all three dictionaries from clean content.
         
         Args:
             clean_text: Text after Layer 1 (Thai removal) and Layer 2 (Diagram removal)
+            cache_dir: Optional directory for memoized results, keyed by a hash of
+                       clean_text and the generator settings (None = no caching)
         
         Returns:
             (template_dict, phrase_dict, word_dict, stats)
@@ -52,7 +280,19 @@ class DictionaryGenerator:
         print("🔧 Generating dictionaries from clean content...")
         print(f"   Input size: {len(clean_text):,} chars")
         print()
+
+        cache_path = self._cache_path(clean_text, cache_dir) if cache_dir is not None else None
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                print(f"♻️  Reusing cached dictionaries: {cache_path.name}")
+                self._print_summary(*cached)
+                return cached
         
+        # Count phrases and words together up front (one chunk split and
+        # worker pool for large inputs); the generators below read the memo
+        _count_matches((_count_phrases, _count_words), clean_text)
+
         # Generate each dictionary
         template_dict, template_stats = self.generate_template_dictionary(clean_text)
         phrase_dict, phrase_stats = self.generate_phrase_dictionary(clean_text)
@@ -66,14 +306,80 @@ class DictionaryGenerator:
             'total_entries': len(template_dict) + len(phrase_dict) + len(word_dict)
         }
         
+        self._print_summary(template_dict, phrase_dict, word_dict, stats)
+
+        result = (template_dict, phrase_dict, word_dict, stats)
+        if cache_path is not None:
+            self._store_cached(cache_path, result)
+
+        return result
+
+    @staticmethod
+    def _print_summary(template_dict: Dict, phrase_dict: Dict, word_dict: Dict, stats: Dict) -> None:
+        """Print dictionary generation summary"""
         print(f"✅ Dictionary generation complete:")
-        print(f"   - Templates: {len(template_dict):>4} entries ({template_stats['total_savings']:,} chars potential)")
-        print(f"   - Phrases:   {len(phrase_dict):>4} entries ({phrase_stats['total_savings']:,} chars potential)")
-        print(f"   - Words:     {len(word_dict):>4} entries ({word_stats['total_savings']:,} chars potential)")
+        print(f"   - Templates: {len(template_dict):>4} entries ({stats['template_stats']['total_savings']:,} chars potential)")
+        print(f"   - Phrases:   {len(phrase_dict):>4} entries ({stats['phrase_stats']['total_savings']:,} chars potential)")
+        print(f"   - Words:     {len(word_dict):>4} entries ({stats['word_stats']['total_savings']:,} chars potential)")
         print(f"   - Total:     {stats['total_entries']:>4} entries")
         print()
-        
-        return template_dict, phrase_dict, word_dict, stats
+
+    def _cache_path(self, clean_text: str, cache_dir: Path) -> Path:
+        """Cache file for this input + generator settings (BLAKE2b-128 of the text)"""
+        text_key = hashlib.blake2b(clean_text.encode('utf-8'), digest_size=16).hexdigest()
+        settings = (
+            f"v{_CACHE_VERSION}_{self.min_template_savings}_{self.min_phrase_length}_"
+            f"{self.min_word_length}_{self.min_word_frequency}_{self.enable_aggressive_compression}"
+        )
+        return Path(cache_dir) / f"{text_key}_{settings}.json"
+
+    @staticmethod
+    def _load_cached(cache_path: Path) -> Optional[Tuple[Dict, Dict, Dict, Dict]]:
+        """Load memoized dictionaries; None on miss or unreadable entry"""
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            # Plain JSON (never pickle): a planted cache file can only supply data
+            cached = orjson.loads(data) if orjson is not None else json.loads(data)
+            if not (isinstance(cached, list) and len(cached) == 4
+                    and all(isinstance(part, dict) for part in cached)):
+                raise ValueError("expected [template_dict, phrase_dict, word_dict, stats]")
+            return tuple(cached)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Warning: Ignoring unreadable dictionary cache {cache_path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _store_cached(cache_path: Path, result: Tuple[Dict, Dict, Dict, Dict]) -> None:
+        """
+        Write memoized dictionaries atomically (best effort), then prune the
+        directory: other versions' entries go, and only the newest
+        _CACHE_MAX_ENTRIES entries are kept.
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                data = orjson.dumps(list(result))
+            else:
+                data = json.dumps(list(result), ensure_ascii=False).encode('utf-8')
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+
+            current = []
+            for entry_path in cache_path.parent.glob("*.json"):
+                if f"_v{_CACHE_VERSION}_" in entry_path.name:
+                    current.append((entry_path.stat().st_mtime_ns, entry_path))
+                else:
+                    entry_path.unlink()
+            current.sort(reverse=True)
+            for _, entry_path in current[_CACHE_MAX_ENTRIES:]:
+                entry_path.unlink()
+        except OSError as e:
+            print(f"⚠️ Warning: Could not write dictionary cache: {e}")
     
     def generate_template_dictionary(self, text: str) -> Tuple[Dict, Dict]:
         """
@@ -85,21 +391,21 @@ class DictionaryGenerator:
         - Repeated formatted structures
         """
         templates = {}
-        
+
+        # Three separate passes on purpose: each pattern starts with a literal
+        # ('####', '**', '- **') the regex engine jumps to with a fast prefix
+        # search, which a fused (?P<p1>..)|(?P<p2>..)|(?P<p3>..) alternation
+        # loses (measured ~8-10x slower). A single scan would also stop
+        # counting pattern-2 labels nested inside pattern-1 headers.
+
         # Pattern 1: Constitutional headers with Thai translations
-        # #### **📜 Constitutional Basis:**\n**รากฐานรัธรีมนูญ**
-        pattern1 = r'#### \*\*[📜📊🏗️💡🎯🧠][^*]+\*\*'
-        matches1 = re.findall(pattern1, text)
+        matches1 = _TEMPLATE_HEADER.findall(text)
         
         # Pattern 2: Bold labels with structure
-        # **📜 Constitutional Basis:**
-        pattern2 = r'\*\*[📜📊🏗️💡🎯🧠][^*]{10,50}\*\*'
-        matches2 = re.findall(pattern2, text)
+        matches2 = _TEMPLATE_LABEL.findall(text)
         
         # Pattern 3: List item prefixes
-        # - **Success Indicators**: 
-        pattern3 = r'- \*\*[A-Z][a-z]+ [A-Z][a-z]+\*\*: '
-        matches3 = re.findall(pattern3, text)
+        matches3 = _TEMPLATE_LIST_PREFIX.findall(text)
         
         # Count frequencies
         all_patterns = matches1 + matches2 + matches3
@@ -109,17 +415,16 @@ class DictionaryGenerator:
         template_id = 1
         total_savings = 0
         
-        for pattern, count in pattern_freq.most_common():
-            if count >= 2:  # Appears at least twice
-                savings = (len(pattern) - 3) * count  # "T1" = 2 chars + newline
-                if savings >= self.min_template_savings:
-                    code = f"T{template_id}"
-                    templates[code] = pattern
-                    total_savings += savings
-                    template_id += 1
+        for pattern, count in _ranked(pattern_freq, 2, head=40):  # Appears at least twice
+            savings = (len(pattern) - 3) * count  # "T1" = 2 chars + newline
+            if savings >= self.min_template_savings:
+                code = f"T{template_id}"
+                templates[code] = pattern
+                total_savings += savings
+                template_id += 1
                     
-                    if template_id > 20:  # Limit to top 20 templates
-                        break
+                if template_id > 20:  # Limit to top 20 templates
+                    break
         
         stats = {
             'total_patterns_found': len(pattern_freq),
@@ -140,32 +445,28 @@ class DictionaryGenerator:
         """
         # Extract all potential phrases (2-5 words) - case-insensitive
         # Changed from r'\b[A-Z][a-z]+...' (capitalized only) to r'\b[A-Za-z]+...' (all words)
-        phrase_pattern = r'\b[A-Za-z]+(?:\s+[A-Za-z]+){1,4}\b'
-        potential_phrases = re.findall(phrase_pattern, text)
-
-        # Normalize to lowercase for case-insensitive counting
-        potential_phrases = [p.lower() for p in potential_phrases]
-        
-        # Count frequencies
-        phrase_freq = Counter(potential_phrases)
+        # Count frequencies, normalized to lowercase for case-insensitive counting
+        # Phrases stay whole-word runs on purpose (not suffix-array maximal
+        # repeats): PhraseCompressor matches them case-insensitively and the
+        # word stage runs after it, so a code must never cut a word or markup
+        phrase_freq = _count_matches((_count_phrases,), text)[0]
         
         # Filter valuable phrases
         phrases = {}
         phrase_id = 1
         total_savings = 0
         
-        for phrase, count in phrase_freq.most_common():
-            if len(phrase) >= self.min_phrase_length and count >= 3:
-                savings = (len(phrase) - 4) * count  # "€abc" = 4 chars
-                if savings > 20:  # Minimum 20 chars savings
-                    # Generate compact code
-                    code = self._generate_phrase_code(phrase_id)
-                    phrases[code] = phrase
-                    total_savings += savings
-                    phrase_id += 1
+        for phrase, count in _ranked(phrase_freq, 3, self.min_phrase_length, head=500):
+            savings = (len(phrase) - 4) * count  # "€abc" = 4 chars
+            if savings > 20:  # Minimum 20 chars savings
+                # Generate compact code
+                code = self._generate_phrase_code(phrase_id)
+                phrases[code] = phrase
+                total_savings += savings
+                phrase_id += 1
                     
-                    if phrase_id > 250:  # Limit to top 250 phrases
-                        break
+                if phrase_id > 250:  # Limit to top 250 phrases
+                    break
         
         stats = {
             'potential_phrases': len(phrase_freq),
@@ -187,23 +488,17 @@ class DictionaryGenerator:
         """
         # Extract all words (alphanumeric, 4+ chars) - case-insensitive
         # Changed from r'\b[A-Z][a-z]{3,}\b' (capitalized only) to r'\b[A-Za-z]{4,}\b' (all words)
-        word_pattern = r'\b[A-Za-z]{4,}\b'
-        potential_words = re.findall(word_pattern, text)
-
-        # Normalize to lowercase for case-insensitive counting
+        # Count frequencies, normalized to lowercase for case-insensitive counting
         # This ensures "User", "user", "USER" are treated as the same word
-        potential_words = [w.lower() for w in potential_words]
-
-        # Count frequencies
-        word_freq = Counter(potential_words)
+        word_freq = _count_matches((_count_words,), text)[0]
 
         # Filter valuable words
         words = {}
         total_savings = 0
 
         # Use multiple tiers based on compression strategy
-        dollar_id = ord('A')  # $A, $B, ... $Z
-        baht_id = ord('a')    # ฿a, ฿b, ... ฿z, ฿aa, ฿ab, ...
+        dollar_id = 0  # _DOLLAR_CODES index: $A, $B, ... $Z
+        baht_id = 0    # _BAHT_CODES index: ฿a, ฿b, ... ฿z, ฿aa, ฿ab, ...
         next_code_id = 0      # Sequential ID for aggressive mode
 
         # Determine frequency threshold based on mode
@@ -215,55 +510,54 @@ class DictionaryGenerator:
         if self.enable_aggressive_compression:
             print("   🚀 Aggressive compression mode enabled")
 
-        for word, count in word_freq.most_common():
-            if len(word) >= self.min_word_length and count >= min_freq:
-                # Calculate code length based on word length (aggressive mode)
-                if self.enable_aggressive_compression:
-                    word_len = len(word)
-                    if word_len >= 10:
-                        code_len = 2  # $##
-                    elif word_len >= 7:
-                        code_len = 3  # $###
-                    else:
-                        code_len = 4  # $####
-                    savings = (word_len - code_len) * count
-                    # For aggressive mode, include negative savings for very long words
-                    min_savings = -5 if word_len >= 10 else 0
+        aggressive = self.enable_aggressive_compression
+        for word, count in _ranked(word_freq, min_freq, self.min_word_length, head=1600):
+            # Calculate code length based on word length (aggressive mode)
+            if aggressive:
+                word_len = len(word)
+                if word_len >= 10:
+                    code_len = 2  # $##
+                elif word_len >= 7:
+                    code_len = 3  # $###
+                else:
+                    code_len = 4  # $####
+                savings = (word_len - code_len) * count
+                # For aggressive mode, include negative savings for very long words
+                min_savings = -5 if word_len >= 10 else 0
+            else:
+                savings = (len(word) - 2) * count  # "$A" = 2 chars
+                # Long-term fix #2: Lowered savings threshold from 15 to 10
+                # Rationale: Captures medium-length words (8-10 chars) with 2-3 occurrences
+                # Example: "acceptance" (10 chars × 2 = 16), "Structure" (9 chars × 3 = 21)
+                min_savings = 10
+
+            if savings >= min_savings:
+                # Assign code based on frequency and word length
+                if aggressive:
+                    # Aggressive mode: smart code assignment
+                    code = self._assign_aggressive_word_code(word, count, next_code_id)
+                    next_code_id += 1
                 else:
-                    savings = (len(word) - 2) * count  # "$A" = 2 chars
-                    # Long-term fix #2: Lowered savings threshold from 15 to 10
-                    # Rationale: Captures medium-length words (8-10 chars) with 2-3 occurrences
-                    # Example: "acceptance" (10 chars × 2 = 16), "Structure" (9 chars × 3 = 21)
-                    min_savings = 10
-
-                if savings >= min_savings:
-                    # Assign code based on frequency and word length
-                    if self.enable_aggressive_compression:
-                        # Aggressive mode: smart code assignment
-                        code = self._assign_aggressive_word_code(word, count, next_code_id)
-                        next_code_id += 1
+                    # Conservative mode: simple tiering
+                    # Tier 1: Very frequent (count ≥ 20) → $Code
+                    if count >= 20 and dollar_id < len(_DOLLAR_CODES):
+                        code = _DOLLAR_CODES[dollar_id]
+                        dollar_id += 1
+                    # Tier 2: Frequent (count ≥ 5) → ฿code
                     else:
-                        # Conservative mode: simple tiering
-                        # Tier 1: Very frequent (count ≥ 20) → $Code
-                        if count >= 20 and dollar_id <= ord('Z'):
-                            code = f"${chr(dollar_id)}"
-                            dollar_id += 1
-                        # Tier 2: Frequent (count ≥ 5) → ฿code
+                        if baht_id < len(_BAHT_CODES):
+                            code = _BAHT_CODES[baht_id]
                         else:
-                            if baht_id <= ord('z'):
-                                code = f"฿{chr(baht_id)}"
-                                baht_id += 1
-                            else:
-                                # Extended: ฿aa, ฿ab, ...
-                                ext_id = baht_id - ord('z') - 1
-                                code = f"฿{chr(ord('a') + ext_id // 26)}{chr(ord('a') + ext_id % 26)}"
-                                baht_id += 1
+                            # Past ฿zz: continue the same arithmetic as before
+                            ext_id = baht_id - 26
+                            code = f"฿{chr(ord('a') + ext_id // 26)}{chr(ord('a') + ext_id % 26)}"
+                        baht_id += 1
 
-                    words[code] = word
-                    total_savings += savings
+                words[code] = word
+                total_savings += savings
 
-                    if len(words) >= 800:  # Higher limit for aggressive mode
-                        break
+                if len(words) >= _MAX_WORD_CODES:  # Higher limit for aggressive mode
+                    break
 
         stats = {
             'potential_words': len(word_freq),
@@ -290,19 +584,23 @@ class DictionaryGenerator:
         word_len = len(word)
 
         # Very frequent words get shortest codes regardless of length
-        if count >= 20 and next_code_id < 26:
-            return f"${chr(ord('A') + next_code_id)}"
+        if count >= 20 and next_code_id < len(_DOLLAR_CODES):
+            return _DOLLAR_CODES[next_code_id]
 
         # Smart assignment based on word length
         if word_len >= 10:
             # Long words get 2-digit codes: $100, $101, ...
-            return f"${100 + next_code_id}"
+            base, width, codes = _AGGRESSIVE_LONG
         elif word_len >= 7:
             # Medium words get 3-digit codes: $001, $002, ...
-            return f"${1000 + next_code_id:03d}"
+            base, width, codes = _AGGRESSIVE_MEDIUM
         else:
             # Short words get 4-digit codes: $0001, $0002, ...
-            return f"${10000 + next_code_id:04d}"
+            base, width, codes = _AGGRESSIVE_SHORT
+
+        if next_code_id < len(codes):
+            return codes[next_code_id]
+        return f"${base + next_code_id:0{width}d}"
     
     def _generate_phrase_code(self, phrase_id: int) -> str:
         """
@@ -314,17 +612,10 @@ class DictionaryGenerator:
         Returns:
             Code like "€f", "€am", "€abc"
         """
-        # Single letter for first 26
-        if phrase_id <= 26:
-            return f"€{chr(ord('a') + phrase_id - 1)}"
-        
-        # Two letters for next 676 (26^2)
-        elif phrase_id <= 26 + 676:
-            idx = phrase_id - 27
-            first = chr(ord('a') + idx // 26)
-            second = chr(ord('a') + idx % 26)
-            return f"€{first}{second}"
-        
+        # Single letter for first 26, two letters for next 676 (26^2)
+        if phrase_id <= len(_PHRASE_CODES):
+            return _PHRASE_CODES[phrase_id - 1]
+
         # Three letters for more
         else:
             idx = phrase_id - 27 - 676
@@ -348,7 +639,7 @@ def main():
 
     if not layer2_path.exists():
         print(f"❌ ERROR: {layer2_path} not found")
-        print("   Run compress_full_pipeline.py first to generate layer2 output")
+        print("   Run compress_full_pipeline.py --debug first to generate layer2 output")
         return 1
 
     print(f"📖 Loading clean content: {layer2_path}")
@@ -432,12 +723,10 @@ def main():
     print("🔍 VERIFICATION: Checking for Thai content in dictionaries")
     print("=" * 80)
     
-    thai_pattern = r'[\u0E00-\u0E7F]'
-    
     def count_thai(d):
         count = 0
         for value in d.values():
-            if re.search(thai_pattern, value):
+            if _THAI_PATTERN.search(value):
                 count += 1
         return count
     
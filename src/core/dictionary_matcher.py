@@ -0,0 +1,162 @@
+"""
+Dictionary Matcher - Single-pass dictionary replacement for Layer 3.
+
+Constitutional Basis:
+- Template, phrase and word compression each replace every dictionary entry
+  found in the text with its code, longest entry first
+- One compiled alternation scans the text once instead of one regex pass per
+  dictionary entry (O(N) scans instead of O(N·K)) whenever that gives the
+  same result as the per-entry loop (see Matching order)
+- PRODUCTION MODULE: Standalone, NO external dependencies
+
+Example:
+  matcher = DictionaryMatcher({'$A': 'context', '$B': 'compression'},
+                              ignore_case=True, word_boundary=True)
+  text, count, saved = matcher.replace("Context compression")
+  # text == "$A $B", count == 2, saved == 14
+
+Matching order:
+- The reference rule is the former per-entry loop: entries are replaced one
+  at a time, longest first, each across the whole text. With
+  {'€a': 'alpha beta', '€b': 'beta gamma delta'}, "alpha beta gamma delta"
+  becomes "alpha €b" (the longer entry claims "beta" first)
+- A single leftmost-first alternation would give "€a gamma delta" there, so
+  replace() first scans for the longest entry starting at each position. If
+  no two of those spans cross (each pair is disjoint or nested), the loop
+  claims exactly the outermost spans, which is what the alternation picks,
+  and the alternation is used. Otherwise (and for word_boundary entries not
+  starting and ending with a word character, whose \\b depends on earlier
+  replacements) replace() runs the loop
+- Codes are assumed not to form new matches with neighbouring text (true for
+  the generated T/€/$/฿ codes), as the loop's sequential rewrites would allow
+- Codes are looked up by matched text (lowercased when ignoring case); the
+  rare matches whose lowercase differs from the entry's (e.g. U+017F LONG S
+  vs "s") fall back to finding the first entry that fullmatches
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+
+# Entry starts and ends with a word character (or is a single one)
+_WORD_EDGES = re.compile(r'\w(?:.*\w)?\Z', re.DOTALL)
+# Entry is word characters only
+_WORD_ONLY = re.compile(r'\w+\Z')
+
+
+class DictionaryMatcher:
+    """Replace all entries of a code -> text dictionary in one regex pass"""
+
+    def __init__(self, code_to_text: Dict[str, str], ignore_case: bool = False,
+                 word_boundary: bool = False):
+        """
+        Build the alternation for a dictionary.
+
+        Args:
+            code_to_text: Dictionary mapping code -> original text
+            ignore_case: Match entries case-insensitively
+            word_boundary: Only match whole words (\\b on both sides)
+        """
+        # Reverse mapping: text -> code (later codes win, as before)
+        text_to_code = {text: code for code, text in code_to_text.items()}
+
+        # Longest first for greedy matching
+        ordered = sorted(text_to_code, key=len, reverse=True)
+
+        self._ignore_case = ignore_case
+        self._ordered = ordered
+        self._flags = re.IGNORECASE if ignore_case else 0
+        self._text_to_code = text_to_code
+        self._word_boundary = word_boundary
+
+        # \b entries with a non-word first/last char always take the per-entry
+        # loop: their boundaries depend on what earlier replacements put next
+        # to them (see module docstring)
+        self._sequential = word_boundary and not all(_WORD_EDGES.match(text) for text in ordered)
+
+        # Matched text (lowercased if ignoring case) -> (code, chars saved per match);
+        # setdefault keeps the longest/first entry when keys collide
+        self._lookup: Dict[str, Tuple[str, int]] = {}
+        for text in ordered:
+            code = text_to_code[text]
+            key = text.lower() if ignore_case else text
+            self._lookup.setdefault(key, (code, len(text) - len(code)))
+
+        self._pattern: Optional[re.Pattern] = None
+        self._spans_pattern: Optional[re.Pattern] = None
+        if ordered:
+            alternation = '|'.join(map(re.escape, ordered))
+            if word_boundary:
+                alternation = r'\b(?:' + alternation + r')\b'
+            self._pattern = re.compile(alternation, self._flags)
+            # Longest entry starting at every position (zero-width, overlapping);
+            # not needed when every entry is a \b-bounded run of word chars,
+            # whose occurrences can never partially overlap
+            if not (word_boundary and all(_WORD_ONLY.match(text) for text in ordered)):
+                self._spans_pattern = re.compile(f'(?=({alternation}))', self._flags)
+
+    def _resolve(self, matched: str) -> Tuple[str, int]:
+        """Find the entry for a case-insensitive match whose lowercase differs"""
+        for text in self._ordered:
+            if re.fullmatch(re.escape(text), matched, self._flags):
+                return self._lookup[text.lower()]
+        raise KeyError(matched)
+
+    def replace(self, text: str) -> Tuple[str, int, int]:
+        """
+        Replace every dictionary entry in text with its code.
+
+        Returns:
+            (replaced_text, replacements, chars_saved)
+        """
+        if self._pattern is None:
+            return text, 0, 0
+        if self._sequential or self._spans_cross(text):
+            return self._replace_sequential(text)
+
+        lookup = self._lookup
+        ignore_case = self._ignore_case
+        replacements = 0
+        chars_saved = 0
+
+        def _substitute(match):
+            nonlocal replacements, chars_saved
+            matched = match.group(0)
+            entry = lookup.get(matched.lower() if ignore_case else matched)
+            if entry is None:
+                entry = self._resolve(matched)
+            code, saved = entry
+            replacements += 1
+            chars_saved += saved
+            return code
+
+        return self._pattern.sub(_substitute, text), replacements, chars_saved
+
+    def _spans_cross(self, text: str) -> bool:
+        """True if two longest-per-position entry spans in text partially overlap"""
+        if self._spans_pattern is None:
+            return False
+        open_ends = []  # Ends of the spans enclosing the current position, innermost last
+        for match in self._spans_pattern.finditer(text):
+            start = match.start()
+            end = start + len(match.group(1))
+            while open_ends and open_ends[-1] <= start:
+                open_ends.pop()
+            if open_ends and end > open_ends[-1]:
+                return True
+            open_ends.append(end)
+        return False
+
+    def _replace_sequential(self, text: str) -> Tuple[str, int, int]:
+        """Per-entry loop: each entry across the whole text, longest first"""
+        replacements = 0
+        chars_saved = 0
+        for entry in self._ordered:
+            code = self._text_to_code[entry]
+            pattern = re.escape(entry)
+            if self._word_boundary:
+                pattern = r'\b' + pattern + r'\b'
+            text, count = re.subn(pattern, lambda _match: code, text, flags=self._flags)
+            replacements += count
+            chars_saved += (len(entry) - len(code)) * count
+        return text, replacements, chars_saved
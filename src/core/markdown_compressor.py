@@ -11,8 +11,28 @@ Compression strategies:
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple, Dict
 
+# Raw (pattern, flags), compiled once per process by _patterns()
+_RAW_PATTERNS = {
+    'bold': (r'\*\*([^\*]+)\*\*', 0),
+    'bullet': (r'^- ', re.MULTILINE),
+    'code_block': (r'```([^\n]*)', 0),
+    **{f'header_{level}': (f"^{'#' * level} ", re.MULTILINE) for level in (2, 3, 4)},
+    **{f'marker_{level}': (f'^≡{level} ', re.MULTILINE) for level in (2, 3, 4)},
+    # decompress()
+    'pilcrow': (r'¶', 0),
+    'dot_bullet': (r'^• ', re.MULTILINE),
+    'dagger_bold': (r'‡([^‡]+)‡', 0),
+}
+
+
+@lru_cache(maxsize=None)
+def _patterns() -> Dict[str, 're.Pattern']:
+    """Compiled patterns shared by all MarkdownCompressor instances"""
+    return {name: re.compile(pattern, flags) for name, (pattern, flags) in _RAW_PATTERNS.items()}
+
 
 class MarkdownCompressor:
     """Compress markdown syntax overhead"""
@@ -25,6 +45,7 @@ class MarkdownCompressor:
         self.BULLET = '•'       # Bullet point
         self.CODE_BLOCK = '¶'   # Pilcrow
         self.HEADER_PREFIX = '≡' # Identical to
+        self._patterns = _patterns()
 
     def compress(self, text: str) -> Tuple[str, Dict]:
         """
@@ -37,6 +58,7 @@ class MarkdownCompressor:
             Tuple of (compressed_text, stats_dict)
         """
         original_size = len(text)
+        patterns = self._patterns
 
         stats = {
             'original_size': original_size,
@@ -45,9 +67,9 @@ class MarkdownCompressor:
 
         # 1. Compress bold markers (** → ‡)
         # **text** → ‡text‡
-        bold_pattern = r'\*\*([^\*]+)\*\*'
-        bold_matches = re.findall(bold_pattern, text)
-        text = re.sub(bold_pattern, r'‡\1‡', text)
+        bold_pattern = patterns['bold']
+        bold_matches = bold_pattern.findall(text)
+        text = bold_pattern.sub(r'‡\1‡', text)
         stats['compressions']['bold_markers'] = {
             'count': len(bold_matches),
             'savings': len(bold_matches) * 2  # Save 2 chars per bold phrase (4 stars → 2 daggers)
@@ -55,9 +77,9 @@ class MarkdownCompressor:
 
         # 2. Compress list bullets (- → •)
         # Lines starting with "- " → "• "
-        bullet_pattern = r'^- '
-        bullet_lines = len(re.findall(bullet_pattern, text, re.MULTILINE))
-        text = re.sub(bullet_pattern, '• ', text, flags=re.MULTILINE)
+        bullet_pattern = patterns['bullet']
+        bullet_lines = len(bullet_pattern.findall(text))
+        text = bullet_pattern.sub('• ', text)
         stats['compressions']['list_bullets'] = {
             'count': bullet_lines,
             'savings': 0  # Same length, but more compact visually
@@ -66,9 +88,9 @@ class MarkdownCompressor:
         # 3. Compress code blocks (``` → ¶)
         # ```language\n → ¶language\n
         # ``` → ¶
-        code_block_pattern = r'```([^\n]*)'
-        code_blocks = re.findall(code_block_pattern, text)
-        text = re.sub(code_block_pattern, r'¶\1', text)
+        code_block_pattern = patterns['code_block']
+        code_blocks = code_block_pattern.findall(text)
+        text = code_block_pattern.sub(r'¶\1', text)
         stats['compressions']['code_blocks'] = {
             'count': len(code_blocks),
             'savings': len(code_blocks) * 2  # Save 2 chars per block marker (3 backticks → 1 pilcrow)
@@ -80,14 +102,14 @@ class MarkdownCompressor:
         # ## text → ≡2 text
         header_savings = 0
         for level in [4, 3, 2]:  # Process from longest to shortest
-            header_pattern = f"^{'#' * level} "
-            header_matches = len(re.findall(header_pattern, text, re.MULTILINE))
-            text = re.sub(header_pattern, f'≡{level} ', text, flags=re.MULTILINE)
+            header_pattern = patterns[f'header_{level}']
+            header_matches = len(header_pattern.findall(text))
+            text = header_pattern.sub(f'≡{level} ', text)
             # Savings: level hashes → 1 symbol + 1 digit = (level - 2) chars saved
             header_savings += header_matches * (level - 2)
 
         stats['compressions']['headers'] = {
-            'count': sum(len(re.findall(f"^≡{l} ", text, re.MULTILINE)) for l in [2, 3, 4]),
+            'count': sum(len(patterns[f'marker_{l}'].findall(text)) for l in [2, 3, 4]),
             'savings': header_savings
         }
 
@@ -112,19 +134,20 @@ class MarkdownCompressor:
             Decompressed text with original markdown
         """
         # Reverse all compressions
+        patterns = self._patterns
 
         # 1. Restore headers (≡3 → ###)
         for level in [2, 3, 4]:
-            text = re.sub(f'^≡{level} ', '#' * level + ' ', text, flags=re.MULTILINE)
+            text = patterns[f'marker_{level}'].sub('#' * level + ' ', text)
 
         # 2. Restore code blocks (¶ → ```)
-        text = re.sub(r'¶', '```', text)
+        text = patterns['pilcrow'].sub('```', text)
 
         # 3. Restore list bullets (• → -)
-        text = re.sub(r'^• ', '- ', text, flags=re.MULTILINE)
+        text = patterns['dot_bullet'].sub('- ', text)
 
         # 4. Restore bold markers (‡ → **)
-        text = re.sub(r'‡([^‡]+)‡', r'**\1**', text)
+        text = patterns['dagger_bold'].sub(r'**\1**', text)
 
         return text
 
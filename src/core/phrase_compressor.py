@@ -4,11 +4,16 @@ Phrase Compressor - Layer 4
 Phrase-level compression using €code format
 """
 
-import re
 import json
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 from pathlib import Path
 
+# Support both module import and standalone testing
+try:
+    from .dictionary_matcher import DictionaryMatcher
+except ImportError:
+    from dictionary_matcher import DictionaryMatcher
+
 
 class PhraseCompressor:
     """
@@ -44,6 +49,9 @@ class PhraseCompressor:
                 else:
                     self.phrase_dict = {}
 
+        # Built on first compress() (one compiled alternation for all phrases)
+        self._matcher: Optional[DictionaryMatcher] = None
+
     def compress(self, text: str) -> Tuple[str, Dict]:
         """
         Compress phrases using greedy longest-match algorithm
@@ -66,30 +74,10 @@ class PhraseCompressor:
                 'phrases_replaced': 0
             }
 
-        phrases_replaced = 0
-        chars_saved = 0
-
-        # Create reverse mapping: phrase -> code
-        phrase_to_code = {phrase: code for code, phrase in self.phrase_dict.items()}
-
-        # Sort phrases by length (longest first) for greedy matching
-        sorted_phrases = sorted(phrase_to_code.keys(), key=len, reverse=True)
-
-        for phrase in sorted_phrases:
-            code = phrase_to_code[phrase]
-
-            # Escape special regex characters in phrase
-            escaped_phrase = re.escape(phrase)
-
-            # Count occurrences (case-insensitive)
-            count = len(re.findall(escaped_phrase, result, re.IGNORECASE))
-
-            if count > 0:
-                # Replace with code (use simple €code format, case-insensitive)
-                result = re.sub(escaped_phrase, code, result, flags=re.IGNORECASE)
-                phrases_replaced += count
-                # Calculate savings: (phrase_length - code_length) * occurrences
-                chars_saved += (len(phrase) - len(code)) * count
+        # Single pass: case-insensitive, longest phrase first (greedy)
+        if self._matcher is None:
+            self._matcher = DictionaryMatcher(self.phrase_dict, ignore_case=True)
+        result, phrases_replaced, chars_saved = self._matcher.replace(result)
 
         final_size = len(result)
 
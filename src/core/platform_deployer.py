@@ -17,6 +17,9 @@ Phase 11 Features (Cleanup):
 """
 
 import json
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -32,6 +35,12 @@ except ImportError:
     from header_manager import HeaderSystem
     from header_config import HeaderConfig
 
+# 1 MiB write buffer: each DEPLOYABLE file goes out in a single write syscall
+_WRITE_BUFFER = 1 << 20
+
+# Special template files (not in platform_configs) also compressed to $#
+_SPECIAL_FILES = ('CHROME-MCP.md', 'GITBOOK.md', 'MODAL.md', './THIS.md')
+
 
 class PlatformDeployer:
     """
@@ -89,6 +98,7 @@ class PlatformDeployer:
         # PHASE 11: Initialize Centralized Header System with dictionaries
         # Pass dictionaries to ensure headers use actual compressed dicts, not hard-coded values
         self.header_system = HeaderSystem(dictionaries=self.dictionaries)
+        self._filename_re = None  # Built on first replace_all_filenames()
         print("🎯 Centralized Header System initialized (Phase 11) with dynamic dictionaries")
 
     def build_filename_dictionary(self, platform: str, include_special_files: bool = True) -> Dict[str, str]:
@@ -140,25 +150,14 @@ class PlatformDeployer:
         Returns:
             (compressed_text, stats)
         """
-        result = text
-        replacements_made = {}
-
-        # Get all platform filenames from configs
-        all_filenames = self.config_loader.get_all_filenames()
+        # One longest-first alternation over every known filename: a single scan
+        # of the text instead of a count+replace pass per filename
+        if self._filename_re is None:
+            self._filename_re = self._build_filename_pattern()
 
-        # Add special template files (not in platform_configs)
-        special_files = ['CHROME-MCP.md', 'GITBOOK.md', 'MODAL.md', './THIS.md']
-        all_filenames.extend(special_files)
-
-        # Remove duplicates
-        all_filenames = list(set(all_filenames))
-
-        # Replace all filenames with $#
-        for filename in all_filenames:
-            if filename in result:
-                count = result.count(filename)
-                result = result.replace(filename, '$#')
-                replacements_made[filename] = count
+        counts = Counter(self._filename_re.findall(text))
+        result = self._filename_re.sub('$#', text) if counts else text
+        replacements_made = dict(counts)
 
         # Calculate savings
         total_replaced = sum(replacements_made.values())
@@ -173,6 +172,13 @@ class PlatformDeployer:
 
         return result, stats
 
+    def _build_filename_pattern(self) -> 're.Pattern':
+        """Compile all platform + special filenames into one alternation (longest first)"""
+        all_filenames = self.config_loader.get_all_filenames()
+        all_filenames.extend(_SPECIAL_FILES)
+        ordered = sorted(set(all_filenames), key=len, reverse=True)
+        return re.compile('|'.join(map(re.escape, ordered)))
+
     def replace_placeholder(self, text: str, platform: str) -> str:
         """
         Replace ./THIS.md placeholder with platform-specific filename.
@@ -313,6 +319,29 @@ class PlatformDeployer:
         Returns:
             Tuple of (output_path, enhanced_stats)
         """
+        prepared = self._prepare_content(
+            platform, compressed_content,
+            use_filename_compression, use_character_optimization
+        )
+        if use_character_optimization:
+            self._print_character_stats(prepared[3])
+
+        return self._write_platform_file(
+            platform, compressed_content, prepared, output_dir,
+            use_filename_compression, use_character_optimization
+        )
+
+    def _prepare_content(self,
+                         platform: str,
+                         compressed_content: str,
+                         use_filename_compression: bool,
+                         use_character_optimization: bool) -> Tuple[str, Dict, str, Dict]:
+        """
+        Apply filename compression and character optimization to content.
+
+        Returns:
+            (deployed_content, filename_stats, optimized_content, char_stats)
+        """
         # Apply filename compression if enabled
         if use_filename_compression:
             # Replace ALL platform filenames with $# (CLAUDE.md, AGENTS.md, etc. → $#)
@@ -325,14 +354,35 @@ class PlatformDeployer:
         # Apply character optimization if enabled (NEW - Task 8.7)
         if use_character_optimization:
             optimized_content, char_stats = self.apply_character_optimization(deployed_content)
-            print(f"🎯 Character Optimization Results:")
-            print(f"  Characters saved: {char_stats['total_chars_saved']}")
-            print(f"  Compression ratio: {char_stats['compression_ratio']:.2f}%")
-            print(f"  Optimizations applied: {char_stats['optimizations_applied']}")
         else:
             optimized_content = deployed_content
             char_stats = {}
 
+        return deployed_content, filename_stats, optimized_content, char_stats
+
+    @staticmethod
+    def _print_character_stats(char_stats: Dict) -> None:
+        """Print character optimization results"""
+        print(f"🎯 Character Optimization Results:")
+        print(f"  Characters saved: {char_stats['total_chars_saved']}")
+        print(f"  Compression ratio: {char_stats['compression_ratio']:.2f}%")
+        print(f"  Optimizations applied: {char_stats['optimizations_applied']}")
+
+    def _write_platform_file(self,
+                             platform: str,
+                             compressed_content: str,
+                             prepared: Tuple[str, Dict, str, Dict],
+                             output_dir: Path,
+                             use_filename_compression: bool,
+                             use_character_optimization: bool) -> Tuple[Path, Dict]:
+        """
+        Generate header for prepared content and write the DEPLOYABLE file.
+
+        Returns:
+            Tuple of (output_path, enhanced_stats)
+        """
+        deployed_content, filename_stats, optimized_content, char_stats = prepared
+
         # PHASE 11: Use Centralized Header System for single-file generation
         platform_info = self.platforms[platform]
         output_filename = f"DEPLOYABLE_{platform.upper()}.md"
@@ -363,7 +413,7 @@ class PlatformDeployer:
         result_path = output_path
 
         # Write the final file
-        with open(result_path, 'w', encoding='utf-8') as f:
+        with open(result_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
             f.write(final_content)
 
         # Basic validation (compatibility layer)
@@ -409,6 +459,10 @@ class PlatformDeployer:
         """
         Generate DEPLOYABLE files for all platforms using Centralized HeaderSystem (Phase 11).
 
+        Content preparation is shared when filename compression is on (the
+        output is identical for every platform); header generation and file
+        writes fan out over a thread pool, one task per platform.
+
         Args:
             compressed_content: Compressed content (after Layer 7)
             output_dir: Output directory
@@ -429,13 +483,38 @@ class PlatformDeployer:
         print(f"   Character Optimization: {'✅' if use_character_optimization else '❌'}")
         print()
 
-        for platform in self.config_loader.get_platform_keys():
-            print(f"🔧 Processing platform: {platform.upper()}")
+        platforms = self.config_loader.get_platform_keys()
 
-            output_path, stats = self.generate_platform_file(
-                platform, compressed_content, output_dir,
+        # $# filename compression is platform-independent: prepare content once
+        shared = None
+        if use_filename_compression and platforms:
+            shared = self._prepare_content(
+                platforms[0], compressed_content,
                 use_filename_compression, use_character_optimization
             )
+            if use_character_optimization:
+                self._print_character_stats(shared[3])
+                print()
+
+        def _generate_one(platform: str) -> Tuple[Path, Dict]:
+            prepared = shared if shared is not None else self._prepare_content(
+                platform, compressed_content,
+                use_filename_compression, use_character_optimization
+            )
+            return self._write_platform_file(
+                platform, compressed_content, prepared, output_dir,
+                use_filename_compression, use_character_optimization
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, len(platforms))) as pool:
+            generated = list(pool.map(_generate_one, platforms))
+
+        # Report in config order once all platforms are done
+        for platform, (output_path, stats) in zip(platforms, generated):
+            print(f"🔧 Processing platform: {platform.upper()}")
+            if shared is None and use_character_optimization:
+                self._print_character_stats(stats['character_optimization'])
+
             results[platform] = (output_path, stats)
             total_compression_stats['platforms_processed'] += 1
 
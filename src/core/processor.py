@@ -4,7 +4,7 @@ Coordinates compression, header generation, and output management
 """
 
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
 # PHASE 11: Cleanup - removed legacy header_styles imports
@@ -52,6 +52,7 @@ class ContextProcessor:
 
         # Load platform configs
         self.config_loader.load_all()
+        self._platforms_sorted: Optional[Tuple[str, ...]] = None
 
     def process_platform(
         self,
@@ -174,6 +175,12 @@ class ContextProcessor:
         """Get list of available platforms (ดึงรายการแพลตฟอร์มที่ใช้ได้)"""
         return self.config_loader.list_platforms()
 
+    def get_platform_list_sorted(self) -> Tuple[str, ...]:
+        """Get platform IDs sorted for display, cached until reload (ดึงรายการแพลตฟอร์มแบบเรียงลำดับ)"""
+        if self._platforms_sorted is None:
+            self._platforms_sorted = tuple(sorted(self.config_loader.list_platforms()))
+        return self._platforms_sorted
+
     def get_platform_config(self, platform_id: str) -> Optional[PlatformConfig]:
         """Get configuration for specific platform (ดึง config แพลตฟอร์ม)"""
         return self.config_loader.get(platform_id)
@@ -194,6 +201,7 @@ class ContextProcessor:
     def reload_config(self):
         """Reload platform configurations (โหลด config ใหม่)"""
         self.config_loader.reload()
+        self._platforms_sorted = None
 
     def reload_template(self):
         """Reload template content (โหลด template ใหม่)"""
@@ -9,6 +9,19 @@ from typing import Tuple, Dict
 from collections import Counter
 
 
+# Emoji categories (iterated per codepoint: '🗜️' contributes U+1F5DC and U+FE0F)
+KEEP_ALWAYS = '✅❌⚠️'  # Status indicators - always keep
+REMOVE_DECORATIVE = '🎯🔧🗜️🏆🎉💡📁🚀🔄📈🔗🌳🕸'  # Purely decorative
+LIMIT_USAGE = '📊🧠🏗🔍📜🏛'  # Keep max 3 of each
+STATUS_EMOJIS = '✅❌'  # Capped at 5 each when more reduction is needed
+
+# UTF-8 overhead per removed occurrence (bytes - 1), precomputed once per codepoint
+_OVERHEAD = {
+    emoji: len(emoji.encode('utf-8')) - 1
+    for emoji in REMOVE_DECORATIVE + LIMIT_USAGE + STATUS_EMOJIS
+}
+
+
 class SelectiveEmojiRemover:
     """Remove emojis selectively to reach target size"""
 
@@ -21,6 +34,11 @@ class SelectiveEmojiRemover:
         """
         self.target_reduction = target_reduction
 
+    @staticmethod
+    def has_candidates(text: str) -> bool:
+        """True if text contains any emoji that remove() may strip or cap"""
+        return any(emoji in text for emoji in _OVERHEAD)
+
     def remove(self, text: str) -> Tuple[str, Dict]:
         """
         Remove emojis selectively to reach target
@@ -45,11 +63,6 @@ class SelectiveEmojiRemover:
             'total_removed': 0
         }
 
-        # Define emoji categories
-        KEEP_ALWAYS = '✅❌⚠️'  # Status indicators - always keep
-        REMOVE_DECORATIVE = '🎯🔧🗜️🏆🎉💡📁🚀🔄📈🔗🌳🕸'  # Purely decorative
-        LIMIT_USAGE = '📊🧠🏗🔍📜🏛'  # Keep max 3 of each
-
         bytes_removed = 0
 
         # 1. Remove all decorative emojis
@@ -58,8 +71,7 @@ class SelectiveEmojiRemover:
             if count_before > 0:
                 text = text.replace(emoji + ' ', '')  # Remove with trailing space
                 text = text.replace(emoji, '')  # Remove standalone
-                emoji_bytes = len(emoji.encode('utf-8'))
-                removed = (emoji_bytes - 1) * count_before  # Overhead removed
+                removed = _OVERHEAD[emoji] * count_before  # Overhead removed
                 bytes_removed += removed
                 stats['emojis_removed'][emoji] = {
                     'count': count_before,
@@ -76,8 +88,7 @@ class SelectiveEmojiRemover:
                 # Rejoin first 3 emojis and remove all others from last part
                 text = emoji.join(parts[:3]) + emoji + parts[3].replace(emoji, '')
                 removed_count = count - 3
-                emoji_bytes = len(emoji.encode('utf-8'))
-                removed = (emoji_bytes - 1) * removed_count
+                removed = _OVERHEAD[emoji] * removed_count
                 bytes_removed += removed
                 stats['emojis_removed'][emoji] = {
                     'count': removed_count,
@@ -86,7 +97,7 @@ class SelectiveEmojiRemover:
 
         # 3. If still need more, remove excess status emojis (keep max 5 of each)
         if bytes_removed < self.target_reduction:
-            for emoji in '✅❌':
+            for emoji in STATUS_EMOJIS:
                 count = text.count(emoji)
                 if count > 5:
                     # split(emoji, 5) creates 6 parts
@@ -94,8 +105,7 @@ class SelectiveEmojiRemover:
                     # Rejoin first 5 emojis and remove all others from last part
                     text = emoji.join(parts[:5]) + emoji + parts[5].replace(emoji, '')
                     removed_count = count - 5
-                    emoji_bytes = len(emoji.encode('utf-8'))
-                    removed = (emoji_bytes - 1) * removed_count
+                    removed = _OVERHEAD[emoji] * removed_count
                     bytes_removed += removed
                     if emoji in stats['emojis_removed']:
                         stats['emojis_removed'][emoji]['count'] += removed_count
@@ -4,7 +4,6 @@ Template Compressor for Templates++
 Hybrid compression: Smart Dictionary v2 + Template patterns
 """
 
-import re
 import json
 import sys
 from typing import Tuple, Dict
@@ -15,6 +14,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.core.phrase_compressor import PhraseCompressor
 from src.core.word_compressor import WordCompressor
+from src.core.token_join import apply_token_join_validated
+from src.core.dictionary_matcher import DictionaryMatcher
 
 
 class TemplateCompressor:
@@ -43,12 +44,17 @@ class TemplateCompressor:
         self.phrase_compressor = PhraseCompressor(phrase_dict=self.phrase_dict)
         self.word_compressor = WordCompressor(word_dict=self.word_dict)
 
-    def compress(self, text: str) -> Tuple[str, Dict]:
+        # Built on first compress() (one compiled alternation for all templates)
+        self._template_matcher = None
+
+    def compress(self, text: str, join_tokens: bool = False) -> Tuple[str, Dict]:
         """
         Compress text using templates, phrases, then words
 
         Args:
             text: Original text
+            join_tokens: Also drop spaces between adjacent $/฿ codes (Layer 5.5)
+                         on the word output, validated without re-scanning the result
 
         Returns:
             (compressed_text, compression_stats)
@@ -64,13 +70,23 @@ class TemplateCompressor:
 
         # Step 3: Word compression ($ and ฿ codes)
         result, word_stats = self.word_compressor.compress(result)
+        after_words = len(result)
+
+        # Step 4 (optional): Token join, fused so the word output is never kept separately
+        token_join = None
+        if join_tokens:
+            result, token_join_stats, validation = apply_token_join_validated(result)
+            token_join = {
+                'token_join_stats': token_join_stats,
+                'validation': validation
+            }
 
         # Calculate total stats
         final_size = len(result)
         compression_stats = {
             'original_size': original_size,
             'after_templates': template_stats.get('size_after', len(result)) if template_stats else len(result),
-            'after_phrases': len(result),
+            'after_phrases': after_words,
             'final_size': final_size,
             'template_saved': template_stats.get('chars_saved', 0) if template_stats else 0,
             'phrase_saved': phrase_stats.get('chars_saved', 0),
@@ -85,6 +101,8 @@ class TemplateCompressor:
             'phrase_dict': self.phrase_dict,
             'word_dict': self.word_dict
         }
+        if token_join is not None:
+            compression_stats['token_join'] = token_join
 
         return result, compression_stats
 
@@ -98,32 +116,10 @@ class TemplateCompressor:
         if not self.template_dict:
             return text, {}
 
-        result = text
-        templates_replaced = 0
-        chars_saved = 0
-
-        # Create reverse mapping: pattern -> code
-        pattern_to_code = {pattern: code for code, pattern in self.template_dict.items()}
-
-        # Sort patterns by length (longest first) for greedy matching
-        sorted_patterns = sorted(pattern_to_code.keys(), key=len, reverse=True)
-
-        for pattern in sorted_patterns:
-            code = pattern_to_code[pattern]
-
-            # Escape special regex characters in pattern
-            escaped_pattern = re.escape(pattern)
-
-            # Count occurrences
-            count = len(re.findall(escaped_pattern, result))
-
-            if count > 0:
-                # Replace with template code
-                # Use code format: T1, T2, etc. (2-3 chars)
-                result = re.sub(escaped_pattern, code, result)
-                templates_replaced += count
-                # Calculate savings: (pattern_length - code_length) * occurrences
-                chars_saved += (len(pattern) - len(code)) * count
+        # Single pass: longest template first (greedy), case-sensitive
+        if self._template_matcher is None:
+            self._template_matcher = DictionaryMatcher(self.template_dict)
+        result, templates_replaced, chars_saved = self._template_matcher.replace(text)
 
         size_after = len(result)
 
@@ -15,9 +15,54 @@ Layer 6-7: Markdown + Whitespace + Emoji
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Dict
 
+# Raw patterns, compiled once per process by _patterns()
+_RAW_PATTERNS = {
+    # Thai Unicode range: U+0E00-U+0E7F
+    'thai': r'[\u0E00-\u0E7F]+',
+    'thai_char': r'[\u0E00-\u0E7F]',
+    'latin_char': r'[a-zA-Z]',
+    'header_translation': r'\*\*([^\*]+)\*\*\n\*\*[\u0E00-\u0E7F]+\*\*',
+    'standalone_header': r'\n\*\*[\u0E00-\u0E7F\s]+\*\*(?=\n)',
+    'inline_translation': r'\s*\([^)]*[\u0E00-\u0E7F][^)]*\)',
+    'list_translation': r'(\*\*[^:]+\*\*:?)\s*\([\u0E00-\u0E7F]+\)',
+    'inline_translation_pure': r'\s*\([\u0E00-\u0E7F\s]+\)',
+    'whitespace_run': r'\s+',
+    'arrow': r'\s*→\s*',
+    'triple_newline': r'\n\n\n+',
+    'trailing_spaces': r' +\n',
+    'punctuation_line': r'\n[-–—→]+\n',
+}
+
+
+# Keys of stats['patterns_removed'] filled by _strip_translations()
+_TRANSLATION_KINDS = (
+    'header_translations',
+    'standalone_thai_headers',
+    'inline_translations',
+    'mixed_bilingual_lines',
+)
+
+
+def _has_thai(text: str) -> bool:
+    """
+    Fast Thai presence test over the UTF-8 buffer
+
+    U+0E00-U+0E7F always encodes as E0 B8 xx / E0 B9 xx, so two bytes
+    substring searches replace a per-codepoint character-class scan.
+    """
+    data = text.encode('utf-8')
+    return b'\xe0\xb8' in data or b'\xe0\xb9' in data
+
+
+@lru_cache(maxsize=None)
+def _patterns() -> Dict[str, 're.Pattern']:
+    """Compiled patterns shared by all ThaiContentRemover instances"""
+    return {name: re.compile(pattern) for name, pattern in _RAW_PATTERNS.items()}
+
 
 class ThaiContentRemover:
     """Remove Thai language content from bilingual documents"""
@@ -25,7 +70,8 @@ class ThaiContentRemover:
     def __init__(self):
         """Initialize Thai Content Remover"""
         # Thai Unicode range: U+0E00-U+0E7F
-        self.thai_pattern = r'[\u0E00-\u0E7F]+'
+        self.thai_pattern = _RAW_PATTERNS['thai']
+        self._patterns = _patterns()
 
     def remove(self, text: str) -> Tuple[str, Dict]:
         """
@@ -38,6 +84,7 @@ class ThaiContentRemover:
             Tuple of (cleaned_text, stats_dict)
         """
         original_size = len(text)
+        patterns = self._patterns
 
         # Track statistics
         stats = {
@@ -47,25 +94,59 @@ class ThaiContentRemover:
             'total_overhead': 0
         }
 
+        if _has_thai(text):
+            text = self._strip_translations(text, stats)
+        else:
+            # No Thai codepoints: translation patterns 1-4 cannot match
+            stats['patterns_removed'] = dict.fromkeys(_TRANSLATION_KINDS, 0)
+
+        # Cleanup: Remove extra whitespace and blank lines
+        # Replace 3+ newlines with 2 newlines
+        text = patterns['triple_newline'].sub('\n\n', text)
+        # Remove trailing spaces
+        text = patterns['trailing_spaces'].sub('\n', text)
+        # Remove lines with only punctuation
+        text = patterns['punctuation_line'].sub('\n', text)
+
+        # Remaining Thai is zero by construction: pattern 4 strips Thai from every
+        # line it keeps, and the cleanup passes above only delete ASCII
+        remaining_thai = 0
+
+        # Calculate final statistics
+        final_size = len(text)
+        total_removed = original_size - final_size
+
+        stats['final_size'] = final_size
+        stats['total_removed'] = total_removed
+        stats['compression_ratio'] = (total_removed / original_size * 100) if original_size > 0 else 0
+        stats['remaining_thai_chars'] = remaining_thai
+        stats['success'] = remaining_thai == 0  # Success if no Thai remains
+
+        return text, stats
+
+    def _strip_translations(self, text: str, stats: Dict) -> str:
+        """Remove Thai translations (patterns 1-4), recording counts in stats"""
+        patterns = self._patterns
+
         # Pattern 1: Header translations (markdown headers with Thai on next line)
         # Example: **Constitutional Basis:**\n**รากฐานรัธรีมนูญ**
-        pattern1 = r'\*\*([^\*]+)\*\*\n\*\*[\u0E00-\u0E7F]+\*\*'
-        matches1 = re.findall(pattern1, text)
-        text = re.sub(pattern1, r'**\1**', text)
+        pattern1 = patterns['header_translation']
+        matches1 = pattern1.findall(text)
+        text = pattern1.sub(r'**\1**', text)
         stats['patterns_removed']['header_translations'] = len(matches1)
 
         # Pattern 2: Standalone Thai headers (bold Thai on separate line)
         # Example: **ข้อมูลผู้ใช้ส่วนบุคคล**
-        pattern2 = r'\n\*\*[\u0E00-\u0E7F\s]+\*\*(?=\n)'
-        matches2 = re.findall(pattern2, text)
-        text = re.sub(pattern2, '', text)
+        pattern2 = patterns['standalone_header']
+        matches2 = pattern2.findall(text)
+        text = pattern2.sub('', text)
         stats['patterns_removed']['standalone_thai_headers'] = len(matches2)
 
         # Pattern 3: Inline translations in parentheses with Thai
         # Example: (คำอธิบายไทย) or (Context/คำอธิบาย)
-        pattern3 = r'\s*\([^)]*[\u0E00-\u0E7F][^)]*\)'
-        matches3 = re.findall(pattern3, text)
-        text = re.sub(pattern3, '', text)
+        pattern3 = patterns['inline_translation']
+        matches3 = pattern3.findall(text)
+        text = pattern3.sub('', text)
         stats['patterns_removed']['inline_translations'] = len(matches3)
 
         # Pattern 4: Mixed Thai-English lines - Remove Thai portions from same line
@@ -74,10 +155,10 @@ class ThaiContentRemover:
         def clean_mixed_line(match):
             line = match.group(0)
             # Remove Thai characters and surrounding punctuation
-            cleaned = re.sub(r'[\u0E00-\u0E7F]+', '', line)
+            cleaned = patterns['thai'].sub('', line)
             # Clean up extra spaces and punctuation
-            cleaned = re.sub(r'\s+', ' ', cleaned)
-            cleaned = re.sub(r'\s*→\s*', ' → ', cleaned)  # Preserve arrows
+            cleaned = patterns['whitespace_run'].sub(' ', cleaned)
+            cleaned = patterns['arrow'].sub(' → ', cleaned)  # Preserve arrows
             return cleaned.strip()
 
         # Apply to lines that contain both English and Thai
@@ -85,14 +166,19 @@ class ThaiContentRemover:
         cleaned_lines = []
         mixed_count = 0
 
+        has_thai = patterns['thai_char'].search
+        has_latin = patterns['latin_char'].search
+        strip_thai = patterns['thai'].sub
+        collapse_ws = patterns['whitespace_run'].sub
+
         for line in lines:
-            if re.search(r'[\u0E00-\u0E7F]', line):
+            if has_thai(line):
                 # Line contains Thai
-                if re.search(r'[a-zA-Z]', line):
+                if has_latin(line):
                     # Also contains English - it's a mixed line
-                    cleaned_line = re.sub(r'[\u0E00-\u0E7F]+', '', line)
+                    cleaned_line = strip_thai('', line)
                     # Clean up extra spaces
-                    cleaned_line = re.sub(r'\s+', ' ', cleaned_line).strip()
+                    cleaned_line = collapse_ws(' ', cleaned_line).strip()
                     # Only keep if there's still content after Thai removal
                     if cleaned_line and cleaned_line not in ['**', '-', '→']:
                         cleaned_lines.append(cleaned_line)
@@ -105,28 +191,7 @@ class ThaiContentRemover:
         text = '\n'.join(cleaned_lines)
         stats['patterns_removed']['mixed_bilingual_lines'] = mixed_count
 
-        # Cleanup: Remove extra whitespace and blank lines
-        # Replace 3+ newlines with 2 newlines
-        text = re.sub(r'\n\n\n+', '\n\n', text)
-        # Remove trailing spaces
-        text = re.sub(r' +\n', '\n', text)
-        # Remove lines with only punctuation
-        text = re.sub(r'\n[-–—→]+\n', '\n', text)
-
-        # Count remaining Thai characters (for verification)
-        remaining_thai = len(re.findall(self.thai_pattern, text))
-
-        # Calculate final statistics
-        final_size = len(text)
-        total_removed = original_size - final_size
-
-        stats['final_size'] = final_size
-        stats['total_removed'] = total_removed
-        stats['compression_ratio'] = (total_removed / original_size * 100) if original_size > 0 else 0
-        stats['remaining_thai_chars'] = remaining_thai
-        stats['success'] = remaining_thai == 0  # Success if no Thai remains
-
-        return text, stats
+        return text
 
     def analyze(self, text: str) -> Dict:
         """
@@ -139,7 +204,8 @@ class ThaiContentRemover:
             Dictionary with analysis results
         """
         # Count Thai characters
-        thai_matches = re.findall(self.thai_pattern, text)
+        compiled = self._patterns
+        thai_matches = compiled['thai'].findall(text)
         total_thai_chars = sum(len(match) for match in thai_matches)
         thai_segments = len(thai_matches)
 
@@ -148,10 +214,10 @@ class ThaiContentRemover:
 
         # Pattern analysis
         patterns = {
-            'header_translations': len(re.findall(r'\*\*([^\*]+)\*\*\n\*\*[\u0E00-\u0E7F]+\*\*', text)),
-            'inline_translations': len(re.findall(r'\s*\([\u0E00-\u0E7F\s]+\)', text)),
-            'list_translations': len(re.findall(r'(\*\*[^:]+\*\*:?)\s*\([\u0E00-\u0E7F]+\)', text)),
-            'standalone_headers': len(re.findall(r'\n\*\*[\u0E00-\u0E7F\s]+\*\*(?=\n)', text))
+            'header_translations': len(compiled['header_translation'].findall(text)),
+            'inline_translations': len(compiled['inline_translation_pure'].findall(text)),
+            'list_translations': len(compiled['list_translation'].findall(text)),
+            'standalone_headers': len(compiled['standalone_header'].findall(text))
         }
 
         return {
@@ -8,9 +8,11 @@ Purpose: Extract lines 1-81 (TEMPLATE USAGE INSTRUCTIONS) before compression
 Rationale: Usage instructions are not context content, should not be compressed
 """
 
-import re
 from typing import Dict, Tuple
 
+# Placeholder replaced per platform at deployment (literal, so counted with str.count)
+PLACEHOLDER = './THIS.md'
+
 
 class UsageInstructionsExtractor:
     """
@@ -113,13 +115,12 @@ class UsageInstructionsExtractor:
         Returns:
             Dictionary with placeholder statistics
         """
-        placeholder_pattern = r'\./THIS\.md'
-        matches = re.findall(placeholder_pattern, text)
+        placeholder_count = text.count(PLACEHOLDER)
         
         return {
-            'placeholder_count': len(matches),
-            'placeholder': './THIS.md',
-            'needs_replacement': len(matches) > 0
+            'placeholder_count': placeholder_count,
+            'placeholder': PLACEHOLDER,
+            'needs_replacement': placeholder_count > 0
         }
     
     def verify_extraction(self, usage_text: str, context_text: str) -> Dict:
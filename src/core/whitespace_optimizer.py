@@ -5,12 +5,29 @@ Remove excessive whitespace while maintaining readability
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple, Dict
 
+# Raw patterns, compiled once per process by _patterns()
+_RAW_PATTERNS = {
+    'triple_newline': r'\n\n\n+',
+    'trailing_spaces': r' +\n',
+}
+
+
+@lru_cache(maxsize=None)
+def _patterns() -> Dict[str, 're.Pattern']:
+    """Compiled patterns shared by all WhitespaceOptimizer instances"""
+    return {name: re.compile(pattern) for name, pattern in _RAW_PATTERNS.items()}
+
 
 class WhitespaceOptimizer:
     """Optimize whitespace usage"""
 
+    def __init__(self):
+        """Initialize Whitespace Optimizer"""
+        self._patterns = _patterns()
+
     def optimize(self, text: str) -> Tuple[str, Dict]:
         """
         Optimize whitespace
@@ -29,8 +46,7 @@ class WhitespaceOptimizer:
         }
 
         # 1. Remove excessive newlines (3+ → 2)
-        triple_newlines = len(re.findall(r'\n\n\n+', text))
-        text = re.sub(r'\n\n\n+', '\n\n', text)
+        text, triple_newlines = self._patterns['triple_newline'].subn('\n\n', text)
         stats['optimizations']['excessive_newlines'] = {
             'count': triple_newlines,
             'savings': original_size - len(text)
@@ -38,7 +54,7 @@ class WhitespaceOptimizer:
 
         # 2. Remove trailing spaces at line ends
         trailing_before = len(text)
-        text = re.sub(r' +\n', '\n', text)
+        text = self._patterns['trailing_spaces'].sub('\n', text)
         stats['optimizations']['trailing_spaces'] = {
             'savings': trailing_before - len(text)
         }
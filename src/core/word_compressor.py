@@ -4,11 +4,16 @@ Word Compressor - Layer 5
 Single-word compression using $Code and ฿code format
 """
 
-import re
 import json
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 from pathlib import Path
 
+# Support both module import and standalone testing
+try:
+    from .dictionary_matcher import DictionaryMatcher
+except ImportError:
+    from dictionary_matcher import DictionaryMatcher
+
 
 class WordCompressor:
     """
@@ -44,6 +49,9 @@ class WordCompressor:
             else:
                 self.word_dict = {}
 
+        # Built on first compress() (one compiled alternation for all words)
+        self._matcher: Optional[DictionaryMatcher] = None
+
     def compress(self, text: str) -> Tuple[str, Dict]:
         """
         Compress individual words using $ and ฿ codes
@@ -66,29 +74,10 @@ class WordCompressor:
                 'words_replaced': 0
             }
 
-        words_replaced = 0
-        chars_saved = 0
-
-        # Create reverse mapping: word -> code
-        word_to_code = {word: code for code, word in self.word_dict.items()}
-
-        # Sort words by length (longest first) to avoid partial replacements
-        sorted_words = sorted(word_to_code.keys(), key=len, reverse=True)
-
-        for word in sorted_words:
-            code = word_to_code[word]
-
-            # Use word boundary matching to avoid partial replacements
-            pattern = r'\b' + re.escape(word) + r'\b'
-
-            # Count occurrences
-            count = len(re.findall(pattern, result, re.IGNORECASE))
-
-            if count > 0:
-                # Replace all occurrences (case-insensitive)
-                result = re.sub(pattern, code, result, flags=re.IGNORECASE)
-                words_replaced += count
-                chars_saved += (len(word) - len(code)) * count
+        # Single pass: whole-word, case-insensitive, longest word first
+        if self._matcher is None:
+            self._matcher = DictionaryMatcher(self.word_dict, ignore_case=True, word_boundary=True)
+        result, words_replaced, chars_saved = self._matcher.replace(result)
 
         final_size = len(result)
 
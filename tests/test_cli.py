@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+from src import cli
+
+
+@pytest.mark.parametrize("argv, command", [
+    (['compress', 'cursor'], 'compress'),
+    (['--config-dir', 'list', 'stats'], 'stats'),
+    (['--template', 'x.md', '--config-dir=configs', 'list'], 'list'),
+    (['--help'], None),
+])
+def test_peek_command_skips_global_option_values(argv, command):
+    assert cli._peek_command(argv) == command
+
+
+@pytest.mark.parametrize("argv, value", [
+    (['--config-dir', 'configs', 'compress', 'all'], 'configs'),
+    (['--config-dir=configs', 'compress', 'all'], 'configs'),
+    (['compress', 'all', '--config-dir'], './platform_configs'),
+    (['compress', 'all'], './platform_configs'),
+])
+def test_peek_option(argv, value):
+    assert cli._peek_option(argv, '--config-dir', './platform_configs') == value
+
+
+def test_platform_choices_from_config_filenames(tmp_path):
+    for name in ('qwen.json', 'cursor.json', 'notes.txt'):
+        (tmp_path / name).write_text('{}')
+
+    assert cli._platform_choices(['--config-dir', str(tmp_path), 'compress']) == ['cursor', 'qwen', 'all']
+    assert cli._platform_choices(['--config-dir', str(tmp_path / 'missing'), 'compress']) is None
+
+
+def test_unknown_platform_rejected_by_argparse(monkeypatch, capsys, tmp_path):
+    (tmp_path / 'cursor.json').write_text('{}')
+    monkeypatch.setattr(sys, 'argv', ['drcc', '--config-dir', str(tmp_path), 'compress', 'vim'])
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main()
+
+    assert exc_info.value.code == 2
+    assert "invalid choice: 'vim'" in capsys.readouterr().err
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from src.cli_wrapper import ContextCLI
+
+CONFIG_DIR = str(Path(__file__).parent.parent / "platform_configs")
+
+
+@pytest.fixture
+def cli():
+    return ContextCLI(CONFIG_DIR)
+
+
+@pytest.mark.parametrize("size", [50, 250, 600, 5000])
+def test_validate_reports_invalid_utf8(cli, tmp_path, size):
+    source = tmp_path / "context.md"
+    source.write_bytes(b"\xff" + b"x" * (size - 1))
+
+    results = cli.validate("claude", str(source))
+
+    assert results["valid"] is False
+    assert results["errors"][0].startswith("Cannot read file")
+
+
+def test_validate_accepts_multibyte_char_across_preview_limit(cli, tmp_path):
+    source = tmp_path / "context.md"
+    source.write_text("x" * 4095 + "฿" * 10, encoding="utf-8")
+
+    results = cli.validate("claude", str(source))
+
+    assert results["valid"] is True
+    assert results["errors"] == []
+
+
+@pytest.mark.parametrize("text, short", [("short context", True), ("ภาษาไทย " * 20, False)])
+def test_validate_short_file_warning(cli, tmp_path, text, short):
+    source = tmp_path / "context.md"
+    source.write_text(text, encoding="utf-8")
+
+    warnings = cli.validate("claude", str(source))["warnings"]
+
+    assert ("File seems very short - may not have enough content for compression" in warnings) is short
+
+
+def test_validate_checks_platform_on_a_fresh_instance(cli, tmp_path):
+    source = tmp_path / "context.md"
+    source.write_text("context " * 200, encoding="utf-8")
+
+    assert cli.validate("claude", str(source))["valid"] is True
+    errors = ContextCLI(CONFIG_DIR).validate("vim", str(source))["errors"]
+    assert errors[0].startswith("Platform not supported: vim. Available: ")
+
+
+def test_deploy_all_reports_each_platform_under_its_progress_line(cli, tmp_path, monkeypatch, capsys):
+    source = tmp_path / "context.md"
+    source.write_text("context " * 200, encoding="utf-8")
+    stats = {
+        'deployment': {'platform_files': [{'platform': 'claude', 'output_file': 'DEPLOYABLE_CLAUDE.md'}]},
+        'final_size': 1000,
+        'total_ratio': 50.0,
+    }
+    monkeypatch.setattr(cli, '_run_pipeline_once', lambda source_path, output_dir: stats)
+    monkeypatch.setattr(cli, 'get_platform_list', lambda: ['claude', 'vim'])
+
+    results = cli.deploy_all(str(source), str(tmp_path))
+
+    out = capsys.readouterr().out
+    assert results["details"] == {'claude': True, 'vim': False}
+    assert out.index("Processing claude") < out.index("Compression completed") < out.index("Processing vim")
+    assert out.index("Processing vim") < out.index("DEPLOYABLE file for vim not found") < out.index("Deployment Summary")
+
+
+def test_interactive_menu_dispatches_choices(cli, monkeypatch, capsys):
+    calls = []
+    monkeypatch.setitem(cli._menu_actions, '1', lambda: calls.append('list'))
+    monkeypatch.setitem(cli._menu_actions, '5', lambda: calls.append('info'))
+    answers = iter(['1', ' 5 ', '9', '', '7'])
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+
+    cli.interactive_mode()
+
+    out = capsys.readouterr().out
+    assert calls == ['list', 'info']
+    assert "Invalid choice!" in out
+    assert out.rstrip().endswith("Goodbye! Thank you for using Context Compression System")
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from src.core.compression_engine import CompressionEngine, CompressionLevel
@@ -25,3 +27,29 @@ def test_selective_compression_uses_patterns():
 
     assert "Remove ME please." not in result.compressed_text
     assert result.metadata["patterns_used"] == ["Remove ME please."]
+
+
+def test_stats_are_a_snapshot():
+    engine = CompressionEngine(level=CompressionLevel.BASIC)
+    engine.compress("Line one.   \n\n\n\nLine two.")
+    stats = engine.get_stats()
+
+    stats["compression_history"].clear()
+    engine.compress("Another   \n\n\n\nline.")
+
+    assert stats["total_compressed"] == 1
+    assert stats["compression_history"] == []
+    assert len(engine.get_stats()["compression_history"]) == 2
+
+
+def test_stats_are_strict_json_before_and_after_compressing():
+    engine = CompressionEngine(level=CompressionLevel.BASIC)
+
+    assert json.loads(json.dumps(engine.get_stats(), allow_nan=False))["min_ratio"] is None
+
+    engine.compress("Line one.   \n\n\n\nLine two.")
+    engine.compress("Nothing to remove here.")
+    stats = json.loads(json.dumps(engine.get_stats(), allow_nan=False))
+
+    assert stats["min_ratio"] == 0
+    assert stats["max_ratio"] > 0
@@ -0,0 +1,58 @@
+import dataclasses
+import json
+
+import pytest
+
+from src.config.platform_loader import PlatformConfigLoader
+from src.core.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    config = {
+        "name": "Cursor", "target_file": ".cursorrules", "output_dir": str(tmp_path / "out"),
+        "header_style": "cursor", "compression_default": "basic", "description": "Cursor rules",
+        "tags": ["ide"],
+    }
+    (tmp_path / "cursor.json").write_text(json.dumps(config))
+    yield tmp_path
+    PlatformConfigLoader.invalidate()
+    ConfigLoader.invalidate()
+
+
+def test_cached_platform_configs_are_immutable(config_dir):
+    first = PlatformConfigLoader(str(config_dir)).load_all()["cursor"]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.name = "Changed"
+    assert PlatformConfigLoader(str(config_dir)).load_all()["cursor"].name == "Cursor"
+
+
+def test_cached_config_dicts_are_not_shared(config_dir):
+    first = ConfigLoader(str(config_dir)).platforms
+    first["cursor"]["name"] = "Changed"
+    first["cursor"]["tags"].append("edited")
+
+    second = ConfigLoader(str(config_dir)).platforms
+
+    assert second["cursor"]["name"] == "Cursor"
+    assert second["cursor"]["tags"] == ["ide"]
+
+
+def test_output_dir_check_sees_new_directories(config_dir):
+    loader = PlatformConfigLoader(str(config_dir))
+
+    assert loader.validate_output_dir("cursor") is False
+    (config_dir / "out").mkdir()
+    assert loader.validate_output_dir("cursor") is True
+
+
+def test_cached_stats_are_read_only(config_dir):
+    loader = PlatformConfigLoader(str(config_dir))
+    stats = loader.get_stats()
+
+    with pytest.raises(AttributeError):
+        stats["platforms"].append("vim")
+    with pytest.raises(TypeError):
+        stats["compression_levels"]["vim"] = "basic"
+    assert loader.get_stats()["platforms"] == ("cursor",)
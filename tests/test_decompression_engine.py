@@ -0,0 +1,53 @@
+import random
+import re
+
+import pytest
+
+from src.core.decompression_engine import DecompressionEngine, _build_code_pattern
+
+
+def _longest_first(codes, text):
+    """Reference: one alternation of the codes, longest first"""
+    pattern = re.compile('|'.join(map(re.escape, sorted(codes, key=len, reverse=True))))
+    return pattern.sub(lambda m: codes[m.group()], text)
+
+
+@pytest.mark.parametrize("codes, text, expected", [
+    ({'T1': '<one>', 'T18': '<eighteen>'}, "T18 T1 T181", "<eighteen> <one> <eighteen>1"),
+    ({'฿a': 'alpha', '฿aa': 'double', '฿฿a': 'baht'}, "฿aaa ฿฿a ฿a", "doublea baht alpha"),
+])
+def test_longest_code_wins(codes, text, expected):
+    pattern = _build_code_pattern(tuple(codes))
+
+    assert pattern.sub(lambda m: codes[m.group()], text) == expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_trie_matches_longest_first_alternation(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        codes = {
+            ''.join(rng.choice('$฿T1.') for _ in range(rng.randint(1, 4))): str(i)
+            for i in range(rng.randint(1, 8))
+        }
+        text = ''.join(rng.choice('$฿T1. ') for _ in range(rng.randint(0, 40)))
+
+        pattern = _build_code_pattern(tuple(codes))
+
+        assert pattern.sub(lambda m: codes[m.group()], text) == _longest_first(codes, text)
+
+
+def test_single_char_codes_use_translate():
+    engine = DecompressionEngine()
+    codes = {'€': 'euro', '‡': 'dagger'}
+
+    assert engine._replace_codes('phrase', codes, "€ and ‡€") == "euro and daggereuro"
+    assert isinstance(engine._code_patterns['phrase'][1], dict)
+
+
+def test_changed_codes_rebuild_cached_replacer():
+    engine = DecompressionEngine()
+
+    assert engine._replace_codes('word', {'$A': 'alpha'}, "$A $AB") == "alpha alphaB"
+    assert engine._replace_codes('word', {'$AB': 'beta', '$A': 'alpha'}, "$A $AB") == "alpha beta"
+    assert engine._replace_codes('word', {'$': 'dollar'}, "$A") == "dollarA"
@@ -0,0 +1,89 @@
+import random
+import re
+
+import pytest
+
+from src.core.dictionary_compressor import DictionaryCompressor
+
+
+def _compress_per_word(reverse_dict, text):
+    """The original compress loop: one \\bword\\b substitution per word, longest first"""
+    for word, code in sorted(reverse_dict.items(), key=lambda x: len(x[0]), reverse=True):
+        text = re.sub(r'\b' + re.escape(word) + r'\b', code, text)
+    return text
+
+
+def _decompress_per_code(dictionary, text):
+    """The original decompress loop: w### codes, then 2-char, then 1-char"""
+    tier3 = [(k, v) for k, v in dictionary.items() if k.startswith('w')]
+    tier2 = [(k, v) for k, v in dictionary.items() if len(k) == 2 and not k.startswith('w')]
+    tier1 = [(k, v) for k, v in dictionary.items() if len(k) == 1]
+    for tier in [tier3, tier2, tier1]:
+        for code, word in tier:
+            text = re.sub(r'\b' + re.escape(code) + r'\b', word, text)
+    return text
+
+
+def _random_text(rng, words):
+    return ' '.join(
+        rng.choice(words) + rng.choice(['', '', '.', '-', '_x', '\n'])
+        for _ in range(rng.randint(0, 300))
+    )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_compress_matches_per_word_loop(seed):
+    rng = random.Random(seed)
+    vocabulary = [
+        ''.join(rng.choice('abcdefgh') for _ in range(rng.randint(2, 7)))
+        for _ in range(60)
+    ] + ['aa', 'ab', 'w001', 'Word', 'wordy']
+    compressor = DictionaryCompressor()
+    for _ in range(20):
+        text = _random_text(rng, vocabulary)
+        if not compressor.analyze_frequency(text):
+            continue
+        compressor.build_dictionary(text)
+
+        compressed, header = compressor.compress(text)
+
+        assert header is None
+        assert compressed == _compress_per_word(compressor.reverse_dict, text)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_decompress_matches_per_code_loop(seed):
+    rng = random.Random(seed)
+    vocabulary = ['context', 'compression', 'rule', 'aa', 'ab', 'w001', 'w002x', 'Word']
+    compressor = DictionaryCompressor()
+    for _ in range(20):
+        text = _random_text(rng, vocabulary)
+        if not compressor.analyze_frequency(text):
+            continue
+        dictionary = compressor.build_dictionary(text)
+        compressed, _ = compressor.compress(text)
+
+        assert compressor.decompress(compressed, dictionary) == _decompress_per_code(dictionary, compressed)
+
+
+def test_round_trip():
+    text = "compression keeps context; Context stays, compression-ready context\n" * 3
+    compressor = DictionaryCompressor()
+    dictionary = compressor.build_dictionary(text)
+
+    compressed, _ = compressor.compress(text)
+
+    assert len(compressed) < len(text)
+    assert compressor.decompress(compressed, dictionary) == text
+
+
+@pytest.mark.parametrize("dictionary", [
+    {'ab': 'xy cd', 'cd': 'zz'},         # a word contains a later code
+    {'w1': 'ab', 'ab': 'cd', 'c': 'e'},  # codes chain across tiers
+    {'a-b': 'x', 'ab': 'y'},             # code is not a whole word run
+    {'ab': r'x\ty'},                     # re.sub template escape in a word
+])
+def test_order_dependent_dictionaries_match_per_code_loop(dictionary):
+    text = "ab cd w1 a-b c ab-cd w1ab"
+
+    assert DictionaryCompressor().decompress(text, dictionary) == _decompress_per_code(dictionary, text)
@@ -0,0 +1,101 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+from src.core import dictionary_generator
+from src.core.dictionary_generator import (
+    _PHRASE_PATTERN, _WORD_PATTERN, _count_matches, _count_phrases, _count_words, _iter_slices,
+)
+
+
+def _serial_count(pattern, text):
+    """Reference: every match over the whole text, lowercased, counted in order"""
+    return Counter(match.lower() for match in pattern.findall(text))
+
+
+def _random_text(rng):
+    words = ['Context', 'compression', 'dictionary', 'rule', 'API', 'token', 'naïve', 'x1y', 'data_set']
+    lines = [
+        ' '.join(rng.choice(words) for _ in range(rng.randint(1, 12))) + rng.choice(['.', ':', '', ' -'])
+        for _ in range(rng.randint(50, 300))
+    ]
+    return '\n'.join(lines)
+
+
+@pytest.fixture
+def parallel_counts(monkeypatch):
+    """Force _count_matches through the chunked worker-pool path"""
+    monkeypatch.setattr(dictionary_generator, '_COUNT_CACHE', {})
+    monkeypatch.setattr(dictionary_generator, '_PARALLEL_COUNT_THRESHOLD', 0)
+    monkeypatch.setattr(dictionary_generator.os, 'cpu_count', lambda: 3)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_parallel_counts_match_serial_count(parallel_counts, seed):
+    text = _random_text(random.Random(seed))
+
+    phrases, words = _count_matches((_count_phrases, _count_words), text)
+
+    # Same keys in the same first-seen order, so most_common() ties match too
+    assert list(phrases.items()) == list(_serial_count(_PHRASE_PATTERN, text).items())
+    assert list(words.items()) == list(_serial_count(_WORD_PATTERN, text).items())
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sliced_counts_match_serial_count(monkeypatch, seed):
+    monkeypatch.setattr(_iter_slices, '__defaults__', (17,))
+    text = _random_text(random.Random(seed))
+
+    assert ''.join(_iter_slices(text)) == text
+    assert list(_count_phrases(text).items()) == list(_serial_count(_PHRASE_PATTERN, text).items())
+    assert list(_count_words(text).items()) == list(_serial_count(_WORD_PATTERN, text).items())
+
+
+def test_count_matches_memoizes_per_text(monkeypatch):
+    monkeypatch.setattr(dictionary_generator, '_COUNT_CACHE', {})
+    text = "Rule one. Rule two.\n"
+
+    first = _count_matches((_count_words,), text)
+
+    assert _count_matches((_count_words,), text)[0] is first[0]
+    assert _count_matches((_count_words,), text + "rule\n")[0] is not first[0]
+
+
+def test_cache_round_trip_drops_other_versions(tmp_path):
+    stale_path = tmp_path / "0123_v0_50_15_4_5_False.json"
+    stale_path.write_text("[]")
+    text = "Context compression keeps context small.\n" * 20
+    generator = dictionary_generator.DictionaryGenerator()
+
+    first = generator.generate_all_dictionaries(text, cache_dir=tmp_path)
+
+    assert not stale_path.exists()
+    assert [path.name for path in tmp_path.glob("*.json")] == [generator._cache_path(text, tmp_path).name]
+    assert generator.generate_all_dictionaries(text, cache_dir=tmp_path) == first
+
+
+def test_cache_keeps_newest_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(dictionary_generator, '_CACHE_MAX_ENTRIES', 2)
+    generator = dictionary_generator.DictionaryGenerator()
+    texts = [f"Rule number {n} keeps context small.\n" * 10 for n in ('one', 'two', 'three')]
+    for n, text in enumerate(texts, 1):
+        generator.generate_all_dictionaries(text, cache_dir=tmp_path)
+        # Distinct, increasing mtimes even on coarse-timestamp filesystems
+        os.utime(generator._cache_path(text, tmp_path), ns=(n, n))
+
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == sorted(
+        generator._cache_path(text, tmp_path).name for text in texts[1:]
+    )
+
+
+def test_unreadable_cache_entry_is_regenerated(tmp_path):
+    text = "Context compression keeps context small.\n" * 20
+    generator = dictionary_generator.DictionaryGenerator()
+    generator._cache_path(text, tmp_path).write_text('{"not": "dictionaries"}')
+
+    result = generator.generate_all_dictionaries(text, cache_dir=tmp_path)
+
+    assert result == generator.generate_all_dictionaries(text)
+    assert generator._load_cached(generator._cache_path(text, tmp_path)) == result
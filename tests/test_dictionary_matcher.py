@@ -0,0 +1,67 @@
+import random
+import re
+
+import pytest
+
+from src.core.dictionary_matcher import DictionaryMatcher
+
+
+def _per_entry_loop(code_to_text, text, ignore_case=False, word_boundary=False):
+    """The original replacement loop: each entry across the whole text, longest first"""
+    text_to_code = {entry: code for code, entry in code_to_text.items()}
+    flags = re.IGNORECASE if ignore_case else 0
+    replacements = 0
+    chars_saved = 0
+    for entry in sorted(text_to_code, key=len, reverse=True):
+        code = text_to_code[entry]
+        pattern = re.escape(entry)
+        if word_boundary:
+            pattern = r'\b' + pattern + r'\b'
+        count = len(re.findall(pattern, text, flags))
+        if count:
+            text = re.sub(pattern, code, text, flags=flags)
+            replacements += count
+            chars_saved += (len(entry) - len(code)) * count
+    return text, replacements, chars_saved
+
+
+def test_longer_entry_claims_overlap_first():
+    matcher = DictionaryMatcher({'€a': 'alpha beta', '€b': 'beta gamma delta'}, ignore_case=True)
+
+    assert matcher.replace("alpha beta gamma delta") == ("alpha €b", 1, 14)
+
+
+def test_word_boundary_and_case_insensitive_example():
+    matcher = DictionaryMatcher({'$A': 'context', '$B': 'compression'},
+                                ignore_case=True, word_boundary=True)
+
+    assert matcher.replace("Context compression, contextual") == ("$A $B, contextual", 2, 14)
+
+
+def test_nested_entries_replace_outermost():
+    matcher = DictionaryMatcher({'T1': 'beta gamma', 'T2': 'alpha beta gamma'})
+
+    assert matcher.replace("alpha beta gamma / beta gamma") == ("T2 / T1", 2, 22)
+
+
+def test_empty_dictionary_is_a_no_op():
+    assert DictionaryMatcher({}).replace("unchanged") == ("unchanged", 0, 0)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_per_entry_loop(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        alphabet = rng.choice(['ab ', 'abc ', 'aB ', 'ab-'])
+        # Codes use characters no entry contains, so they cannot form new matches
+        code_to_text = {
+            f"<{'!' * i}>": ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+            for i in range(rng.randint(1, 5))
+        }
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        ignore_case = rng.random() < 0.5
+        word_boundary = rng.random() < 0.5
+
+        matcher = DictionaryMatcher(code_to_text, ignore_case=ignore_case, word_boundary=word_boundary)
+
+        assert matcher.replace(text) == _per_entry_loop(code_to_text, text, ignore_case, word_boundary)
@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from src.core.token_join import apply_token_join, apply_token_join_validated, validate_token_join
+
+
+def test_joins_only_between_two_tokens():
+    text, stats, validation = apply_token_join_validated("Hello $bb Good $aa $bb ฿cc\n$dd")
+
+    assert text == "Hello $bb Good $aa$bb฿cc\n$dd"
+    assert stats == {'pairs_joined': 2, 'chars_saved': 2, 'original_size': 30, 'new_size': 28}
+    assert validation['original_tokens'] == validation['joined_tokens'] == 5
+    assert validation['status'] == 'PASS'
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_separate_join_and_validate(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        text = ''.join(rng.choice('$฿a1 x\n') for _ in range(rng.randint(0, 40)))
+
+        joined, stats = apply_token_join(text)
+
+        assert apply_token_join_validated(text) == (joined, stats, validate_token_join(text, joined))